@@ -0,0 +1,88 @@
+import asyncio
+import time
+from unittest.mock import MagicMock, AsyncMock
+
+from src.async_gorrion import AsyncGorrion
+from src.config import Config
+from src.gorrion import Gorrion
+from src.clients.spotify import Track, Album, Artist
+from src.clients.musixmatch import Lyric
+from src.clients.twitter import TwitterLocal, AsyncTwitterLocal
+
+
+LATENCY_SECS = 0.05
+UPDATES = 100
+
+
+def build_album() -> Album:
+    return Album(
+        '11', 'Pa morirse de amor', '', 'http://spotify.com/album/11', '2006-01-01', 19,
+        [Artist('12', 'Ely Guerra', '', 'http://spotify.com/artist/12')],
+        [Track('1', 'Peligro', '', 'http://spotify.com/track/1', 1, 1, 1000)],
+    )
+
+
+def with_lyric(song):
+    song.lyric = Lyric('123', '456', '789', ['lyric1', 'lyric2'])
+    return song
+
+
+def sync_gorrion() -> Gorrion:
+    def remote(result):
+        def call(*args):
+            time.sleep(LATENCY_SECS)
+            return result(*args)
+        return call
+
+    spotify = MagicMock()
+    spotify.get_current_track.side_effect = remote(lambda: build_album())
+    musixmatch = MagicMock()
+    musixmatch.search_song.side_effect = remote(lambda song: song)
+    musixmatch.fetch_lyric.side_effect = remote(with_lyric)
+
+    return Gorrion(spotify, TwitterLocal(Config.get_twitter_config()), musixmatch)
+
+
+def async_gorrion() -> AsyncGorrion:
+    def remote(result):
+        async def call(*args):
+            await asyncio.sleep(LATENCY_SECS)
+            return result(*args)
+        return call
+
+    spotify = AsyncMock()
+    spotify.get_current_track.side_effect = remote(lambda: build_album())
+    musixmatch = AsyncMock()
+    musixmatch.search_song.side_effect = remote(lambda song: song)
+    musixmatch.fetch_lyric.side_effect = remote(with_lyric)
+
+    return AsyncGorrion(spotify, AsyncTwitterLocal(Config.get_twitter_config()), musixmatch)
+
+
+async def run_sync_handlers(gorrion: Gorrion) -> None:
+    # what telegram_bot_v2 did before: async handlers calling blocking code
+    async def handler():
+        gorrion.playing_with_lyrics()
+
+    await asyncio.gather(*[handler() for _ in range(UPDATES)])
+
+
+async def run_async_handlers(gorrion: AsyncGorrion) -> None:
+    async def handler():
+        await gorrion.playing_with_lyrics()
+
+    await asyncio.gather(*[handler() for _ in range(UPDATES)])
+
+
+def report(label: str, coroutine) -> None:
+    started = time.perf_counter()
+    asyncio.run(coroutine)
+    elapsed = time.perf_counter() - started
+
+    print(f'{label:<16} updates={UPDATES} elapsed={elapsed:.2f}s '
+          f'throughput={UPDATES / elapsed:.1f} updates/s')
+
+
+if __name__ == '__main__':
+    report('blocking', run_sync_handlers(sync_gorrion()))
+    report('asyncio', run_async_handlers(async_gorrion()))
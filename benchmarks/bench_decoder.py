@@ -0,0 +1,151 @@
+import json
+import random
+import time
+
+import requests
+
+from src.clients.decoder import BACKEND, JsonDecoder
+from src.clients.spotify import Spotify, SpotifyConfig, TokenCache
+
+
+ROUNDS = 200
+MARKETS = ['AD', 'AE', 'AG', 'AL', 'AM', 'AO', 'AR', 'AT', 'AU', 'AZ', 'BA', 'BB', 'BD', 'BE', 'BF', 'BG', 'BH', 'BI',
+           'BJ', 'BN', 'BO', 'BR', 'BS', 'BT', 'BW', 'BY', 'BZ', 'CA', 'CD', 'CG', 'CH', 'CI', 'CL', 'CM', 'CO', 'CR',
+           'CV', 'CW', 'CY', 'CZ', 'DE', 'DJ', 'DK', 'DM', 'DO', 'DZ', 'EC', 'EE', 'EG', 'ES', 'ET', 'FI', 'FJ', 'FM',
+           'FR', 'GA', 'GB', 'GD', 'GE', 'GH', 'GM', 'GN', 'GQ', 'GR', 'GT', 'GW', 'GY', 'HK', 'HN', 'HR', 'HT', 'HU',
+           'ID', 'IE', 'IL', 'IN', 'IQ', 'IS', 'IT', 'JM', 'JO', 'JP', 'KE', 'KG', 'KH', 'KI', 'KM', 'KN', 'KR', 'KW',
+           'KZ', 'LA', 'LB', 'LC', 'LI', 'LK', 'LR', 'LS', 'LT', 'LU', 'LV', 'LY', 'MA', 'MC', 'MD', 'ME', 'MG', 'MH',
+           'MK', 'ML', 'MN', 'MO', 'MR', 'MT', 'MU', 'MV', 'MW', 'MX', 'MY', 'MZ', 'NA', 'NE', 'NG', 'NI', 'NL', 'NO',
+           'NP', 'NR', 'NZ', 'OM', 'PA', 'PE', 'PG', 'PH', 'PK', 'PL', 'PS', 'PT', 'PW', 'PY', 'QA', 'RO', 'RS', 'RW',
+           'SA', 'SB', 'SC', 'SE', 'SG', 'SI', 'SK', 'SL', 'SM', 'SN', 'SR', 'ST', 'SV', 'SZ', 'TD', 'TG', 'TH', 'TJ',
+           'TL', 'TN', 'TO', 'TR', 'TT', 'TV', 'TW', 'TZ', 'UA', 'UG', 'US', 'UY', 'UZ', 'VC', 'VE', 'VN', 'VU', 'WS',
+           'XK', 'ZA', 'ZM', 'ZW']
+
+
+def artist(index: int) -> dict:
+    return {
+        'external_urls': {'spotify': f'https://open.spotify.com/artist/{index:022d}'},
+        'href': f'https://api.spotify.com/v1/artists/{index:022d}',
+        'id': f'{index:022d}',
+        'name': f'Artist {index}',
+        'type': 'artist',
+        'uri': f'spotify:artist:{index:022d}',
+    }
+
+
+def album_payload(tracks: int) -> bytes:
+    # the shape of GET /v1/albums/{id}, every track lists its markets
+    return json.dumps({
+        'album_type': 'album',
+        'artists': [artist(1)],
+        'available_markets': MARKETS,
+        'copyrights': [{'text': '2006 Universal', 'type': 'C'}],
+        'external_ids': {'upc': '00602517000000'},
+        'external_urls': {'spotify': 'https://open.spotify.com/album/11'},
+        'genres': [],
+        'href': 'https://api.spotify.com/v1/albums/11',
+        'id': '11',
+        'images': [{'height': size, 'url': f'https://i.scdn.co/image/{size}', 'width': size} for size in (640, 300, 64)],
+        'label': 'Universal',
+        'name': 'Pa morirse de amor',
+        'popularity': 50,
+        'release_date': '2006-01-01',
+        'release_date_precision': 'day',
+        'total_tracks': tracks,
+        'type': 'album',
+        'uri': 'spotify:album:11',
+        'tracks': {
+            'href': 'https://api.spotify.com/v1/albums/11/tracks?offset=0&limit=50',
+            'items': [{
+                'artists': [artist(1), artist(number)],
+                'available_markets': MARKETS,
+                'disc_number': 1,
+                'duration_ms': random.randint(60000, 600000),
+                'explicit': False,
+                'external_urls': {'spotify': f'https://open.spotify.com/track/{number:022d}'},
+                'href': f'https://api.spotify.com/v1/tracks/{number:022d}',
+                'id': f'{number:022d}',
+                'is_local': False,
+                'name': f'Track {number}',
+                'preview_url': f'https://p.scdn.co/mp3-preview/{number:040d}',
+                'track_number': number,
+                'type': 'track',
+                'uri': f'spotify:track:{number:022d}',
+            } for number in range(1, tracks + 1)],
+            'limit': 50,
+            'next': None,
+            'offset': 0,
+            'previous': None,
+            'total': tracks,
+        },
+    }).encode('utf-8')
+
+
+def search_payload(tracks: int) -> bytes:
+    # the shape of musixmatch track.search
+    return json.dumps({'message': {
+        'header': {'status_code': 200, 'execute_time': 0.01, 'available': tracks},
+        'body': {'track_list': [{'track': {
+            'track_id': number,
+            'track_name': f'Track {number}',
+            'track_name_translation_list': [],
+            'track_rating': 50,
+            'commontrack_id': number * 10,
+            'instrumental': 0,
+            'explicit': 0,
+            'has_lyrics': 1,
+            'has_subtitles': 1,
+            'has_richsync': 0,
+            'num_favourite': 100,
+            'album_id': 11,
+            'album_name': 'Pa morirse de amor',
+            'artist_id': 12,
+            'artist_name': 'Ely Guerra',
+            'track_share_url': f'https://www.musixmatch.com/lyrics/ely-guerra/track-{number}',
+            'track_edit_url': f'https://www.musixmatch.com/lyrics/ely-guerra/track-{number}/edit',
+            'restricted': 0,
+            'updated_time': '2020-01-01T00:00:00Z',
+            'primary_genres': {'music_genre_list': [{'music_genre': {
+                'music_genre_id': 14,
+                'music_genre_parent_id': 34,
+                'music_genre_name': 'Pop',
+                'music_genre_name_extended': 'Pop',
+                'music_genre_vanity': 'Pop',
+            }}]},
+        }} for number in range(tracks)]},
+    }}).encode('utf-8')
+
+
+def response(content: bytes) -> requests.Response:
+    recorded = requests.Response()
+    recorded.status_code = 200
+    recorded._content = content
+    recorded.encoding = 'utf-8'
+    return recorded
+
+
+def timed(decode, payload: bytes) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        decode(response(payload))
+    return (time.perf_counter() - started) / ROUNDS
+
+
+if __name__ == '__main__':
+    random.seed(7)
+    spotify = Spotify(SpotifyConfig('client_id', 'client_secret', 'refresh_token'), TokenCache(), requests.Session())
+    payloads = [
+        ('album x50', album_payload(50), JsonDecoder()),
+        ('album x20', album_payload(20), JsonDecoder()),
+        ('search x10', search_payload(10), JsonDecoder()),
+    ]
+
+    for label, payload, decoder in payloads:
+        expected = response(payload).json()
+        if 'tracks' in expected:
+            assert spotify._to_full_album(decoder.decode(response(payload))) == spotify._to_full_album(expected)
+
+        reference_secs = timed(lambda recorded: recorded.json(), payload)
+        decoder_secs = timed(decoder.decode, payload)
+        print(f'{label} {len(payload) / 1024:.0f}KiB response.json()={reference_secs * 1e6:.0f}us '
+              f'decoder[{BACKEND}]={decoder_secs * 1e6:.0f}us speedup={reference_secs / decoder_secs:.1f}x')
@@ -0,0 +1,73 @@
+import random
+import re
+import time
+from unittest.mock import patch
+
+from src.clients.spotify import Album, Artist, Track
+from src.templates import TweetAlbumConfig
+from src.templates.hashtag import build_hashtag
+from src.templates.twitter import FooterTemplate
+
+
+COMBINATIONS = 10000
+WORDS = ['amor', 'Noche', 'corazón', 'luna', 'FUEGO', 'camino', 'los', 'de', 'The', 'Rós', 'AC/DC', 'señor']
+
+
+def reference_build_hashtag(self, text: str) -> str:
+    # FooterTemplate._build_hashtag before the hashtag module
+    if not text or len(text) == 0:
+        return ''
+
+    words = text.split(' ')
+
+    hashtags = []
+    for word in words:
+        word = re.sub(r'\W+', '', word)
+        word = (word.capitalize() if len(word) > 0 and word[0].islower()
+                else word)
+        hashtags.append(word)
+
+    hashtags = ''.join(hashtags)
+
+    return f'#{hashtags}'
+
+
+def name() -> str:
+    return ' '.join(random.choices(WORDS, k=random.randint(1, 4)))
+
+
+def combinations() -> list:
+    album_names = [name() for _ in range(500)]
+    artist_names = [name() for _ in range(200)]
+
+    return [Album(str(index), random.choice(album_names), '', 'http://spotify.com/album', '2006-01-01', 10,
+                  [Artist(str(index), artist_name, '', '')
+                   for artist_name in random.sample(artist_names, random.randint(1, 3))],
+                  [Track(str(index), 'Peligro', '', 'http://spotify.com/track', 1, 1, 1000)])
+            for index in range(COMBINATIONS)]
+
+
+def render(albums: list) -> tuple:
+    config = TweetAlbumConfig().footer_config
+
+    started = time.perf_counter()
+    footers = [FooterTemplate(album, config).to_footer() for album in albums]
+    elapsed = time.perf_counter() - started
+
+    return footers, elapsed
+
+
+if __name__ == '__main__':
+    random.seed(7)
+    albums = combinations()
+
+    with patch.object(FooterTemplate, '_build_hashtag', reference_build_hashtag):
+        expected, reference_secs = render(albums)
+
+    build_hashtag.cache_clear()
+    actual, memoized_secs = render(albums)
+
+    assert actual == expected
+    print(f'{COMBINATIONS} footers reference={reference_secs * 1e6 / COMBINATIONS:.1f}us/render '
+          f'memoized={memoized_secs * 1e6 / COMBINATIONS:.1f}us/render '
+          f'speedup={reference_secs / memoized_secs:.1f}x cache={build_hashtag.cache_info()}')
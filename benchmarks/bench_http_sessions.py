@@ -0,0 +1,54 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from src.clients.http import new_session
+
+
+REQUESTS = 200
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        StubHandler.connections += 1
+
+    def do_GET(self) -> None:
+        body = b'{"message": {"header": {"status_code": 200}, "body": {}}}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+def run(label: str, get) -> None:
+    StubHandler.connections = 0
+    started = time.perf_counter()
+    for _ in range(REQUESTS):
+        get().json()
+    elapsed = time.perf_counter() - started
+
+    print(f'{label:<16} requests={REQUESTS} connections={StubHandler.connections} '
+          f'elapsed={elapsed * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_port}/track.search'
+
+    run('requests.get', lambda: requests.get(url))
+    session = new_session()
+    run('pooled session', lambda: session.get(url))
+
+    server.shutdown()
@@ -0,0 +1,17 @@
+import statistics
+
+from tests.test_import_time import import_profile
+
+
+ENTRY_POINTS = ('src.cli', 'src.telegram_bot', 'src.telegram_bot_v2', 'src.gorrion')
+HEAVY_MODULES = ('requests', 'tweepy', 'tweet_counter', 'telegram', 'httpx', 'aiohttp')
+RUNS = 7
+
+
+if __name__ == '__main__':
+    for entry_point in ENTRY_POINTS:
+        profiles = [import_profile(entry_point) for _ in range(RUNS)]
+        total_ms = statistics.median(profile[entry_point] for profile in profiles) / 1000
+        heavy = [module for module in HEAVY_MODULES if module in profiles[0]]
+
+        print(f'{entry_point:<22} median={total_ms:7.1f}ms heavy={",".join(heavy)}')
@@ -0,0 +1,58 @@
+import random
+import statistics
+import time
+
+from tweet_counter import count_tweet
+
+from src.templates import TweetPacker, LyricSplitter
+
+
+SONGS = 500
+MAX_TWEET_LENGTH = 280
+WORDS = ['amor', 'noche', 'corazón', 'luna', 'fuego', 'camino', 'peligro', 'criatura', 'sol', 'mar', 'siempre',
+         'nunca', 'quiero', 'tus', 'ojos', 'en', 'la', 'de', 'y', 'que', 'me', 'te', 'olvidar', 'bailar', '🔥']
+
+
+def line() -> str:
+    return ' '.join(random.choices(WORDS, k=random.choice([3, 4, 5, 6, 7, 8, 12, 30])))
+
+
+def song() -> list:
+    # verses, a repeated chorus and the odd long run-on stanza
+    chorus = '\n'.join(line() for _ in range(random.randint(2, 6)))
+    stanzas = []
+    for _ in range(random.randint(4, 10)):
+        stanzas.append('\n'.join(line() for _ in range(random.choice([2, 4, 4, 6, 8, 12]))))
+        if random.random() < 0.5:
+            stanzas.append(chorus)
+
+    return stanzas
+
+
+def run(objective: str, corpus: list) -> tuple:
+    splitter = LyricSplitter(TweetPacker(MAX_TWEET_LENGTH), objective=objective)
+
+    started = time.perf_counter()
+    threads = [list(splitter.split(lyric)) for lyric in corpus]
+    elapsed = time.perf_counter() - started
+
+    weights = [count_tweet(tweet) for thread in threads for tweet in thread]
+    assert max(weights) <= MAX_TWEET_LENGTH
+
+    return threads, weights, elapsed
+
+
+if __name__ == '__main__':
+    random.seed(7)
+    corpus = [song() for _ in range(SONGS)]
+
+    reference = None
+    for objective in LyricSplitter.OBJECTIVES:
+        threads, weights, elapsed = run(objective, corpus)
+        tweets = sum(len(thread) for thread in threads)
+        reference = reference or tweets
+
+        print(f'{objective:<8} tweets/song={tweets / SONGS:.2f} ({(tweets / reference - 1) * 100:+.0f}%) '
+              f'fill={statistics.mean(weights) / MAX_TWEET_LENGTH * 100:.0f}% '
+              f'min={min(weights)} stdev={statistics.pstdev(weights):.0f} '
+              f'time={elapsed * 1000 / SONGS:.2f}ms/song')
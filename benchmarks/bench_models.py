@@ -0,0 +1,81 @@
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+from src.clients.spotify import Spotify, SpotifyConfig, TokenCache
+from src.clients.retry import RetryPolicy
+
+
+TRACKS = 100000
+ARTISTS = 2000
+
+
+@dataclass
+class ReferenceEntity:
+    # the models before they were slotted
+    id_: str
+    name: str
+    href: str
+    public_url: str
+
+
+@dataclass
+class ReferenceArtist(ReferenceEntity):
+    pass
+
+
+@dataclass
+class ReferenceTrack(ReferenceEntity):
+    disc_number: int
+    track_number: int
+    duration: int
+
+
+def responses() -> list:
+    # every json response brings its own copy of the strings
+    random.seed(7)
+
+    return [({'id': f'{index % (TRACKS // 2):022d}', 'name': f'track {index}', 'href': '',
+              'external_urls': {'spotify': ''}, 'disc_number': 1, 'track_number': index % 20 + 1,
+              'duration_ms': random.randint(60000, 600000)},
+             {'id': f'a{index % ARTISTS:021d}', 'name': f'artist {random.randrange(ARTISTS)}', 'href': '',
+              'external_urls': {'spotify': ''}})
+            for index in range(TRACKS)]
+
+
+def reference_map(items: list) -> list:
+    return [(ReferenceTrack(track['id'], track['name'], track['href'], track['external_urls']['spotify'],
+                            track['disc_number'], track['track_number'], track['duration_ms']),
+             ReferenceArtist(artist['id'], artist['name'], artist['href'], artist['external_urls']['spotify']))
+            for track, artist in items]
+
+
+def slotted_map(spotify: Spotify, items: list) -> list:
+    return [(spotify._to_tracks([track])[0], spotify._to_artists([artist])[0]) for track, artist in items]
+
+
+def measure(mapper) -> tuple:
+    items = responses()
+
+    tracemalloc.start()
+    entities = mapper(items)
+    del items
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return entities, current
+
+
+if __name__ == '__main__':
+    spotify = Spotify(SpotifyConfig('client_id', 'client_secret', 'refresh_token'), TokenCache(),
+                      retry_policy=RetryPolicy())
+
+    reference, reference_bytes = measure(reference_map)
+    slotted, slotted_bytes = measure(lambda items: slotted_map(spotify, items))
+
+    assert [(track.id_, artist.name) for track, artist in reference] == [(track.id_, artist.name) for track, artist in slotted]
+    print(f'{TRACKS} tracks+artists reference={reference_bytes / 2**20:.1f}MiB slotted={slotted_bytes / 2**20:.1f}MiB '
+          f'saved={(1 - slotted_bytes / reference_bytes) * 100:.0f}% '
+          f'track={sys.getsizeof(reference[0][0]) + sys.getsizeof(reference[0][0].__dict__)}B->'
+          f'{sys.getsizeof(slotted[0][0])}B')
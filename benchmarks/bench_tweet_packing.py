@@ -0,0 +1,89 @@
+import random
+import time
+from unittest.mock import MagicMock
+
+from tweet_counter import count_tweet
+
+from src.config import Config
+from src.gorrion import Gorrion
+from src.clients.spotify import Track
+from src.clients.twitter import TwitterLocal
+
+
+ROUNDS = 5
+MAX_TWEET_LENGTH = 280
+WORDS = ['amor', 'noche', 'corazón', 'luna', 'fuego', 'camino', 'Peligro', 'criatura', 'sol', 'mar', '🔥']
+
+
+def synthetic_album(size: int) -> list:
+    return [Track(str(number), ' '.join(random.choices(WORDS, k=random.randint(1, 5))), '',
+                  f'http://spotify.com/track/{number}', number // 100 + 1, number % 100 + 1,
+                  random.randint(60000, 600000))
+            for number in range(size)]
+
+
+def synthetic_lyrics(size: int) -> list:
+    return ['\n'.join(' '.join(random.choices(WORDS, k=random.randint(3, 8)))
+                      for _ in range(random.randint(2, 8)))
+            for _ in range(size)]
+
+
+def reference_tracks_to_tweets(gorrion: Gorrion, tracks: list) -> list:
+    # _tracks_to_tweets before the incremental packer
+    track_tweets = []
+
+    tweet = ''
+    for track in tracks:
+        tweet_content = gorrion._track_to_tweet(track)
+        if count_tweet(tweet + tweet_content + '\n') <= MAX_TWEET_LENGTH:
+            tweet += tweet_content + '\n'
+        else:
+            track_tweets.append(tweet)
+            tweet = tweet_content + '\n'
+
+    if tweet:
+        track_tweets.append(tweet)
+
+    track_tweets[-1] = track_tweets[-1].strip()
+
+    return track_tweets
+
+
+def reference_lyrics_to_tweets(gorrion: Gorrion, lyrics: list) -> list:
+    lyric_tweets = []
+    for paragraph in lyrics:
+        if count_tweet(paragraph) <= MAX_TWEET_LENGTH:
+            lyric_tweets.append(paragraph)
+        else:
+            lines = paragraph.split('\n')
+            lyric_tweets += ['\n'.join(lines[line:line + 4]) for line in range(0, len(lines), 4)]
+
+    return lyric_tweets
+
+
+def measure(function) -> tuple:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        result = function()
+    return result, (time.perf_counter() - started) / ROUNDS
+
+
+if __name__ == '__main__':
+    random.seed(7)
+    gorrion = Gorrion(MagicMock(), TwitterLocal(Config.get_twitter_config()), MagicMock(), pipeline=False)
+
+    tracks = synthetic_album(500)
+    expected, reference_secs = measure(lambda: reference_tracks_to_tweets(gorrion, tracks))
+    actual, packer_secs = measure(lambda: list(gorrion._tracks_to_tweets(tracks)))
+
+    assert actual == expected
+    print(f'500-track album   tweets={len(actual)} reference={reference_secs * 1000:.1f}ms '
+          f'packer={packer_secs * 1000:.1f}ms speedup={reference_secs / packer_secs:.1f}x identical=True')
+
+    lyrics = synthetic_lyrics(200)
+    expected, reference_secs = measure(lambda: reference_lyrics_to_tweets(gorrion, lyrics))
+    actual, packer_secs = measure(lambda: gorrion.lyrics_to_tweets(lyrics))
+
+    assert actual == expected
+    print(f'200-paragraph lyric tweets={len(actual)} reference={reference_secs * 1000:.1f}ms '
+          f'packer={packer_secs * 1000:.1f}ms speedup={reference_secs / packer_secs:.1f}x identical=True')
@@ -9,5 +9,9 @@ setup(
     author_email='',
     packages=['gorrion'],
     install_requires=[],
+    extras_require={
+        # JsonDecoder picks it up when installed, stdlib json otherwise
+        'fast-json': ['orjson'],
+    },
     scripts=[],
 )
@@ -0,0 +1,155 @@
+import asyncio
+
+from src.clients.spotify import (
+    AsyncSpotify,
+    Album,
+    Playback,
+)
+from src.clients.twitter import (
+    AsyncTwitter,
+    PublishedTweet,
+)
+from src.clients.musixmatch import (
+    AsyncMusixmatch,
+    Song,
+    MusixmatchApiError,
+    SongNotFound,
+    SongHasNoLyrics,
+    LyricCache,
+)
+from src.gorrion import BaseGorrion
+from src.templates import (
+    TweetSongConfig,
+    TweetAlbumConfig,
+    LyricSplitter,
+)
+from src.tracing import tracer
+
+
+class AsyncGorrion(BaseGorrion):
+    def __init__(self,
+                 spotify: AsyncSpotify,
+                 twitter: AsyncTwitter,
+                 musixmatch: AsyncMusixmatch,
+                 pipeline: bool = True,
+                 lyric_cache: LyricCache = None,
+                 lyric_objective: str = LyricSplitter.STANZA) -> None:
+        super().__init__(spotify, twitter, musixmatch, lyric_cache, lyric_objective)
+        self._pipeline = pipeline
+
+    @tracer.traced('gorrion.playing')
+    async def playing(self) -> PublishedTweet:
+        current_album = await self._spotify.get_current_track()
+
+        return await self.publish_track(current_album)
+
+    @tracer.traced('gorrion.playing_with_lyrics')
+    async def playing_with_lyrics(self) -> list:
+        current_album = await self._spotify.get_current_track()
+
+        return await self.publish_track_with_lyrics(current_album)
+
+    async def playback(self) -> Playback | None:
+        return await self._spotify.get_playback()
+
+    async def upcoming(self, depth: int) -> list:
+        return (await self._spotify.get_queue())[:depth]
+
+    async def get_album(self, album: Album) -> Album:
+        return await self._spotify.get_album(album.id_)
+
+    @tracer.traced('gorrion.publish_track_with_lyrics')
+    async def publish_track_with_lyrics(self, album: Album) -> list:
+        if not self._pipeline:
+            current_album_tweet = await self.publish_track(album)
+            song = await self.get_lyric(album)
+            lyrics_tweets = await self.publish_lyrics(current_album_tweet, song)
+
+            return [current_album_tweet, *lyrics_tweets]
+
+        song_task = asyncio.create_task(self.get_lyric(album))
+
+        try:
+            current_album_tweet = await self.publish_track(album)
+        except BaseException:
+            song_task.cancel()
+            raise
+
+        song = await song_task
+        lyrics_tweets = await self.publish_lyrics(current_album_tweet, song)
+
+        return [current_album_tweet, *lyrics_tweets]
+
+    @tracer.traced('gorrion.playing_album')
+    async def playing_album(self) -> PublishedTweet:
+        current_album = await self._spotify.get_current_track()
+
+        return await self.publish_album(current_album)
+
+    @tracer.traced('gorrion.playing_album_with_tracks')
+    async def playing_album_with_tracks(self) -> list:
+        album = await self._spotify.get_current_album()
+        album_tweet = await self.publish_album(album)
+        tracks = await self.publish_tracks(album_tweet)
+
+        return [album_tweet, *tracks]
+
+    @tracer.traced('gorrion.get_lyric')
+    async def get_lyric(self, album: Album) -> Song:
+        song = self._new_song(album)
+
+        if self._load_cached_lyric(album, song):
+            return song
+
+        try:
+            song = await self._musixmatch.search_song(song)
+            song = await self._musixmatch.fetch_lyric(song)
+        except (SongNotFound, SongHasNoLyrics):
+            self._cache_lyric(album, song)
+        except MusixmatchApiError:
+            pass
+        else:
+            self._cache_lyric(album, song)
+
+        return song
+
+    @tracer.traced('gorrion.publish_track')
+    async def publish_track(self, album: Album) -> PublishedTweet:
+        tweet_track = self.build_status(album, TweetSongConfig())
+        tweeted_track = await self._twitter.post(tweet_track)
+        tweeted_track.entity = album
+
+        return tweeted_track
+
+    @tracer.traced('gorrion.publish_lyrics')
+    async def publish_lyrics(self, tweeted_track: PublishedTweet, song: Song) -> list:
+        if not song.lyric:
+            return []
+
+        lyrics = self.lyrics_to_tweets(song.lyric.content)
+
+        return await self._twitter.reply_thread(lyrics, tweeted_track.id_)
+
+    @tracer.traced('gorrion.publish_album')
+    async def publish_album(self, album: Album) -> PublishedTweet:
+        tweet_album = self.build_status(album, TweetAlbumConfig())
+
+        tweeted_album = await self._twitter.post(tweet_album)
+        tweeted_album.entity = album
+
+        return tweeted_album
+
+    @tracer.traced('gorrion.publish_tracks')
+    async def publish_tracks(self, tweeted_album: PublishedTweet) -> list:
+        album = tweeted_album.entity
+
+        tracks = self._tracks_to_tweets(album.tracks)
+
+        return await self._twitter.reply_thread(tracks, tweeted_album.id_)
+
+    @tracer.traced('gorrion.resume_replies')
+    async def resume_replies(self) -> list:
+        return await self._twitter.resume_replies()
+
+    async def wait_replies(self, timeout: float = None) -> bool:
+        return await self._twitter.wait_replies(timeout)
@@ -1,17 +1,97 @@
 import argparse
+import json
+import shlex
+import time
 from argparse import Namespace
+from dataclasses import dataclass
+
+from typing import TYPE_CHECKING
 
 from src.config import Config
-from src.clients.spotify import Spotify, SpotifyApiError
-from src.clients.twitter import Twitter, TwitterLocal
-from src.clients.musixmatch import Musixmatch
+from src.clients.http import shared_session
+from src.clients.spotify import Spotify, AlbumCache, SpotifyApiError
 from src.gorrion import Gorrion
+from src import tracing
+
+if TYPE_CHECKING:
+    from src.watcher import Watcher
+
+
+def command_errors() -> tuple:
+    # the twitter package only loads with the commands that post, its
+    # errors are looked up once a command fails
+    from src.clients.twitter import RateLimitExceeded
+
+    return SpotifyApiError, RateLimitExceeded
+
+
+@dataclass
+class BatchJob:
+    command: str
+    local: bool = False
+    delay: bool = False
+
+
+@dataclass
+class BatchResult:
+    job: BatchJob
+    ok: bool
+    elapsed_secs: float
 
 
 class CLI:
-    COMMANDS = ('playing', 'lyric', 'album', 'tracks')
+    COMMANDS = ('playing', 'lyric', 'album', 'tracks', 'resume', 'batch', 'watch')
+    BATCH_COMMANDS = ('playing', 'lyric', 'album', 'tracks', 'resume')
+
+    def __init__(self) -> None:
+        self._gorrions = {}
+
+    def run(self, command: str, local_mode: bool, delay_mode: bool) -> bool:
+        if command == 'playing':
+            return self.playing(local_mode)
+        if command == 'lyric':
+            return self.playing_with_lyrics(local_mode, delay_mode)
+        if command == 'album':
+            return self.playing_album(local_mode)
+        if command == 'tracks':
+            return self.playing_album_with_tracks(local_mode)
+        if command == 'resume':
+            return self.resume_replies(local_mode, delay_mode)
+
+        print(f'Invalid command. Use: {CLI.BATCH_COMMANDS}')
+        return False
+
+    def batch(self, path: str) -> list:
+        lines = self._read_jobs(path)
+        results = []
+
+        # every job runs in this process, so clients, sessions, the spotify
+        # token and the caches are shared between them
+        for index, (number, line) in enumerate(lines, 1):
+            started_at = time.perf_counter()
+            try:
+                job = self._parse_job(line)
+            except ValueError as error:
+                # a malformed line only fails its own job
+                print(f'Invalid job on line {number}: {error}')
+                job, ok = BatchJob(line), False
+            else:
+                try:
+                    ok = self.run(job.command, job.local, job.delay)
+                except Exception as error:
+                    print(f'Job failed: {error}')
+                    ok = False
+            result = BatchResult(job, ok, time.perf_counter() - started_at)
+            results.append(result)
+
+            print(self._format_batch_result(index, len(lines), result))
 
-    def playing(self, local_mode: bool) -> None:
+        print(self._get_batch_header())
+        print(self._format_batch_summary(results))
+
+        return results
+
+    def playing(self, local_mode: bool) -> bool:
         try:
             gorrion = self._build_gorrion(local_mode, False)
 
@@ -19,12 +99,15 @@ class CLI:
 
             print(self._get_song_header())
             print(song.tweet)
-        except SpotifyApiError as error:
+        except command_errors() as error:
             print(error)
+            return False
 
-    def playing_with_lyrics(self, local_mode: bool, delay_mode: bool) -> None:
+        return True
+
+    def playing_with_lyrics(self, local_mode: bool, delay_mode: bool) -> bool:
         try:
-            gorrion = self._build_gorrion(local_mode, delay_mode)
+            gorrion = self._build_gorrion(local_mode, delay_mode, lyrics=True)
 
             tweets = gorrion.playing_with_lyrics()
             song, *lyrics = tweets
@@ -36,10 +119,13 @@ class CLI:
                 lyrics_tweets = '\n\n'.join([lyric.tweet for lyric in lyrics])
                 print(self._get_lyric_header())
                 print(lyrics_tweets)
-        except SpotifyApiError as error:
+        except command_errors() as error:
             print(error)
+            return False
 
-    def playing_album(self, local_mode: bool) -> None:
+        return True
+
+    def playing_album(self, local_mode: bool) -> bool:
         try:
             gorrion = self._build_gorrion(local_mode, False)
 
@@ -47,10 +133,13 @@ class CLI:
 
             print(self._get_album_header())
             print(song.tweet)
-        except SpotifyApiError as error:
+        except command_errors() as error:
             print(error)
+            return False
+
+        return True
 
-    def playing_album_with_tracks(self, local_mode: bool) -> None:
+    def playing_album_with_tracks(self, local_mode: bool) -> bool:
         try:
             gorrion = self._build_gorrion(local_mode, False)
 
@@ -64,18 +153,111 @@ class CLI:
                 tracks_tweets = '\n'.join([track.tweet for track in tracks])
                 print(self._get_track_header())
                 print(tracks_tweets)
-        except SpotifyApiError as error:
+        except command_errors() as error:
             print(error)
+            return False
+
+        return True
+
+    def resume_replies(self, local_mode: bool, delay_mode: bool) -> bool:
+        try:
+            gorrion = self._build_gorrion(local_mode, delay_mode)
+
+            replies = gorrion.resume_replies()
+
+            print(self._get_resume_header())
+            print('\n\n'.join([reply.tweet for reply in replies]))
+        except command_errors() as error:
+            print(error)
+            return False
+
+        return True
+
+    def watch(self, local_mode: bool, delay_mode: bool) -> 'Watcher':
+        from src.watcher import Watcher
+        from src.prefetch import Prefetcher
 
-    def _build_gorrion(self, local_mode: bool, delay_mode: bool) -> Gorrion:
-        spotify = Spotify(Config.get_spotify_config())
-        musixmatch = Musixmatch(Config.get_musixmatch_config())
+        config = Config.get_watcher_config()
+        gorrion = self._build_gorrion(local_mode, delay_mode, lyrics=config.lyrics)
+        # lyrics can only be prefetched when the watcher posts them
+        prefetcher = Prefetcher(gorrion, Config.get_prefetch_config(lyrics=config.lyrics))
+        watcher = Watcher(gorrion, config, prefetcher)
+
+        print(self._get_watch_header())
+        try:
+            watcher.run()
+        except KeyboardInterrupt:
+            watcher.stop()
+
+        print(f'Watcher stopped after {watcher.polls} polls and {watcher.posts} posts')
+        return watcher
+
+    def _build_gorrion(self, local_mode: bool, delay_mode: bool, lyrics: bool = False) -> Gorrion:
+        key = (local_mode, delay_mode, lyrics)
+        if key not in self._gorrions:
+            self._gorrions[key] = self._new_gorrion(local_mode, delay_mode, lyrics)
+
+        return self._gorrions[key]
+
+    def _new_gorrion(self, local_mode: bool, delay_mode: bool, lyrics: bool) -> Gorrion:
+        # the clients load with the first command that needs them, musixmatch
+        # and the lyric cache only with the lyric command
+        from src.clients.twitter import Twitter, TwitterLocal
+
+        session = shared_session(Config.get_http_config())
+        spotify = Spotify(
+            Config.get_spotify_config(),
+            session=session,
+            album_cache=AlbumCache.shared(Config.SPOTIFY_ALBUM_CACHE_PATH),
+        )
+
+        musixmatch = None
+        lyric_cache = None
+        if lyrics:
+            from src.clients.musixmatch import Musixmatch, LyricCache
+
+            musixmatch = Musixmatch(Config.get_musixmatch_config(), session)
+            lyric_cache = LyricCache.shared(Config.LYRIC_CACHE_PATH)
 
         twitter_config = Config.get_twitter_config()
         twitter_config.retweet_delay = delay_mode
+        if local_mode:
+            twitter_config.outbox_path = None
         twitter = TwitterLocal(twitter_config) if local_mode else Twitter(twitter_config)
 
-        return Gorrion(spotify, twitter, musixmatch)
+        return Gorrion(spotify, twitter, musixmatch, lyric_cache=lyric_cache, lyric_objective=Config.LYRIC_OBJECTIVE)
+
+    def _read_jobs(self, path: str) -> list:
+        with open(path, encoding='utf-8') as jobs_file:
+            lines = [line.strip() for line in jobs_file]
+
+        return [(number, line) for number, line in enumerate(lines, 1)
+                if line and not line.startswith('#')]
+
+    def _parse_job(self, line: str) -> BatchJob:
+        # a job is either a jsonl object or a command line such as 'lyric -l'
+        if line.startswith('{'):
+            job = json.loads(line)
+            if not isinstance(job, dict) or 'command' not in job:
+                raise ValueError('missing command')
+            return BatchJob(job['command'], job.get('local', False), job.get('delay', False))
+
+        command, *flags = shlex.split(line)
+        return BatchJob(
+            command,
+            local='-l' in flags or '--local' in flags,
+            delay='-d' in flags or '--delay' in flags,
+        )
+
+    def _format_batch_result(self, index: int, total: int, result: BatchResult) -> str:
+        status = 'ok' if result.ok else 'failed'
+        return f'[job {index}/{total}] {result.job.command}: {status} in {result.elapsed_secs * 1000:.1f}ms'
+
+    def _format_batch_summary(self, results: list) -> str:
+        elapsed_secs = sum(result.elapsed_secs for result in results)
+        failed = len([result for result in results if not result.ok])
+
+        return f'{len(results)} jobs in {elapsed_secs * 1000:.1f}ms, {failed} failed'
 
     def _get_song_header(self) -> str:
         return '[---------------------- Song -----------------------]'
@@ -89,6 +271,15 @@ class CLI:
     def _get_track_header(self) -> str:
         return '[---------------------- Tracks ---------------------]'
 
+    def _get_resume_header(self) -> str:
+        return '[---------------------- Resume ---------------------]'
+
+    def _get_batch_header(self) -> str:
+        return '[---------------------- Batch ----------------------]'
+
+    def _get_watch_header(self) -> str:
+        return '[---------------------- Watch ----------------------]'
+
     def _parse_args(self) -> Namespace:
         parser = argparse.ArgumentParser(description='Gorrion app')
 
@@ -111,6 +302,13 @@ class CLI:
             default=False,
             help='Enables lyric delay mode.'
         )
+        parser.add_argument(
+            '-j',
+            '--jobs',
+            type=str,
+            default=None,
+            help='File with the jobs run by the batch command, one command line or JSON object per line.'
+        )
 
         return parser.parse_args()
 
@@ -126,15 +324,19 @@ if __name__ == "__main__":
     if command not in CLI.COMMANDS:
         print(f'Invalid command. Use: {CLI.COMMANDS}')
         quit()
-    if command == 'playing':
-        cli.playing(local_mode)
-        quit()
-    if command == 'lyric':
-        cli.playing_with_lyrics(local_mode, delay_mode)
-        quit()
-    if command == 'album':
-        cli.playing_album(local_mode)
+
+    # only the watcher runs long enough to be scraped
+    tracing.configure(log=Config.TRACING_LOG, metrics_port=Config.METRICS_PORT if command == 'watch' else None)
+
+    if command == 'batch':
+        if not args.jobs:
+            print('The batch command needs a jobs file: --jobs PATH')
+            quit()
+        cli.batch(args.jobs)
         quit()
-    if command == 'tracks':
-        cli.playing_album_with_tracks(local_mode)
+    if command == 'watch':
+        cli.watch(local_mode, delay_mode)
         quit()
+
+    cli.run(command, local_mode, delay_mode)
+    quit()
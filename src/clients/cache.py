@@ -0,0 +1,87 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+
+
+class LruCache:
+    def __init__(self, max_entries: int = 512) -> None:
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> object | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: object, ttl_secs: float) -> None:
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl_secs)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SqliteStore:
+    def __init__(self, path: str, table: str) -> None:
+        # sqlite is only loaded when a cache is persisted to a path
+        import sqlite3
+
+        self._table = table
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            f'CREATE TABLE IF NOT EXISTS {table} '
+            '(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+        self._connection.commit()
+
+    def get(self, key: str) -> tuple | None:
+        with self._lock:
+            row = self._connection.execute(
+                f'SELECT value, expires_at FROM {self._table} WHERE key = ?',
+                (key,)
+            ).fetchone()
+
+        if row is None or row[1] <= time.time():
+            return None
+
+        return json.loads(row[0]), row[1]
+
+    def put(self, key: str, value: object, ttl_secs: float) -> None:
+        with self._lock:
+            self._connection.execute(
+                f'INSERT OR REPLACE INTO {self._table} (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, json.dumps(value), time.time() + ttl_secs)
+            )
+            self._connection.commit()
+
+    def purge_expired(self) -> None:
+        with self._lock:
+            self._connection.execute(
+                f'DELETE FROM {self._table} WHERE expires_at <= ?',
+                (time.time(),)
+            )
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
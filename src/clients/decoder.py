@@ -0,0 +1,30 @@
+import json
+from typing import Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+BACKEND = 'orjson' if orjson is not None else 'json'
+
+
+def default_loads() -> Callable[[bytes], object]:
+    return orjson.loads if orjson is not None else json.loads
+
+
+class JsonDecoder:
+    def __init__(self, loads: Callable[[bytes], object] = None) -> None:
+        self._loads = loads if loads is not None else default_loads()
+
+    def decode(self, response) -> object:
+        # the raw bytes go straight to the parser, without the text decoding
+        # and charset detection of response.json()
+        return self.loads(response.content)
+
+    def loads(self, content: bytes | str) -> object:
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+
+        return self._loads(content)
@@ -0,0 +1,70 @@
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if TYPE_CHECKING:
+    import httpx
+
+
+@dataclass(frozen=True)
+class HttpConfig:
+    pool_connections: int = 4
+    pool_maxsize: int = 8
+    pool_block: bool = False
+
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def shared_session(config: HttpConfig = None) -> requests.Session:
+    config = config if config is not None else HttpConfig()
+
+    with _sessions_lock:
+        if config not in _sessions:
+            _sessions[config] = new_session(config)
+        return _sessions[config]
+
+
+def new_session(config: HttpConfig = None) -> requests.Session:
+    config = config if config is not None else HttpConfig()
+
+    # pool_connections is the number of hosts kept alive and pool_maxsize the
+    # number of connections kept per host
+    adapter = HTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=config.pool_maxsize,
+        pool_block=config.pool_block,
+    )
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    return session
+
+
+def new_async_client(config: HttpConfig = None) -> 'httpx.AsyncClient':
+    # httpx is only loaded by the async entry points
+    import httpx
+
+    config = config if config is not None else HttpConfig()
+
+    # httpx pools are bound to the event loop that first uses them, so async
+    # clients are owned by whoever runs the loop instead of shared globally
+    limits = httpx.Limits(
+        max_connections=config.pool_connections * config.pool_maxsize,
+        max_keepalive_connections=config.pool_maxsize,
+    )
+
+    return httpx.AsyncClient(limits=limits)
+
+
+def close_sessions() -> None:
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
@@ -1,9 +1,12 @@
 # flake8: noqa
+import importlib
+
 from src.clients.musixmatch.client import Musixmatch
 from src.clients.musixmatch.config import MusixmatchConfig
 from src.clients.musixmatch.errors import (
     MusixmatchApiError,
     ServiceError,
+    ServiceUnavailable,
     SongNotFound,
     SongHasNoLyrics,
     LyricNotFound,
@@ -14,3 +17,17 @@ from src.clients.musixmatch.models import (
     Track,
     Song,
 )
+from src.clients.musixmatch.cache import LyricCache, CachedLyric
+
+
+_LAZY_EXPORTS = {
+    'AsyncMusixmatch': 'src.clients.musixmatch.async_client',
+}
+
+
+def __getattr__(name: str) -> object:
+    # the async clients bring their own http stack, it loads on first use
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,94 @@
+import asyncio
+from typing import Callable, Iterator
+
+import httpx
+
+from src.clients.decoder import JsonDecoder
+from src.clients.retry import RetryPolicy, CircuitOpenError
+from src.clients.musixmatch.base import BaseMusixmatch
+from src.clients.musixmatch.config import MusixmatchConfig
+from src.clients.musixmatch.errors import ServiceUnavailable
+from src.clients.musixmatch.models import Song, Lyric
+from src.tracing import tracer, annotate_response
+
+
+class AsyncMusixmatch(BaseMusixmatch):
+    def __init__(self,
+                 config: MusixmatchConfig,
+                 client: httpx.AsyncClient,
+                 retry_policy: RetryPolicy = None,
+                 decoder: JsonDecoder = None,
+                 hedge_delay_secs: float = BaseMusixmatch.HEDGE_DELAY_SECS) -> None:
+        super().__init__(config, retry_policy, decoder, hedge_delay_secs)
+        self._client = client
+
+    async def search_song(self, song: Song) -> Song:
+        body = await self._send(
+            self._client.get,
+            f'{BaseMusixmatch.API_URL}/track.search',
+            span='musixmatch.search',
+            params=self._search_params(song),
+        )
+
+        return self._to_song(song, body)
+
+    async def fetch_lyric(self, song: Song) -> Song:
+        candidates = iter(self._lyric_candidates(song))
+        probes = []
+        errors = []
+        try:
+            while True:
+                if not probes and not self._start_probe(candidates, probes):
+                    break
+
+                done, _ = await asyncio.wait(probes[:1], timeout=self._hedge_delay_secs)
+                if not done:
+                    if not self._start_probe(candidates, probes):
+                        await asyncio.wait(probes[:1])
+                    continue
+
+                try:
+                    song.lyric = probes.pop(0).result()
+                    return song
+                except Exception as error:
+                    print(f'Trying next index: {error}')
+                    errors.append(error)
+        finally:
+            for probe in probes:
+                # failures of probes that lost are read so they are not reported
+                if not probe.cancel() and not probe.cancelled():
+                    probe.exception()
+
+        self._raise_lookup_error(errors)
+
+        return song
+
+    def _start_probe(self, candidates: Iterator, probes: list) -> bool:
+        track = next(candidates, None)
+        if track is None:
+            return False
+
+        probes.append(asyncio.ensure_future(self._fetch_lyric(track.id_, track.common_id)))
+        return True
+
+    async def _fetch_lyric(self, track_id: str, common_track_id: str) -> Lyric:
+        body = await self._send(
+            self._client.get,
+            f'{BaseMusixmatch.API_URL}/track.lyrics.get',
+            span='musixmatch.lyric',
+            params=self._lyric_params(track_id, common_track_id),
+        )
+
+        return self._to_lyric(track_id, common_track_id, body)
+
+    async def _send(self, request: Callable, url: str, span: str, **kwargs) -> dict:
+        with tracer.span(span):
+            bodies = []
+            try:
+                response = await self._retry_policy.call_async(lambda timeout: request(url, timeout=timeout, **kwargs),
+                                                               self._body_check(bodies))
+            except CircuitOpenError as error:
+                raise ServiceUnavailable(str(error)) from error
+
+            annotate_response(response)
+            return self._checked_body(response, bodies[-1])
@@ -0,0 +1,163 @@
+import sys
+from typing import Callable
+
+from src.clients.decoder import JsonDecoder
+from src.clients.retry import RETRY_STATUS_CODES, RetryPolicy, CircuitBreaker
+from src.clients.musixmatch.config import MusixmatchConfig
+from src.clients.musixmatch.lyric import clean_paragraphs
+from src.clients.musixmatch.models import Song, Track, Lyric
+from src.clients.musixmatch.errors import (
+    SongNotFound,
+    SongHasNoLyrics,
+    MusixmatchApiError,
+    ServiceError,
+    LyricNotFound,
+    LyricNotProvidedYet,
+)
+
+
+class BaseMusixmatch:
+    API_URL = 'https://api.musixmatch.com/ws/1.1'
+    LYRIC_CANDIDATES = 3
+    HEDGE_DELAY_SECS = 0.5
+
+    def __init__(self,
+                 config: MusixmatchConfig,
+                 retry_policy: RetryPolicy = None,
+                 decoder: JsonDecoder = None,
+                 hedge_delay_secs: float = HEDGE_DELAY_SECS) -> None:
+        self._api_key = config.api_key
+        self._hedge_delay_secs = hedge_delay_secs
+        self._retry_policy = (retry_policy if retry_policy is not None
+                              else RetryPolicy(breaker=CircuitBreaker.shared('musixmatch')))
+        self._decoder = decoder if decoder is not None else JsonDecoder()
+
+    def _lyric_candidates(self, song: Song) -> list:
+        tracks = [track for track in song.tracks or [] if not track.instrumental]
+
+        return tracks[:BaseMusixmatch.LYRIC_CANDIDATES]
+
+    def _raise_lookup_error(self, errors: list) -> None:
+        # only candidates without a lyric mean the song has none, any other
+        # failure must not end up cached as a song without lyrics
+        for error in errors:
+            if isinstance(error, (LyricNotFound, LyricNotProvidedYet)):
+                continue
+            if isinstance(error, MusixmatchApiError):
+                raise error
+            raise ServiceError(str(error)) from error
+
+    def _body_check(self, bodies: list) -> Callable[[object], bool]:
+        # every body is decoded once, the retry check and the mappers share it
+        def is_retryable(response: object) -> bool:
+            bodies.append(self._decode(response))
+            return self._is_retryable(response, bodies[-1])
+
+        return is_retryable
+
+    def _decode(self, response: object) -> dict | None:
+        try:
+            return self._decoder.decode(response)
+        except ValueError:
+            return None
+
+    def _checked_body(self, response: object, body: dict | None) -> dict:
+        if body is None:
+            raise ServiceError(response.status_code)
+
+        return body
+
+    def _is_retryable(self, response: object, body: dict | None) -> bool:
+        # musixmatch reports most errors with a 200 and the real status code
+        # inside the body
+        if response.status_code in RETRY_STATUS_CODES:
+            return True
+
+        try:
+            return body['message']['header']['status_code'] in RETRY_STATUS_CODES
+        except (KeyError, TypeError):
+            return False
+
+    def _search_params(self, song: Song) -> dict:
+        return {
+            'q_track': song.name,
+            'q_artist': song.artist,
+            's_track_rating': 'desc',
+            'apikey': self._api_key,
+        }
+
+    def _lyric_params(self, track_id: str, common_track_id: str) -> dict:
+        return {
+            'track_id': track_id,
+            'commontrack_id': common_track_id,
+            'apikey': self._api_key,
+        }
+
+    def _to_song(self, song: Song, json_response: dict) -> Song:
+        status_code = json_response['message']['header']['status_code']
+
+        if status_code != 200:
+            if status_code == 404:
+                raise SongNotFound(song)
+            raise ServiceError(status_code)
+
+        body = json_response['message']['body']
+
+        if not body['track_list']:
+            raise SongHasNoLyrics(song)
+
+        tracks = [Track(
+            id_=track['track']['track_id'],
+            common_id=track['track']['commontrack_id'],
+            name=track['track']['track_name'],
+            instrumental=track['track']['instrumental'],
+            explicit=track['track']['explicit'],
+            album=track['track']['album_name'],
+            artist=sys.intern(track['track']['artist_name']),
+        ) for track in body['track_list']]
+
+        song.tracks = tracks
+        song.tracks_length = len(tracks)
+
+        song.tracks = self._sort_tracks(song)
+
+        return song
+
+    def _to_lyric(self, track_id: str, common_track_id: str, json_response: dict) -> Lyric:
+        status_code = json_response['message']['header']['status_code']
+
+        if status_code != 200:
+            if status_code == 404:
+                raise LyricNotFound(track_id, common_track_id)
+            raise ServiceError(status_code)
+
+        body = json_response['message']['body']
+
+        if not body:
+            raise LyricNotProvidedYet(track_id, common_track_id)
+
+        lyric = body['lyrics']
+
+        paragraphs = self._build_lyric(lyric['lyrics_body'])
+
+        return Lyric(
+            id_=lyric['lyrics_id'],
+            track_id=track_id,
+            common_track_id=common_track_id,
+            content=paragraphs
+        )
+
+    def _build_lyric(self, raw_lyric: str) -> list:
+        return list(clean_paragraphs(raw_lyric))
+
+    def _sort_tracks(self, song: Song) -> list:
+        # match name and album
+        same_albums = []
+        diff_albums = []
+        for track in song.tracks:
+            if track.album and track.album.strip().lower() == song.album.strip().lower():
+                same_albums.append(track)
+            else:
+                diff_albums.append(track)
+
+        return same_albums + diff_albums
@@ -0,0 +1,105 @@
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass, asdict
+
+from src.clients.cache import LruCache, SqliteStore
+from src.clients.musixmatch.models import Lyric
+
+
+@dataclass
+class CachedLyric:
+    lyric: Lyric | None
+
+
+class LyricCache:
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self,
+                 path: str = None,
+                 max_entries: int = 512,
+                 ttl_secs: int = 30 * 24 * 60 * 60,
+                 negative_ttl_secs: int = 24 * 60 * 60) -> None:
+        self._memory = LruCache(max_entries)
+        self._disk = SqliteStore(path, 'lyrics') if path else None
+        self._ttl_secs = ttl_secs
+        self._negative_ttl_secs = negative_ttl_secs
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls, path: str = None) -> 'LyricCache':
+        with cls._shared_lock:
+            if path not in cls._shared:
+                cls._shared[path] = cls(path)
+            return cls._shared[path]
+
+    def get(self, track_id: str, name: str, artist: str) -> CachedLyric | None:
+        for key in self._keys(track_id, name, artist):
+            cached = self._get(key)
+            if cached is not None:
+                self._count_hit(cached)
+                return cached
+
+        with self._stats_lock:
+            self.misses += 1
+
+        return None
+
+    def put(self, track_id: str, name: str, artist: str, lyric: Lyric) -> None:
+        self._put(track_id, name, artist, CachedLyric(lyric), self._ttl_secs)
+
+    def put_no_lyric(self, track_id: str, name: str, artist: str) -> None:
+        self._put(track_id, name, artist, CachedLyric(None), self._negative_ttl_secs)
+
+    def stats(self) -> dict:
+        with self._stats_lock:
+            lookups = self.hits + self.negative_hits + self.misses
+            return {
+                'hits': self.hits,
+                'negative_hits': self.negative_hits,
+                'misses': self.misses,
+                'hit_ratio': (self.hits + self.negative_hits) / lookups if lookups else 0.0,
+            }
+
+    def _get(self, key: str) -> CachedLyric | None:
+        cached = self._memory.get(key)
+        if cached is not None or self._disk is None:
+            return cached
+
+        stored = self._disk.get(key)
+        if stored is None:
+            return None
+
+        value, expires_at = stored
+        cached = CachedLyric(Lyric(**value) if value else None)
+        self._memory.put(key, cached, expires_at - time.time())
+
+        return cached
+
+    def _put(self, track_id: str, name: str, artist: str, cached: CachedLyric, ttl_secs: int) -> None:
+        for key in self._keys(track_id, name, artist):
+            self._memory.put(key, cached, ttl_secs)
+            if self._disk is not None:
+                self._disk.put(key, asdict(cached.lyric) if cached.lyric else None, ttl_secs)
+
+    def _count_hit(self, cached: CachedLyric) -> None:
+        with self._stats_lock:
+            if cached.lyric is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+
+    def _keys(self, track_id: str, name: str, artist: str) -> list:
+        keys = [f'spotify:{track_id}'] if track_id else []
+        keys.append(f'song:{self._normalize(name)}|{self._normalize(artist)}')
+
+        return keys
+
+    def _normalize(self, text: str) -> str:
+        text = unicodedata.normalize('NFKC', text or '').casefold()
+        return re.sub(r'\s+', ' ', text).strip()
@@ -1,135 +1,97 @@
-import re
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Iterator
 
 import requests
 
+from src.clients.decoder import JsonDecoder
+from src.clients.http import shared_session
+from src.clients.retry import RetryPolicy, CircuitOpenError
+from src.clients.musixmatch.base import BaseMusixmatch
 from src.clients.musixmatch.config import MusixmatchConfig
-from src.clients.musixmatch.models import Song, Track, Lyric
-from src.clients.musixmatch.errors import (
-    SongNotFound,
-    SongHasNoLyrics,
-    ServiceError,
-    LyricNotFound,
-    LyricNotProvidedYet,
-)
-
-
-class Musixmatch:
-    API_URL = 'https://api.musixmatch.com/ws/1.1'
-
-    def __init__(self, config: MusixmatchConfig) -> None:
-        self._api_key = config.api_key
+from src.clients.musixmatch.errors import ServiceUnavailable
+from src.clients.musixmatch.models import Song, Lyric
+from src.tracing import tracer, annotate_response, propagate
+
+
+class Musixmatch(BaseMusixmatch):
+    def __init__(self,
+                 config: MusixmatchConfig,
+                 session: requests.Session = None,
+                 retry_policy: RetryPolicy = None,
+                 decoder: JsonDecoder = None,
+                 hedge_delay_secs: float = BaseMusixmatch.HEDGE_DELAY_SECS) -> None:
+        super().__init__(config, retry_policy, decoder, hedge_delay_secs)
+        self._session = session if session is not None else shared_session()
+        self._executor = ThreadPoolExecutor(max_workers=Musixmatch.LYRIC_CANDIDATES, thread_name_prefix='musixmatch')
 
     def search_song(self, song: Song) -> Song:
-        response = requests.get(
+        body = self._send(
+            self._session.get,
             f'{Musixmatch.API_URL}/track.search',
-            params={
-                'q_track': song.name,
-                'q_artist': song.artist,
-                's_track_rating': 'desc',
-                'apikey': self._api_key,
-            }
+            span='musixmatch.search',
+            params=self._search_params(song),
         )
 
-        json_response = response.json()
-
-        status_code = json_response['message']['header']['status_code']
-
-        if status_code != 200:
-            if status_code == 404:
-                raise SongNotFound(song)
-            raise ServiceError(status_code)
-
-        body = json_response['message']['body']
-
-        if not body['track_list']:
-            raise SongHasNoLyrics(song)
-
-        tracks = [Track(
-            id_=track['track']['track_id'],
-            common_id=track['track']['commontrack_id'],
-            name=track['track']['track_name'],
-            instrumental=track['track']['instrumental'],
-            explicit=track['track']['explicit'],
-            album=track['track']['album_name'],
-            artist=track['track']['artist_name'],
-        ) for track in body['track_list']]
-
-        song.tracks = tracks
-        song.tracks_length = len(tracks)
-
-        song.tracks = self._sort_tracks(song)
-
-        return song
+        return self._to_song(song, body)
 
     def fetch_lyric(self, song: Song) -> Song:
+        # the top candidate is probed first, the next one only starts when it
+        # misses or is still running after the hedge delay, the highest
+        # ranked lyric wins
+        candidates = iter(self._lyric_candidates(song))
+        probes = []
+        errors = []
         try:
-            for track in song.tracks:
-                lyric = self._fetch_lyric(track.id_, track.common_id)
-                song.lyric = lyric
-                return song
-        except Exception as error:
-            print(f'Trying next index: {error}')
+            while True:
+                if not probes and not self._start_probe(candidates, probes):
+                    break
+
+                done, _ = wait(probes[:1], timeout=self._hedge_delay_secs)
+                if not done:
+                    if not self._start_probe(candidates, probes):
+                        wait(probes[:1])
+                    continue
+
+                try:
+                    song.lyric = probes.pop(0).result()
+                    return song
+                except Exception as error:
+                    print(f'Trying next index: {error}')
+                    errors.append(error)
+        finally:
+            for probe in probes:
+                probe.cancel()
+
+        self._raise_lookup_error(errors)
 
         return song
 
-    def _fetch_lyric(self, track_id: str, common_track_id: str) -> Lyric:
-        response = requests.get(
-            f'{Musixmatch.API_URL}/track.lyrics.get',
-            params={
-                'track_id': track_id,
-                'commontrack_id': common_track_id,
-                'apikey': self._api_key,
-            }
-        )
-
-        json_response = response.json()
-
-        status_code = json_response['message']['header']['status_code']
-
-        if status_code != 200:
-            if status_code == 404:
-                raise LyricNotFound(track_id, common_track_id)
-            raise ServiceError(status_code)
-
-        body = json_response['message']['body']
-
-        if not body:
-            raise LyricNotProvidedYet(track_id, common_track_id)
+    def _start_probe(self, candidates: Iterator, probes: list) -> bool:
+        track = next(candidates, None)
+        if track is None:
+            return False
 
-        lyric = body['lyrics']
+        probes.append(self._executor.submit(propagate(self._fetch_lyric), track.id_, track.common_id))
+        return True
 
-        paragraphs = self._build_lyric(lyric['lyrics_body'])
-
-        return Lyric(
-            id_=lyric['lyrics_id'],
-            track_id=track_id,
-            common_track_id=common_track_id,
-            content=paragraphs
+    def _fetch_lyric(self, track_id: str, common_track_id: str) -> Lyric:
+        body = self._send(
+            self._session.get,
+            f'{Musixmatch.API_URL}/track.lyrics.get',
+            span='musixmatch.lyric',
+            params=self._lyric_params(track_id, common_track_id),
         )
 
-    def _build_lyric(self, raw_lyric: str) -> list:
-        # remove metadata text
-        lyric = raw_lyric.replace('******* This Lyrics is NOT '
-                                  'for Commercial use *******', '')
-        lyric = lyric.replace('...', '')
-        lyric = re.sub(r'\([0-9]+\)', '', lyric)
-
-        raw_paragraphs = lyric.split('\n\n')
-
-        # filter paragraphs
-        paragraphs = [paragraph for paragraph in raw_paragraphs
-                      if len(paragraph.strip()) > 0]
-
-        return paragraphs
+        return self._to_lyric(track_id, common_track_id, body)
 
-    def _sort_tracks(self, song: Song) -> list:
-        # match name and album
-        same_albums = []
-        diff_albums = []
-        for track in song.tracks:
-            if track.album and track.album.strip().lower() == song.album.strip().lower():
-                same_albums.append(track)
-            else:
-                diff_albums.append(track)
+    def _send(self, request: Callable, url: str, span: str, **kwargs) -> dict:
+        with tracer.span(span):
+            bodies = []
+            try:
+                response = self._retry_policy.call(lambda timeout: request(url, timeout=timeout, **kwargs),
+                                                   self._body_check(bodies))
+            except CircuitOpenError as error:
+                raise ServiceUnavailable(str(error)) from error
 
-        return same_albums + diff_albums
+            annotate_response(response)
+            return self._checked_body(response, bodies[-1])
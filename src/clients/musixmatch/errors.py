@@ -8,6 +8,11 @@ class ServiceError(MusixmatchApiError):
         super().__init__(f'Response API error: response="{message}"')
 
 
+class ServiceUnavailable(MusixmatchApiError):
+    def __init__(self, message: str):
+        super().__init__(f'Service unavailable: {message}')
+
+
 class SongNotFound(MusixmatchApiError):
     def __init__(self, song: str):
         super().__init__(f'Song not found: song={song}')
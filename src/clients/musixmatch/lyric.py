@@ -0,0 +1,20 @@
+import re
+from typing import Iterator
+
+
+# metadata musixmatch adds to the lyric body, literal markers are cheaper to
+# drop with str.replace than through a regex alternation
+LYRIC_DISCLAIMERS = ('******* This Lyrics is NOT for Commercial use *******', '...')
+LYRIC_MARKERS = re.compile(r'\([0-9]+\)')
+
+
+def clean_paragraphs(raw_lyric: str) -> Iterator[str]:
+    lyric = raw_lyric
+    for disclaimer in LYRIC_DISCLAIMERS:
+        lyric = lyric.replace(disclaimer, '')
+    if '(' in lyric:
+        lyric = LYRIC_MARKERS.sub('', lyric)
+
+    for paragraph in lyric.split('\n\n'):
+        if paragraph and not paragraph.isspace():
+            yield paragraph
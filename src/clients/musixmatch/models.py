@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Lyric:
     id_: str
     track_id: str
@@ -9,7 +9,7 @@ class Lyric:
     content: list
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     id_: str
     common_id: str
@@ -20,7 +20,7 @@ class Track:
     album: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Song:
     name: str
     artist: str
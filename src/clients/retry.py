@@ -0,0 +1,201 @@
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import requests
+
+from src.tracing import annotate
+
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def transient_errors() -> tuple:
+    # httpx errors can only be raised once something imported httpx
+    httpx = sys.modules.get('httpx')
+    if httpx is None:
+        return (requests.ConnectionError, requests.Timeout)
+
+    return (requests.ConnectionError, requests.Timeout, httpx.TransportError)
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, name: str, retry_in_secs: float):
+        super().__init__(f'{name} is unavailable, retrying in {retry_in_secs:.0f}s')
+
+
+class CircuitBreaker:
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half-open'
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, name: str = 'upstream', failure_threshold: int = 5, reset_timeout_secs: float = 30) -> None:
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_secs = reset_timeout_secs
+        self._lock = threading.Lock()
+        self._state = CircuitBreaker.CLOSED
+        self._failures = 0
+        self._opened_at = 0
+
+    @classmethod
+    def shared(cls, name: str) -> 'CircuitBreaker':
+        with cls._shared_lock:
+            if name not in cls._shared:
+                cls._shared[name] = cls(name)
+            return cls._shared[name]
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def check(self) -> None:
+        with self._lock:
+            if self._state == CircuitBreaker.CLOSED:
+                return
+
+            retry_in_secs = self._opened_at + self._reset_timeout_secs - time.monotonic()
+            if self._state == CircuitBreaker.HALF_OPEN or retry_in_secs > 0:
+                raise CircuitOpenError(self._name, max(retry_in_secs, 0))
+
+            # a single call probes the upstream, the rest keep failing fast
+            self._state = CircuitBreaker.HALF_OPEN
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CircuitBreaker.CLOSED
+            self._failures = 0
+
+    def release_probe(self) -> None:
+        # a probe that ends without a response, cancelled or failing on an
+        # error the policy does not retry, opens the circuit again instead of
+        # leaving it half open for good
+        with self._lock:
+            if self._state == CircuitBreaker.HALF_OPEN:
+                self._state = CircuitBreaker.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._state == CircuitBreaker.HALF_OPEN or self._failures >= self._failure_threshold:
+                self._state = CircuitBreaker.OPEN
+                self._opened_at = time.monotonic()
+
+
+@dataclass(frozen=True)
+class RetryConfig:
+    max_attempts: int = 3
+    base_delay_secs: float = 0.25
+    max_delay_secs: float = 4
+    deadline_secs: float = 10
+
+
+class RetryPolicy:
+    def __init__(self, config: RetryConfig = None, breaker: CircuitBreaker = None) -> None:
+        self._config = config if config is not None else RetryConfig()
+        self._breaker = breaker if breaker is not None else CircuitBreaker()
+
+    def call(self,
+             request: Callable[[float], object],
+             retryable: Callable[[object], bool] = None) -> object:
+        retryable = retryable if retryable is not None else self._is_retryable
+        deadline = time.monotonic() + self._config.deadline_secs
+
+        for attempt in range(1, self._config.max_attempts + 1):
+            self._breaker.check()
+            annotate(retries=attempt - 1)
+
+            try:
+                response = request(self._remaining(deadline))
+            except transient_errors():
+                self._breaker.record_failure()
+                delay_secs = self._delay(attempt, None, deadline)
+                if delay_secs is None:
+                    raise
+            except BaseException:
+                self._breaker.release_probe()
+                raise
+            else:
+                if not retryable(response):
+                    self._breaker.record_success()
+                    return response
+
+                self._breaker.record_failure()
+                delay_secs = self._delay(attempt, response, deadline)
+                if delay_secs is None:
+                    return response
+
+            time.sleep(delay_secs)
+
+    async def call_async(self,
+                         request: Callable[[float], Awaitable],
+                         retryable: Callable[[object], bool] = None) -> object:
+        # only coroutines sleep on the event loop, the sync paths never load asyncio
+        import asyncio
+
+        retryable = retryable if retryable is not None else self._is_retryable
+        deadline = time.monotonic() + self._config.deadline_secs
+
+        for attempt in range(1, self._config.max_attempts + 1):
+            self._breaker.check()
+            annotate(retries=attempt - 1)
+
+            try:
+                response = await request(self._remaining(deadline))
+            except transient_errors():
+                self._breaker.record_failure()
+                delay_secs = self._delay(attempt, None, deadline)
+                if delay_secs is None:
+                    raise
+            except BaseException:
+                self._breaker.release_probe()
+                raise
+            else:
+                if not retryable(response):
+                    self._breaker.record_success()
+                    return response
+
+                self._breaker.record_failure()
+                delay_secs = self._delay(attempt, response, deadline)
+                if delay_secs is None:
+                    return response
+
+            await asyncio.sleep(delay_secs)
+
+    def _delay(self, attempt: int, response: object, deadline: float) -> float | None:
+        if attempt >= self._config.max_attempts:
+            return None
+
+        # full jitter keeps concurrent callers from retrying in lockstep,
+        # Retry-After from the upstream always wins
+        delay_secs = self._retry_after(response)
+        if delay_secs is None:
+            delay_secs = random.uniform(0, min(self._config.max_delay_secs,
+                                               self._config.base_delay_secs * 2 ** (attempt - 1)))
+
+        if delay_secs >= self._remaining(deadline):
+            return None
+
+        return delay_secs
+
+    def _retry_after(self, response: object) -> float | None:
+        if response is None or response.status_code not in (429, 503):
+            return None
+
+        try:
+            return max(float(response.headers.get('Retry-After')), 0)
+        except (TypeError, ValueError):
+            return None
+
+    def _remaining(self, deadline: float) -> float:
+        return max(deadline - time.monotonic(), 0)
+
+    def _is_retryable(self, response: object) -> bool:
+        return response.status_code in RETRY_STATUS_CODES
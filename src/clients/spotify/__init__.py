@@ -1,14 +1,33 @@
 # flake8: noqa
+import importlib
+
 from src.clients.spotify.client import Spotify
 from src.clients.spotify.config import SpotifyConfig
 from src.clients.spotify.errors import (
     SpotifyApiError,
     ServiceError,
+    Unauthorized,
     NotPlayingError,
+    ServiceUnavailable,
 )
 from src.clients.spotify.models import (
     Album,
     Artist,
     Track,
+    Playback,
 )
+from src.clients.spotify.token import TokenCache
+from src.clients.spotify.cache import AlbumCache, CachedAlbum
+
+
+_LAZY_EXPORTS = {
+    'AsyncSpotify': 'src.clients.spotify.async_client',
+}
+
+
+def __getattr__(name: str) -> object:
+    # the async clients bring their own http stack, it loads on first use
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
 
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
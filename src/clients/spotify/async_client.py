@@ -0,0 +1,170 @@
+import asyncio
+from typing import Callable
+
+import httpx
+
+from src.clients.decoder import JsonDecoder
+from src.clients.retry import RetryPolicy, CircuitOpenError
+from src.clients.spotify.base import BaseSpotify
+from src.clients.spotify.cache import AlbumCache
+from src.clients.spotify.config import SpotifyConfig
+from src.clients.spotify.errors import NotPlayingError, ServiceUnavailable, Unauthorized
+from src.clients.spotify.models import Album, Playback
+from src.clients.spotify.token import TokenCache
+from src.tracing import tracer, annotate_response
+
+
+class AsyncSpotify(BaseSpotify):
+    def __init__(self,
+                 config: SpotifyConfig,
+                 client: httpx.AsyncClient,
+                 token_cache: TokenCache = None,
+                 album_cache: AlbumCache = None,
+                 retry_policy: RetryPolicy = None,
+                 decoder: JsonDecoder = None) -> None:
+        super().__init__(config, token_cache, album_cache, retry_policy, decoder)
+        self._client = client
+
+    async def get_current_track(self) -> Album:
+        current_playing_response = await self._authorized(self._get_current_playing)
+
+        return self._to_current_album(current_playing_response)
+
+    async def get_playback(self) -> Playback | None:
+        try:
+            current_playing = await self._authorized(self._get_current_playing)
+        except NotPlayingError:
+            return None
+
+        return self._to_playback(current_playing)
+
+    async def get_queue(self) -> list:
+        return self._to_queue(await self._authorized(self._get_queue))
+
+    async def get_album(self, album_id: str) -> Album:
+        return await self._authorized(lambda token: self._get_album(token, album_id))
+
+    async def get_current_album(self) -> Album:
+        return await self._authorized(self._get_current_album)
+
+    async def _authorized(self, request: Callable) -> object:
+        token = await self._refresh_access_token()
+        try:
+            return await request(token)
+        except Unauthorized:
+            self._invalidate_access_token()
+
+        return await request(await self._refresh_access_token())
+
+    async def _get_current_album(self, token: str) -> Album:
+        current_playing = await self._get_current_playing(token)
+
+        album_id = current_playing['item']['album']['id']
+
+        return await self._get_album(token, album_id)
+
+    async def _get_queue(self, token: str) -> dict:
+        response = await self._send(
+            self._client.get,
+            f'{BaseSpotify.API_URL}/me/player/queue',
+            span='spotify.queue',
+            headers={
+                'Authorization': f'Bearer {token}'
+            }
+        )
+
+        self._verify_spotify_response(response)
+
+        return self._decoder.decode(response)
+
+    async def _get_album(self, token: str, album_id: str) -> Album:
+        cached = self._cached_album(album_id)
+        if cached is not None and self._album_cache.is_fresh(cached):
+            return cached.album
+
+        response = await self._send(
+            self._client.get,
+            f'{BaseSpotify.API_URL}/albums/{album_id}',
+            span='spotify.album',
+            headers=self._album_headers(token, cached)
+        )
+
+        if self._is_not_modified(cached, response):
+            return self._album_cache.put(album_id, cached.album, cached.etag).album
+
+        self._verify_spotify_response(response)
+
+        album_response = self._decoder.decode(response)
+        album = self._to_full_album(album_response)
+        album.tracks += await self._get_remaining_album_tracks(token, album_id, album_response['tracks'])
+
+        self._cache_album(album_id, album, response.headers.get('ETag'))
+
+        return album
+
+    async def _get_remaining_album_tracks(self, token: str, album_id: str, first_page: dict) -> list:
+        pages = await asyncio.gather(*[
+            self._get_album_tracks_page(token, album_id, offset)
+            for offset in self._remaining_album_offsets(first_page)
+        ])
+
+        return [track for page in pages for track in self._to_tracks(page['items'])]
+
+    async def _get_album_tracks_page(self, token: str, album_id: str, offset: int) -> dict:
+        response = await self._send(
+            self._client.get,
+            f'{BaseSpotify.API_URL}/albums/{album_id}/tracks',
+            span='spotify.album_tracks',
+            headers={
+                'Authorization': f'Bearer {token}'
+            },
+            params={
+                'offset': offset,
+                'limit': BaseSpotify.ALBUM_TRACKS_PAGE_SIZE,
+            }
+        )
+
+        self._verify_spotify_response(response)
+
+        return self._decoder.decode(response)
+
+    async def _get_current_playing(self, token: str) -> dict:
+        response = await self._send(
+            self._client.get,
+            f'{BaseSpotify.API_URL}/me/player/currently-playing',
+            span='spotify.currently_playing',
+            headers={
+                'Authorization': f'Bearer {token}'
+            }
+        )
+
+        self._verify_spotify_response(response)
+
+        return self._decoder.decode(response)
+
+    async def _refresh_access_token(self) -> str:
+        access_token = self._token_cache.get(self._token_cache_key())
+        if access_token:
+            return access_token
+
+        response = await self._send(
+            self._client.post,
+            BaseSpotify.API_TOKEN_URL,
+            span='spotify.token',
+            headers=self._token_headers(),
+            data=self._token_data(),
+        )
+
+        self._verify_spotify_response(response)
+
+        return self._cache_access_token(self._decoder.decode(response))
+
+    async def _send(self, request: Callable, url: str, span: str, **kwargs) -> httpx.Response:
+        with tracer.span(span):
+            try:
+                response = await self._retry_policy.call_async(lambda timeout: request(url, timeout=timeout, **kwargs))
+            except CircuitOpenError as error:
+                raise ServiceUnavailable(str(error)) from error
+
+            annotate_response(response)
+            return response
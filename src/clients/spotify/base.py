@@ -0,0 +1,170 @@
+import base64
+
+from src.clients.decoder import JsonDecoder
+from src.clients.retry import RetryPolicy, CircuitBreaker
+from src.clients.spotify.cache import AlbumCache, CachedAlbum
+from src.clients.spotify.config import SpotifyConfig
+from src.clients.spotify.models import Track, Album, Artist, Playback, intern
+from src.clients.spotify.errors import ServiceError, Unauthorized, NotPlayingError
+from src.clients.spotify.token import TokenCache
+
+
+class BaseSpotify:
+    ALBUM_TRACKS_PAGE_SIZE = 50
+    API_URL = 'https://api.spotify.com/v1'
+    API_TOKEN_URL = 'https://accounts.spotify.com/api/token'
+    API_AUTHORIZE_URL = 'https://accounts.spotify.com/authorize'
+
+    def __init__(self,
+                 config: SpotifyConfig,
+                 token_cache: TokenCache = None,
+                 album_cache: AlbumCache = None,
+                 retry_policy: RetryPolicy = None,
+                 decoder: JsonDecoder = None) -> None:
+        self._client_id = config.client_id
+        self._client_secret = config.client_secret
+        self._refresh_token = config.refresh_token
+        self._token_cache = (token_cache if token_cache is not None
+                             else TokenCache.shared(config.token_cache_path))
+        self._album_cache = album_cache
+        self._retry_policy = (retry_policy if retry_policy is not None
+                              else RetryPolicy(breaker=CircuitBreaker.shared('spotify')))
+        self._decoder = decoder if decoder is not None else JsonDecoder()
+
+    def _remaining_album_offsets(self, first_page: dict) -> range:
+        if not first_page.get('next'):
+            return range(0)
+
+        start = first_page['offset'] + len(first_page['items'])
+        return range(start, first_page['total'], BaseSpotify.ALBUM_TRACKS_PAGE_SIZE)
+
+    def _cached_album(self, album_id: str) -> CachedAlbum | None:
+        return self._album_cache.get(album_id) if self._album_cache is not None else None
+
+    def _album_headers(self, token: str, cached: CachedAlbum | None) -> dict:
+        headers = {
+            'Authorization': f'Bearer {token}'
+        }
+
+        if cached is not None and cached.etag:
+            headers['If-None-Match'] = cached.etag
+
+        return headers
+
+    def _is_not_modified(self, cached: CachedAlbum | None, response: object) -> bool:
+        return cached is not None and response.status_code == 304
+
+    def _cache_album(self, album_id: str, album: Album, etag: str | None) -> None:
+        if self._album_cache is not None:
+            self._album_cache.put(album_id, album, etag)
+
+    def _token_cache_key(self) -> str:
+        return f'{self._client_id}:{self._client_secret}:{self._refresh_token}'
+
+    def _token_headers(self) -> dict:
+        return {
+            'Authorization': f'Basic {self._get_basic_auth_token()}'
+        }
+
+    def _token_data(self) -> dict:
+        return {
+            'grant_type': 'refresh_token',
+            'refresh_token': self._refresh_token,
+        }
+
+    def _cache_access_token(self, token_response: dict) -> str:
+        self._token_cache.put(
+            self._token_cache_key(),
+            token_response['access_token'],
+            token_response.get('expires_in', 3600),
+        )
+
+        return token_response['access_token']
+
+    def _invalidate_access_token(self) -> None:
+        # a cached or persisted token revoked before its expiry is only
+        # noticed when the api rejects it
+        self._token_cache.delete(self._token_cache_key())
+
+    def _verify_spotify_response(self, response: object) -> None:
+        if response.status_code == 401:
+            raise Unauthorized(response.headers, response.json())
+
+        if response.status_code not in (200, 204):
+            raise ServiceError(response.headers, response.json())
+
+        if response.status_code == 204:
+            raise NotPlayingError()
+
+    def _get_basic_auth_token(self) -> str:
+        return self._to_base64(f'{self._client_id}:{self._client_secret}')
+
+    def _to_base64(self, text: str) -> str:
+        encoded_bytes = base64.b64encode(text.encode('utf-8'))
+        return encoded_bytes.decode('utf-8')
+
+    def _to_playback(self, current_playing: dict) -> Playback | None:
+        # ads and episodes come without a track item
+        if not current_playing.get('item') or current_playing.get('currently_playing_type', 'track') != 'track':
+            return None
+
+        return Playback(
+            album=self._to_current_album(current_playing),
+            is_playing=current_playing.get('is_playing', False),
+            progress=current_playing.get('progress_ms') or 0,
+            duration=current_playing['item']['duration_ms'],
+        )
+
+    def _to_queue(self, queue_response: dict) -> list:
+        # the queue also lists podcast episodes, only tracks have an album
+        return [self._to_current_album({'item': item}) for item in queue_response.get('queue', [])
+                if item and item.get('type', 'track') == 'track']
+
+    def _to_current_album(self, current_playing: dict) -> Album:
+        album = self._to_album(current_playing['item']['album'])
+        album.artists = self._to_artists(current_playing['item']['artists'])
+        album.tracks = self._to_tracks([current_playing['item']])
+
+        return album
+
+    def _to_full_album(self, album_response: dict) -> Album:
+        album = self._to_album(album_response)
+        album.artists = self._to_artists(album_response['artists'])
+        album.tracks = self._to_tracks(album_response['tracks']['items'])
+
+        return album
+
+    def _to_album(self, album: dict) -> Album:
+        return Album(
+            id_=album['id'],
+            name=album['name'],
+            href=album['href'],
+            public_url=album['external_urls']['spotify'],
+            release_date=album['release_date'],
+            total_tracks=album['total_tracks'],
+            artists=[],
+            tracks=[],
+        )
+
+    def _to_artists(self, artists: list) -> list:
+        return [
+            Artist(
+                id_=intern(artist['id']),
+                name=intern(artist['name']),
+                href=artist['href'],
+                public_url=artist['external_urls'].get('spotify'),
+            ) for artist in artists
+        ]
+
+    def _to_tracks(self, tracks: list) -> list:
+        return [
+            Track(
+                id_=intern(track['id']),
+                name=track['name'],
+                href=track['href'],
+                public_url=track['external_urls'].get('spotify'),
+                disc_number=track['disc_number'],
+                track_number=track['track_number'],
+                duration=track['duration_ms'],
+            ) for track in tracks
+        ]
@@ -0,0 +1,80 @@
+import threading
+import time
+from dataclasses import dataclass, asdict
+
+from src.clients.cache import LruCache, SqliteStore
+from src.clients.spotify.models import Album, Artist, Track, intern
+
+
+@dataclass
+class CachedAlbum:
+    album: Album
+    etag: str | None
+    fetched_at: float
+
+    @property
+    def age_secs(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class AlbumCache:
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self,
+                 path: str = None,
+                 max_entries: int = 128,
+                 ttl_secs: int = 24 * 60 * 60,
+                 stale_ttl_secs: int = 30 * 24 * 60 * 60) -> None:
+        # entries live for stale_ttl_secs so an expired album can still be
+        # revalidated with its etag instead of being downloaded again
+        self._memory = LruCache(max_entries)
+        self._disk = SqliteStore(path, 'albums') if path else None
+        self._ttl_secs = ttl_secs
+        self._stale_ttl_secs = stale_ttl_secs
+
+    @classmethod
+    def shared(cls, path: str = None) -> 'AlbumCache':
+        with cls._shared_lock:
+            if path not in cls._shared:
+                cls._shared[path] = cls(path)
+            return cls._shared[path]
+
+    def get(self, album_id: str) -> CachedAlbum | None:
+        cached = self._memory.get(album_id)
+        if cached is not None or self._disk is None:
+            return cached
+
+        stored = self._disk.get(album_id)
+        if stored is None:
+            return None
+
+        value, expires_at = stored
+        cached = CachedAlbum(self._to_album(value['album']), value['etag'], value['fetched_at'])
+        self._memory.put(album_id, cached, expires_at - time.time())
+
+        return cached
+
+    def put(self, album_id: str, album: Album, etag: str | None) -> CachedAlbum:
+        cached = CachedAlbum(album, etag, time.time())
+
+        self._memory.put(album_id, cached, self._stale_ttl_secs)
+        if self._disk is not None:
+            self._disk.put(album_id, {
+                'album': asdict(album),
+                'etag': etag,
+                'fetched_at': cached.fetched_at,
+            }, self._stale_ttl_secs)
+
+        return cached
+
+    def is_fresh(self, cached: CachedAlbum) -> bool:
+        return cached.age_secs < self._ttl_secs
+
+    def _to_album(self, album: dict) -> Album:
+        return Album(**{
+            **album,
+            'artists': [Artist(**{**artist, 'id_': intern(artist['id_']), 'name': intern(artist['name'])})
+                        for artist in album['artists']],
+            'tracks': [Track(**{**track, 'id_': intern(track['id_'])}) for track in album['tracks']],
+        })
@@ -1,41 +1,76 @@
-import base64
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
 
 import requests
 from requests import Response
 
+from src.clients.decoder import JsonDecoder
+from src.clients.http import shared_session
+from src.clients.retry import RetryPolicy, CircuitOpenError
+from src.clients.spotify.base import BaseSpotify
+from src.clients.spotify.cache import AlbumCache
 from src.clients.spotify.config import SpotifyConfig
-from src.clients.spotify.models import Track, Album, Artist
-from src.clients.spotify.errors import ServiceError, NotPlayingError
+from src.clients.spotify.models import Track, Album, Playback
+from src.clients.spotify.errors import NotPlayingError, ServiceUnavailable, Unauthorized
+from src.clients.spotify.token import TokenCache
+from src.tracing import tracer, annotate_response, propagate
+
+
+class Spotify(BaseSpotify):
+    def __init__(self,
+                 config: SpotifyConfig,
+                 token_cache: TokenCache = None,
+                 session: requests.Session = None,
+                 album_cache: AlbumCache = None,
+                 retry_policy: RetryPolicy = None,
+                 decoder: JsonDecoder = None) -> None:
+        super().__init__(config, token_cache, album_cache, retry_policy, decoder)
+        self._session = session if session is not None else shared_session()
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='spotify')
 
+    def get_current_track(self) -> Album:
+        current_playing_response = self._authorized(self._get_current_playing)
 
-class Spotify:
-    API_URL = 'https://api.spotify.com/v1'
-    API_TOKEN_URL = 'https://accounts.spotify.com/api/token'
-    API_AUTHORIZE_URL = 'https://accounts.spotify.com/authorize'
+        return self._to_current_album(current_playing_response)
 
-    def __init__(self, config: SpotifyConfig) -> None:
-        self._client_id = config.client_id
-        self._client_secret = config.client_secret
-        self._refresh_token = config.refresh_token
+    def get_playback(self) -> Playback | None:
+        try:
+            current_playing = self._authorized(self._get_current_playing)
+        except NotPlayingError:
+            return None
 
-    def get_current_track(self) -> Album:
-        token = self._refresh_access_token()
-        current_playing_response = self._get_current_playing(token)
+        return self._to_playback(current_playing)
 
-        album = self._to_album(current_playing_response['item']['album'])
-        album.artists = self._to_artists(current_playing_response['item']['artists'])
-        album.tracks = self._to_tracks([current_playing_response['item']])
+    def get_queue(self) -> list:
+        return self._to_queue(self._authorized(self._get_queue))
 
-        return album
+    def get_album(self, album_id: str) -> Album:
+        return self._authorized(lambda token: self._get_album(token, album_id))
+
+    def get_current_album(self, stream_tracks: bool = False) -> Album:
+        return self._authorized(lambda token: self._get_current_album(token, stream_tracks))
 
-    def get_current_album(self) -> Album:
+    def _authorized(self, request: Callable) -> object:
         token = self._refresh_access_token()
+        try:
+            return request(token)
+        except Unauthorized:
+            self._invalidate_access_token()
+
+        return request(self._refresh_access_token())
+
+    def _get_current_album(self, token: str, stream_tracks: bool) -> Album:
         current_playing = self._get_current_playing(token)
 
         album_id = current_playing['item']['album']['id']
 
-        response = requests.get(
-            f'{Spotify.API_URL}/albums/{album_id}',
+        return self._get_album(token, album_id, stream_tracks)
+
+    def _get_queue(self, token: str) -> dict:
+        response = self._send(
+            self._session.get,
+            f'{Spotify.API_URL}/me/player/queue',
+            span='spotify.queue',
             headers={
                 'Authorization': f'Bearer {token}'
             }
@@ -43,91 +78,119 @@ class Spotify:
 
         self._verify_spotify_response(response)
 
-        album_response = response.json()
+        return self._decoder.decode(response)
 
+    def _get_album(self, token: str, album_id: str, stream_tracks: bool = False) -> Album:
+        cached = self._cached_album(album_id)
+        if cached is not None and self._album_cache.is_fresh(cached):
+            return cached.album
+
+        response = self._send(
+            self._session.get,
+            f'{Spotify.API_URL}/albums/{album_id}',
+            span='spotify.album',
+            headers=self._album_headers(token, cached)
+        )
+
+        if self._is_not_modified(cached, response):
+            return self._album_cache.put(album_id, cached.album, cached.etag).album
+
+        self._verify_spotify_response(response)
+
+        album_response = self._decoder.decode(response)
         album = self._to_album(album_response)
         album.artists = self._to_artists(album_response['artists'])
-        album.tracks = self._to_tracks(album_response['tracks']['items'])
+
+        # tracks beyond the first page arrive while the caller already
+        # consumes the first ones, the album is cached once all are read
+        tracks = self._stream_album_tracks(album, album_response['tracks'], response.headers.get('ETag'))
+        album.tracks = tracks if stream_tracks else list(tracks)
 
         return album
 
-    def _get_current_playing(self, token: str) -> dict:
-        response = requests.get(
-            f'{Spotify.API_URL}/me/player/currently-playing',
+    def _stream_album_tracks(self, album: Album, first_page: dict, etag: str | None) -> Iterator[Track]:
+        tracks = self._to_tracks(first_page['items'])
+        yield from tracks
+
+        for page in self._get_remaining_album_pages(album.id_, first_page):
+            page_tracks = self._to_tracks(page['items'])
+            tracks.extend(page_tracks)
+            yield from page_tracks
+
+        album.tracks = tracks
+        self._cache_album(album.id_, album, etag)
+
+    def _get_remaining_album_pages(self, album_id: str, first_page: dict) -> Iterator[dict]:
+        # a streamed album is read while its replies are being posted, each
+        # page refreshes an expired token on its own instead of failing the
+        # thread halfway
+        offsets = self._remaining_album_offsets(first_page)
+        pages = [self._executor.submit(propagate(self._authorized),
+                                       lambda token, offset=offset: self._get_album_tracks_page(token, album_id, offset))
+                 for offset in offsets]
+
+        try:
+            for page in pages:
+                yield page.result()
+        finally:
+            for page in pages:
+                page.cancel()
+
+    def _get_album_tracks_page(self, token: str, album_id: str, offset: int) -> dict:
+        response = self._send(
+            self._session.get,
+            f'{Spotify.API_URL}/albums/{album_id}/tracks',
+            span='spotify.album_tracks',
             headers={
                 'Authorization': f'Bearer {token}'
+            },
+            params={
+                'offset': offset,
+                'limit': Spotify.ALBUM_TRACKS_PAGE_SIZE,
             }
         )
 
         self._verify_spotify_response(response)
 
-        return response.json()
-
-    def _refresh_access_token(self) -> str:
-        authorization = self._get_basic_auth_token()
+        return self._decoder.decode(response)
 
-        response = requests.post(
-            Spotify.API_TOKEN_URL,
+    def _get_current_playing(self, token: str) -> dict:
+        response = self._send(
+            self._session.get,
+            f'{Spotify.API_URL}/me/player/currently-playing',
+            span='spotify.currently_playing',
             headers={
-                'Authorization': f'Basic {authorization}'
-            },
-            data={
-                'grant_type': 'refresh_token',
-                'refresh_token': self._refresh_token,
+                'Authorization': f'Bearer {token}'
             }
         )
 
         self._verify_spotify_response(response)
 
-        token_response = response.json()
+        return self._decoder.decode(response)
 
-        return token_response['access_token']
-
-    def _verify_spotify_response(self, response: Response) -> None:
-        if response.status_code not in (200, 204):
-            raise ServiceError(response.headers, response.json())
+    def _refresh_access_token(self) -> str:
+        access_token = self._token_cache.get(self._token_cache_key())
+        if access_token:
+            return access_token
 
-        if response.status_code == 204:
-            raise NotPlayingError()
+        response = self._send(
+            self._session.post,
+            Spotify.API_TOKEN_URL,
+            span='spotify.token',
+            headers=self._token_headers(),
+            data=self._token_data(),
+        )
 
-    def _get_basic_auth_token(self) -> str:
-        return self._to_base64(f'{self._client_id}:{self._client_secret}')
+        self._verify_spotify_response(response)
 
-    def _to_base64(self, text: str) -> str:
-        encoded_bytes = base64.b64encode(text.encode('utf-8'))
-        return encoded_bytes.decode('utf-8')
+        return self._cache_access_token(self._decoder.decode(response))
 
-    def _to_album(self, album: dict) -> Album:
-        return Album(
-            id_=album['id'],
-            name=album['name'],
-            href=album['href'],
-            public_url=album['external_urls']['spotify'],
-            release_date=album['release_date'],
-            total_tracks=album['total_tracks'],
-            artists=[],
-            tracks=[],
-        )
+    def _send(self, request: Callable, url: str, span: str, **kwargs) -> Response:
+        with tracer.span(span):
+            try:
+                response = self._retry_policy.call(lambda timeout: request(url, timeout=timeout, **kwargs))
+            except CircuitOpenError as error:
+                raise ServiceUnavailable(str(error)) from error
 
-    def _to_artists(self, artists: list) -> list:
-        return [
-            Artist(
-                id_=artist['id'],
-                name=artist['name'],
-                href=artist['href'],
-                public_url=artist['external_urls']['spotify'],
-            ) for artist in artists
-        ]
-
-    def _to_tracks(self, tracks: list) -> list:
-        return [
-            Track(
-                id_=track['id'],
-                name=track['name'],
-                href=track['href'],
-                public_url=track['external_urls']['spotify'],
-                disc_number=track['disc_number'],
-                track_number=track['track_number'],
-                duration=track['duration_ms'],
-            ) for track in tracks
-        ]
+            annotate_response(response)
+            return response
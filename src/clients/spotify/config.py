@@ -6,3 +6,4 @@ class SpotifyConfig:
     client_id: str
     client_secret: str
     refresh_token: str
+    token_cache_path: str = None
@@ -32,6 +32,15 @@ class ServiceError(SpotifyApiError):
         super().__init__('Response API error', header, body)
 
 
+class Unauthorized(ServiceError):
+    pass
+
+
 class NotPlayingError(SpotifyApiError):
     def __init__(self):
         super().__init__('Not playing any song at this moment')
+
+
+class ServiceUnavailable(SpotifyApiError):
+    def __init__(self, message: str):
+        super().__init__(f'Service unavailable: {message}')
@@ -1,7 +1,13 @@
+import sys
 from dataclasses import dataclass
 
 
-@dataclass
+def intern(value: str | None) -> str | None:
+    # local files come without ids, only strings can be interned
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@dataclass(slots=True)
 class Entity:
     id_: str
     name: str
@@ -9,21 +15,37 @@ class Entity:
     public_url: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Artist(Entity):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class Track(Entity):
     disc_number: int
     track_number: int
     duration: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Album(Entity):
     release_date: str
     total_tracks: int
     artists: list
     tracks: list
+
+
+@dataclass(slots=True)
+class Playback:
+    album: Album
+    is_playing: bool
+    progress: int
+    duration: int
+
+    @property
+    def track(self) -> Track:
+        return self.album.tracks[0]
+
+    @property
+    def remaining(self) -> int:
+        return max(self.duration - self.progress, 0)
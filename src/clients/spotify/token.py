@@ -0,0 +1,84 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class TokenCache:
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str = None, expiry_margin_secs: int = 60) -> None:
+        self._path = path
+        self._expiry_margin_secs = expiry_margin_secs
+        self._tokens = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, path: str = None) -> 'TokenCache':
+        with cls._shared_lock:
+            if path not in cls._shared:
+                cls._shared[path] = cls(path)
+            return cls._shared[path]
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            token = self._load().get(self._hash(key))
+
+        if not token or token['expires_at'] - self._expiry_margin_secs <= time.time():
+            return None
+
+        return token['access_token']
+
+    def put(self, key: str, access_token: str, expires_in: int) -> None:
+        with self._lock:
+            tokens = self._load()
+            tokens[self._hash(key)] = {
+                'access_token': access_token,
+                'expires_at': time.time() + expires_in,
+            }
+            self._save(tokens)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            tokens = self._load()
+            if tokens.pop(self._hash(key), None) is not None:
+                self._save(tokens)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tokens = {}
+            self._save(self._tokens)
+
+    def _load(self) -> dict:
+        if self._tokens is not None:
+            return self._tokens
+
+        self._tokens = {}
+        if self._path and os.path.exists(self._path):
+            try:
+                with open(self._path, encoding='utf-8') as token_file:
+                    self._tokens = json.load(token_file)
+            except (OSError, ValueError) as error:
+                print(f'Ignoring token cache file: {error}')
+
+        return self._tokens
+
+    def _save(self, tokens: dict) -> None:
+        if not self._path:
+            return
+
+        # write to a temp file first so a crash never leaves a torn cache
+        temp_path = f'{self._path}.tmp'
+        try:
+            descriptor = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as token_file:
+                json.dump(tokens, token_file)
+            os.replace(temp_path, self._path)
+        except OSError as error:
+            print(f'Unable to persist token cache: {error}')
+
+    def _hash(self, key: str) -> str:
+        # keys carry client secrets, never store them in clear text
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
@@ -1,7 +1,26 @@
 # flake8: noqa
+import importlib
+
 from src.clients.twitter.client import (
     Twitter,
     TwitterLocal,
 )
-from src.clients.twitter.models import PublishedTweet
+from src.clients.twitter.models import PublishedTweet, ScheduledTweet
+from src.clients.twitter.scheduler import ReplyScheduler
+from src.clients.twitter.outbox import TweetOutbox, OutboxThread
+from src.clients.twitter.ratelimit import RateLimitGovernor, RateLimitBudget, RateLimitExceeded
 from src.clients.twitter.config import TwitterConfig
+
+
+_LAZY_EXPORTS = {
+    'AsyncTwitter': 'src.clients.twitter.async_client',
+    'AsyncTwitterLocal': 'src.clients.twitter.async_client',
+}
+
+
+def __getattr__(name: str) -> object:
+    # the async clients bring their own http stack, it loads on first use
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,151 @@
+import asyncio
+from typing import Iterable
+
+import aiohttp
+import tweepy
+from tweepy.asynchronous import AsyncClient
+
+from src.clients.twitter.client import Twitter
+from src.clients.twitter.config import TwitterConfig
+from src.clients.twitter.models import PublishedTweet, ScheduledTweet
+from src.tracing import tracer, annotate
+
+
+class AsyncTwitter(Twitter):
+    def __init__(self, config: TwitterConfig) -> None:
+        super().__init__(config)
+        self._reply_tasks = set()
+
+    def _new_client(self) -> AsyncClient:
+        return AsyncClient(
+            consumer_key=self._consumer_key,
+            consumer_secret=self._consumer_secret,
+            access_token=self._access_token,
+            access_token_secret=self._access_token_secret,
+            return_type=aiohttp.ClientResponse,
+        )
+
+    async def post(self, tweet: str) -> PublishedTweet:
+        status_id = await self._create_tweet(text=tweet)
+
+        return PublishedTweet(status_id, tweet, None)
+
+    async def reply(self, tweet: str, tweet_id: int) -> PublishedTweet:
+        return await self._deliver_reply(tweet, tweet_id)
+
+    async def reply_thread(self, tweets: Iterable[str], tweet_id: str) -> list:
+        # sqlite blocks, the outbox runs in a worker thread off the event loop
+        if self._outbox is not None:
+            tweets = await asyncio.to_thread(self._outbox.plan, tweets, tweet_id)
+
+        return await self._reply_planned(tweets, tweet_id)
+
+    async def resume_replies(self) -> list:
+        if self._outbox is None:
+            return []
+
+        replies = []
+        for thread in await asyncio.to_thread(self._outbox.claim):
+            replies += await self._reply_planned(thread.tweets, thread.parent_id)
+
+        return replies
+
+    async def _reply_planned(self, tweets: Iterable[str], tweet_id: str) -> list:
+        if self._async_replies:
+            return self._schedule_thread(tweets, tweet_id)
+
+        replies = []
+        for tweet in tweets:
+            reply = await self.reply(tweet, tweet_id)
+            replies.append(reply)
+            tweet_id = reply.id_
+
+        return replies
+
+    async def wait_replies(self, timeout: float = None) -> bool:
+        if not self._reply_tasks:
+            return True
+
+        _, pending = await asyncio.wait(self._reply_tasks, timeout=timeout)
+        return not pending
+
+    async def _deliver_reply(self, tweet: str, tweet_id: str) -> PublishedTweet:
+        reply = await self._send_reply(tweet, tweet_id)
+
+        if self._outbox is not None:
+            await asyncio.to_thread(self._outbox.confirm, tweet_id, reply)
+
+        return reply
+
+    async def _send_reply(self, tweet: str, tweet_id: str) -> PublishedTweet:
+        status_id = await self._create_tweet(
+            text=tweet,
+            in_reply_to_tweet_id=tweet_id
+        )
+
+        return PublishedTweet(status_id, tweet, None)
+
+    @tracer.traced('twitter.create_tweet')
+    async def _create_tweet(self, **params) -> str:
+        annotate(bytes=len(params['text'].encode('utf-8')))
+        for attempt in range(1, Twitter.MAX_RATE_LIMITED_ATTEMPTS + 1):
+            annotate(retries=attempt - 1)
+            await self._governor.acquire_async()
+
+            try:
+                response = await self._client.create_tweet(**params)
+            except tweepy.TooManyRequests as error:
+                self._governor.on_rate_limited(error.response.headers)
+                if attempt == Twitter.MAX_RATE_LIMITED_ATTEMPTS:
+                    raise
+                continue
+
+            self._governor.observe(response.headers)
+            return (await response.json())['data']['id']
+
+    def _schedule_thread(self, tweets: Iterable[str], tweet_id: str) -> list:
+        loop = asyncio.get_running_loop()
+        replies = [ScheduledTweet(tweet, loop.create_future()) for tweet in tweets]
+        if not replies:
+            return []
+
+        # the event loop only keeps weak references to tasks
+        task = asyncio.create_task(self._send_thread(replies, tweet_id))
+        self._reply_tasks.add(task)
+        task.add_done_callback(self._reply_tasks.discard)
+
+        return replies
+
+    async def _send_thread(self, replies: list, tweet_id: str) -> None:
+        for index, reply in enumerate(replies):
+            if reply.future.cancelled():
+                self._cancel(replies[index + 1:])
+                return
+
+            try:
+                published = await self.reply(reply.tweet, tweet_id)
+            except Exception as error:
+                self._fail(replies[index:], error)
+                return
+
+            tweet_id = published.id_
+            reply.future.set_result(published)
+
+    def _cancel(self, replies: list) -> None:
+        for reply in replies:
+            reply.future.cancel()
+
+    def _fail(self, replies: list, error: Exception) -> None:
+        for reply in replies:
+            if not reply.future.done():
+                reply.future.set_exception(error)
+
+
+class AsyncTwitterLocal(AsyncTwitter):
+    def __init__(self, config: TwitterConfig) -> None:
+        super().__init__(config)
+
+    async def _create_tweet(self, **params) -> str:
+        await self._governor.acquire_async()
+
+        return 'fake-status-id'
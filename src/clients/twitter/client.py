@@ -1,12 +1,19 @@
-import time
+from typing import Iterable
 
+import requests
 import tweepy
 
 from src.clients.twitter.config import TwitterConfig
 from src.clients.twitter.models import PublishedTweet
+from src.clients.twitter.outbox import TweetOutbox
+from src.clients.twitter.ratelimit import RateLimitGovernor, RateLimitBudget
+from src.clients.twitter.scheduler import ReplyScheduler
+from src.tracing import tracer, annotate
 
 
 class Twitter:
+    MAX_RATE_LIMITED_ATTEMPTS = 3
+
     def __init__(self, config: TwitterConfig) -> None:
         self.MAX_TWEET_LENGTH = 280
         self._consumer_key = config.consumer_key
@@ -15,31 +22,111 @@ class Twitter:
         self._access_token_secret = config.access_token_secret
         self._retweet_delay = config.retweet_delay
         self._retweet_delay_secs = config.retweet_delay_secs
+        self._async_replies = config.async_replies
+        self._scheduler = None
+        self._outbox = TweetOutbox.shared(config.outbox_path) if config.outbox_path else None
+        self._governor = RateLimitGovernor(
+            pacing=config.retweet_delay,
+            fallback_interval_secs=config.retweet_delay_secs,
+        )
 
-        self._client = tweepy.Client(
+        self._client = self._new_client()
+
+        print('Twitter Client v2 created')
+
+    def _new_client(self) -> tweepy.Client:
+        return tweepy.Client(
             consumer_key=self._consumer_key,
             consumer_secret=self._consumer_secret,
             access_token=self._access_token,
-            access_token_secret=self._access_token_secret
+            access_token_secret=self._access_token_secret,
+            return_type=requests.Response,
         )
 
-        print('Twitter Client v2 created')
-
     def post(self, tweet: str) -> PublishedTweet:
-        status = self._client.create_tweet(text=tweet)
+        status_id = self._create_tweet(text=tweet)
 
-        return PublishedTweet(status.data['id'], tweet, None)
+        return PublishedTweet(status_id, tweet, None)
 
     def reply(self, tweet: str, tweet_id: int) -> PublishedTweet:
-        if self._retweet_delay:
-            time.sleep(self._retweet_delay_secs)
+        return self._deliver_reply(tweet, tweet_id)
+
+    def rate_limit_budget(self) -> RateLimitBudget:
+        return self._governor.budget()
+
+    def reply_thread(self, tweets: Iterable[str], tweet_id: str) -> list:
+        if self._outbox is not None:
+            tweets = self._outbox.plan(tweets, tweet_id)
+
+        return self._reply_planned(tweets, tweet_id)
+
+    def resume_replies(self) -> list:
+        if self._outbox is None:
+            return []
+
+        replies = []
+        for thread in self._outbox.claim():
+            replies += self._reply_planned(thread.tweets, thread.parent_id)
+
+        return replies
+
+    def _reply_planned(self, tweets: Iterable[str], tweet_id: str) -> list:
+        if self._async_replies:
+            return self._reply_scheduler().schedule_thread(tweets, tweet_id)
 
-        status = self._client.create_tweet(
+        replies = []
+        for tweet in tweets:
+            reply = self.reply(tweet, tweet_id)
+            replies.append(reply)
+            tweet_id = reply.id_
+
+        return replies
+
+    def wait_replies(self, timeout: float = None) -> bool:
+        if self._scheduler is None:
+            return True
+
+        return self._scheduler.wait(timeout)
+
+    def _deliver_reply(self, tweet: str, tweet_id: str) -> PublishedTweet:
+        reply = self._send_reply(tweet, tweet_id)
+
+        if self._outbox is not None:
+            self._outbox.confirm(tweet_id, reply)
+
+        return reply
+
+    def _send_reply(self, tweet: str, tweet_id: str) -> PublishedTweet:
+        status_id = self._create_tweet(
             text=tweet,
             in_reply_to_tweet_id=tweet_id
         )
 
-        return PublishedTweet(status.data['id'], tweet, None)
+        return PublishedTweet(status_id, tweet, None)
+
+    @tracer.traced('twitter.create_tweet')
+    def _create_tweet(self, **params) -> str:
+        annotate(bytes=len(params['text'].encode('utf-8')))
+        for attempt in range(1, Twitter.MAX_RATE_LIMITED_ATTEMPTS + 1):
+            annotate(retries=attempt - 1)
+            self._governor.acquire()
+
+            try:
+                response = self._client.create_tweet(**params)
+            except tweepy.TooManyRequests as error:
+                self._governor.on_rate_limited(error.response.headers)
+                if attempt == Twitter.MAX_RATE_LIMITED_ATTEMPTS:
+                    raise
+                continue
+
+            self._governor.observe(response.headers)
+            return response.json()['data']['id']
+
+    def _reply_scheduler(self) -> ReplyScheduler:
+        if self._scheduler is None:
+            self._scheduler = ReplyScheduler(self._deliver_reply)
+
+        return self._scheduler
 
     @property
     def max_tweet_length(self) -> int:
@@ -50,10 +137,8 @@ class TwitterLocal(Twitter):
     def __init__(self, config: TwitterConfig) -> None:
         super().__init__(config)
 
-    def post(self, tweet: str) -> PublishedTweet:
-        return PublishedTweet('fake-status-id', tweet, None)
+    @tracer.traced('twitter.create_tweet')
+    def _create_tweet(self, **params) -> str:
+        self._governor.acquire()
 
-    def reply(self, tweet: str, tweet_id: int) -> PublishedTweet:
-        if self._retweet_delay:
-            time.sleep(self._retweet_delay_secs)
-        return PublishedTweet('fake-status-id', tweet, None)
+        return 'fake-status-id'
@@ -9,3 +9,5 @@ class TwitterConfig:
     access_token_secret: str
     retweet_delay: bool = False
     retweet_delay_secs: int = 3
+    async_replies: bool = False
+    outbox_path: str = None
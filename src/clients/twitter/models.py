@@ -1,8 +1,34 @@
+from concurrent.futures import Future
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PublishedTweet:
     id_: str
     tweet: str
     entity: object
+
+
+@dataclass(slots=True)
+class ScheduledTweet:
+    tweet: str
+    future: Future
+    entity: object = None
+
+    @property
+    def id_(self) -> str:
+        # the futures of the async client resolve on the event loop, a read
+        # from the loop cannot block until then, those replies are awaited
+        if not isinstance(self.future, Future) and not self.future.done():
+            raise RuntimeError(f'Reply still pending, await published() first: tweet={self.tweet}')
+
+        return self.future.result().id_
+
+    async def published(self) -> PublishedTweet:
+        if isinstance(self.future, Future):
+            # only coroutines wait on the event loop, the sync paths never load asyncio
+            import asyncio
+
+            return await asyncio.wrap_future(self.future)
+
+        return await self.future
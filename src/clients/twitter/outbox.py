@@ -0,0 +1,138 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from src.clients.twitter.models import PublishedTweet
+
+
+@dataclass
+class OutboxThread:
+    thread_id: str
+    parent_id: str
+    tweets: list
+
+
+class TweetOutbox:
+    # longer than the longest rate limit wait of a reply, a thread still
+    # being sent is never taken over
+    LEASE_SECS = 20 * 60
+
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str = ':memory:', lease_secs: float = LEASE_SECS) -> None:
+        # sqlite is only loaded when the outbox is configured
+        import sqlite3
+
+        self._lease_secs = lease_secs
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute(
+            'CREATE TABLE IF NOT EXISTS outbox '
+            '(thread_id TEXT NOT NULL, position INTEGER NOT NULL, tweet TEXT NOT NULL, '
+            'parent_id TEXT, published_id TEXT, planned_at REAL NOT NULL, claimed_at REAL, '
+            'PRIMARY KEY (thread_id, position))'
+        )
+        columns = [column[1] for column in self._connection.execute('PRAGMA table_info(outbox)')]
+        if 'claimed_at' not in columns:
+            self._connection.execute('ALTER TABLE outbox ADD COLUMN claimed_at REAL')
+        self._connection.commit()
+
+    @classmethod
+    def shared(cls, path: str) -> 'TweetOutbox':
+        with cls._shared_lock:
+            if path not in cls._shared:
+                cls._shared[path] = cls(path)
+            return cls._shared[path]
+
+    def plan(self, tweets: Iterable[str], tweet_id: str) -> list:
+        # threads are keyed by the tweet they reply to, only the first reply
+        # knows its parent until the previous one is confirmed
+        # the process planning a thread sends it, so it holds the claim
+        tweets = list(tweets)
+        now = time.time()
+        rows = [(tweet_id, position, tweet, tweet_id if position == 0 else None, now, now)
+                for position, tweet in enumerate(tweets)]
+
+        with self._lock:
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO outbox (thread_id, position, tweet, parent_id, planned_at, claimed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            self._connection.commit()
+
+        return tweets
+
+    def confirm(self, parent_id: str, published: PublishedTweet) -> None:
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT thread_id, position FROM outbox WHERE parent_id = ? AND published_id IS NULL '
+                'ORDER BY planned_at, position LIMIT 1',
+                (parent_id,)
+            ).fetchone()
+            if row is None:
+                return
+
+            thread_id, position = row
+            self._connection.execute(
+                'UPDATE outbox SET published_id = ? WHERE thread_id = ? AND position = ?',
+                (published.id_, thread_id, position)
+            )
+            self._connection.execute(
+                'UPDATE outbox SET parent_id = ? WHERE thread_id = ? AND position = ?',
+                (published.id_, thread_id, position + 1)
+            )
+            # every confirmed reply renews the claim of the rest of the thread
+            self._connection.execute(
+                'UPDATE outbox SET claimed_at = ? WHERE thread_id = ? AND published_id IS NULL',
+                (time.time(), thread_id)
+            )
+            self._connection.execute(
+                'DELETE FROM outbox WHERE thread_id = ? AND NOT EXISTS '
+                '(SELECT 1 FROM outbox WHERE thread_id = ? AND published_id IS NULL)',
+                (thread_id, thread_id)
+            )
+            self._connection.commit()
+
+    def pending(self) -> list:
+        with self._lock:
+            return self._pending()
+
+    def claim(self) -> list:
+        # a resume only takes the threads whose sender stopped renewing the
+        # claim, another process resuming at the same time skips the threads
+        # this one already claimed
+        now = time.time()
+        claimed = []
+        with self._lock:
+            for thread in self._pending():
+                cursor = self._connection.execute(
+                    'UPDATE outbox SET claimed_at = ? WHERE thread_id = ? AND published_id IS NULL '
+                    'AND (claimed_at IS NULL OR claimed_at <= ?)',
+                    (now, thread.thread_id, now - self._lease_secs)
+                )
+                if cursor.rowcount:
+                    claimed.append(thread)
+            self._connection.commit()
+
+        return claimed
+
+    def _pending(self) -> list:
+        rows = self._connection.execute(
+            'SELECT thread_id, tweet, parent_id FROM outbox WHERE published_id IS NULL '
+            'ORDER BY planned_at, thread_id, position'
+        ).fetchall()
+
+        threads = {}
+        for thread_id, tweet, parent_id in rows:
+            if thread_id not in threads:
+                threads[thread_id] = OutboxThread(thread_id, parent_id, [])
+            threads[thread_id].tweets.append(tweet)
+
+        return list(threads.values())
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
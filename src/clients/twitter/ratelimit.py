@@ -0,0 +1,169 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Mapping
+
+
+@dataclass
+class RateLimitBudget:
+    limit: int | None
+    remaining: int | None
+    reset_at: float | None
+    rate_per_sec: float | None
+    next_in_secs: float
+    throttled_secs: float
+    rate_limited: int
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, wait_secs: float) -> None:
+        super().__init__(f'Twitter rate limit resets in {wait_secs:.0f}s, too long to wait')
+        self.wait_secs = wait_secs
+
+
+class RateLimitGovernor:
+    MAX_BACKOFF_SECS = 15 * 60
+
+    def __init__(self,
+                 pacing: bool = False,
+                 fallback_interval_secs: float = 3,
+                 min_interval_secs: float = 1,
+                 reserve: int = 10,
+                 backoff_secs: float = 5,
+                 max_wait_secs: float = MAX_BACKOFF_SECS) -> None:
+        self._pacing = pacing
+        self._fallback_interval_secs = fallback_interval_secs
+        self._min_interval_secs = min_interval_secs
+        self._reserve_calls = reserve
+        self._backoff_secs = backoff_secs
+        self._max_wait_secs = max_wait_secs
+        self._lock = threading.Lock()
+        self._limit = None
+        self._remaining = None
+        self._reset_at = None
+        self._blocked_until = 0
+        self._last_at = None
+        self._backoffs = 0
+        self.throttled_secs = 0
+        self.rate_limited = 0
+
+    def acquire(self) -> float:
+        wait_secs = self._reserve()
+        if wait_secs > 0:
+            time.sleep(wait_secs)
+
+        return wait_secs
+
+    async def acquire_async(self) -> float:
+        # only coroutines sleep on the event loop, the sync paths never load asyncio
+        import asyncio
+
+        wait_secs = self._reserve()
+        if wait_secs > 0:
+            await asyncio.sleep(wait_secs)
+
+        return wait_secs
+
+    def observe(self, headers: Mapping) -> None:
+        limit = self._header(headers, 'x-rate-limit-limit')
+        remaining = self._header(headers, 'x-rate-limit-remaining')
+        reset_at = self._header(headers, 'x-rate-limit-reset')
+
+        with self._lock:
+            self._backoffs = 0
+            if remaining is None or reset_at is None:
+                return
+
+            self._limit = limit
+            self._remaining = remaining
+            self._reset_at = reset_at
+            if remaining <= 0:
+                self._blocked_until = max(self._blocked_until, reset_at)
+
+    def on_rate_limited(self, headers: Mapping) -> None:
+        reset_at = self._header(headers, 'x-rate-limit-reset')
+        retry_after = self._header(headers, 'retry-after')
+
+        with self._lock:
+            self.rate_limited += 1
+            self._remaining = 0
+
+            # without hints from the api the wait doubles on every 429 in a row
+            if reset_at is not None:
+                blocked_until = reset_at
+            elif retry_after is not None:
+                blocked_until = time.time() + retry_after
+            else:
+                blocked_until = time.time() + min(self._backoff_secs * 2 ** self._backoffs, self.MAX_BACKOFF_SECS)
+                self._backoffs += 1
+
+            self._reset_at = blocked_until
+            self._blocked_until = max(self._blocked_until, blocked_until)
+
+    def budget(self) -> RateLimitBudget:
+        with self._lock:
+            now = time.time()
+            interval_secs = self._interval_secs(now)
+
+            return RateLimitBudget(
+                limit=self._limit,
+                remaining=self._remaining,
+                reset_at=self._reset_at,
+                rate_per_sec=1 / interval_secs if interval_secs > 0 else float('inf'),
+                next_in_secs=max(self._blocked_until - now, self._next_in_secs(time.monotonic(), interval_secs)),
+                throttled_secs=self.throttled_secs,
+                rate_limited=self.rate_limited,
+            )
+
+    def _reserve(self) -> float:
+        with self._lock:
+            monotonic_now = time.monotonic()
+            now = time.time()
+            if self._remaining is not None and self._remaining <= 0 and self._reset_at is not None:
+                self._blocked_until = max(self._blocked_until, self._reset_at)
+
+            wait_secs = max(self._blocked_until - now, 0)
+            if wait_secs > self._max_wait_secs:
+                # a daily app limit must not hang the cli or the lambda
+                raise RateLimitExceeded(wait_secs)
+
+            if wait_secs > 0:
+                # the window resets while waiting, the next response tells
+                # the new budget
+                self._remaining = None
+            elif self._pacing:
+                wait_secs = self._next_in_secs(monotonic_now, self._interval_secs(now))
+
+            self._last_at = monotonic_now + wait_secs
+            if self._remaining is not None:
+                self._remaining -= 1
+
+            self.throttled_secs += wait_secs
+            return wait_secs
+
+    def _next_in_secs(self, monotonic_now: float, interval_secs: float) -> float:
+        if self._last_at is None:
+            return 0
+
+        return max(self._last_at + interval_secs - monotonic_now, 0)
+
+    def _interval_secs(self, now: float) -> float:
+        if self._remaining is None or self._reset_at is None or self._reset_at <= now:
+            return self._fallback_interval_secs
+
+        # with headroom the calls only keep a minimum spacing, close to the
+        # end of the budget the rest is spread over what is left of the window
+        if self._remaining > self._reserve_calls:
+            return self._min_interval_secs
+
+        return max((self._reset_at - now) / max(self._remaining, 1), self._min_interval_secs)
+
+    def _header(self, headers: Mapping, name: str) -> int | None:
+        value = headers.get(name) if headers is not None else None
+        if value is None:
+            return None
+
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return None
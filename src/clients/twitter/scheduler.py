@@ -0,0 +1,72 @@
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Iterable
+
+from src.clients.twitter.models import PublishedTweet, ScheduledTweet
+
+
+class ReplyScheduler:
+    def __init__(self, send_reply: Callable[[str, str], PublishedTweet]) -> None:
+        self._send_reply = send_reply
+        self._threads = deque()
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._worker = None
+
+    def schedule_thread(self, tweets: Iterable[str], tweet_id: str) -> list:
+        replies = [ScheduledTweet(tweet, Future()) for tweet in tweets]
+        if not replies:
+            return []
+
+        with self._lock:
+            self._threads.append((tweet_id, replies))
+
+            # the worker is not a daemon so a CLI run still waits for the
+            # thread to be sent before exiting, it stops once the queue drains
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name='twitter-replies')
+                self._worker.start()
+
+        return replies
+
+    def wait(self, timeout: float = None) -> bool:
+        with self._idle:
+            return self._idle.wait_for(lambda: self._worker is None, timeout)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._threads:
+                    self._worker = None
+                    self._idle.notify_all()
+                    return
+
+                tweet_id, replies = self._threads.popleft()
+
+            self._send_thread(tweet_id, replies)
+
+    def _send_thread(self, tweet_id: str, replies: list) -> None:
+        for index, reply in enumerate(replies):
+            if not reply.future.set_running_or_notify_cancel():
+                self._cancel(replies[index + 1:])
+                return
+
+            try:
+                published = self._send_reply(reply.tweet, tweet_id)
+            except Exception as error:
+                reply.future.set_exception(error)
+                self._fail(replies[index + 1:], error)
+                return
+
+            tweet_id = published.id_
+            reply.future.set_result(published)
+
+    def _cancel(self, replies: list) -> None:
+        for reply in replies:
+            reply.future.cancel()
+
+    def _fail(self, replies: list, error: Exception) -> None:
+        for reply in replies:
+            if reply.future.set_running_or_notify_cancel():
+                reply.future.set_exception(error)
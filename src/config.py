@@ -1,14 +1,22 @@
 import os
+from typing import TYPE_CHECKING
 
+from src.clients.http import HttpConfig
 from src.clients.spotify import SpotifyConfig
-from src.clients.twitter import TwitterConfig
-from src.clients.musixmatch import MusixmatchConfig
+
+if TYPE_CHECKING:
+    from src.clients.twitter import TwitterConfig
+    from src.clients.musixmatch import MusixmatchConfig
+    from src.watcher import WatcherConfig
+    from src.prefetch import PrefetchConfig
 
 
 class Config:
     SPOTIFY_CLIENT_ID = os.getenv('SPOTIFY_CLIENT_ID')
     SPOTIFY_CLIENT_SECRET = os.getenv('SPOTIFY_CLIENT_SECRET')
     SPOTIFY_REFRESH_TOKEN = os.getenv('SPOTIFY_REFRESH_TOKEN')
+    SPOTIFY_TOKEN_CACHE_PATH = os.getenv('SPOTIFY_TOKEN_CACHE_PATH')
+    SPOTIFY_ALBUM_CACHE_PATH = os.getenv('SPOTIFY_ALBUM_CACHE_PATH')
 
     TWITTER_CONSUMER_KEY = os.getenv('TWITTER_CONSUMER_KEY')
     TWITTER_CONSUMER_SECRET = os.getenv('TWITTER_CONSUMER_SECRET')
@@ -16,8 +24,28 @@ class Config:
     TWITTER_ACCESS_TOKEN_SECRET = os.getenv('TWITTER_ACCESS_TOKEN_SECRET')
     TWITTER_CONFIG_RETWEET_DELAY = os.getenv('TWITTER_CONFIG_RETWEET_DELAY') == 'True'
     TWITTER_CONFIG_RETWEET_DELAY_SECS = int(os.getenv('TWITTER_CONFIG_RETWEET_DELAY_SECS', 3))
+    TWITTER_CONFIG_ASYNC_REPLIES = os.getenv('TWITTER_CONFIG_ASYNC_REPLIES') == 'True'
+    TWITTER_OUTBOX_PATH = os.getenv('TWITTER_OUTBOX_PATH')
 
     MUSIXMATCH_API_KEY = os.getenv('MUSIXMATCH_API_KEY')
+    LYRIC_CACHE_PATH = os.getenv('LYRIC_CACHE_PATH')
+    LYRIC_OBJECTIVE = os.getenv('LYRIC_OBJECTIVE', 'stanza')
+
+    HTTP_POOL_CONNECTIONS = int(os.getenv('HTTP_POOL_CONNECTIONS', 4))
+    HTTP_POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 8))
+
+    WATCHER_MIN_INTERVAL_SECS = float(os.getenv('WATCHER_MIN_INTERVAL_SECS', 2))
+    WATCHER_MAX_INTERVAL_SECS = float(os.getenv('WATCHER_MAX_INTERVAL_SECS', 30))
+    WATCHER_PAUSED_INTERVAL_SECS = float(os.getenv('WATCHER_PAUSED_INTERVAL_SECS', 60))
+    WATCHER_IDLE_INTERVAL_SECS = float(os.getenv('WATCHER_IDLE_INTERVAL_SECS', 120))
+    WATCHER_LYRICS = os.getenv('WATCHER_LYRICS') == 'True'
+
+    PREFETCH_DEPTH = int(os.getenv('PREFETCH_DEPTH', 0))
+    PREFETCH_MAX_WORKERS = int(os.getenv('PREFETCH_MAX_WORKERS', 2))
+    PREFETCH_MAX_LOOKUPS_PER_HOUR = int(os.getenv('PREFETCH_MAX_LOOKUPS_PER_HOUR', 60))
+
+    TRACING_LOG = os.getenv('TRACING_LOG') == 'True'
+    METRICS_PORT = int(os.getenv('METRICS_PORT', 0))
 
     TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
     TELEGRAM_OWNER_USERNAME = os.getenv('TELEGRAM_OWNER_USERNAME')
@@ -28,10 +56,14 @@ class Config:
             Config.SPOTIFY_CLIENT_ID,
             Config.SPOTIFY_CLIENT_SECRET,
             Config.SPOTIFY_REFRESH_TOKEN,
+            Config.SPOTIFY_TOKEN_CACHE_PATH,
         )
 
     @staticmethod
-    def get_twitter_config() -> TwitterConfig:
+    def get_twitter_config() -> 'TwitterConfig':
+        # the configs import their clients, only the ones asked for are loaded
+        from src.clients.twitter import TwitterConfig
+
         return TwitterConfig(
             Config.TWITTER_CONSUMER_KEY,
             Config.TWITTER_CONSUMER_SECRET,
@@ -39,10 +71,44 @@ class Config:
             Config.TWITTER_ACCESS_TOKEN_SECRET,
             Config.TWITTER_CONFIG_RETWEET_DELAY,
             Config.TWITTER_CONFIG_RETWEET_DELAY_SECS,
+            Config.TWITTER_CONFIG_ASYNC_REPLIES,
+            Config.TWITTER_OUTBOX_PATH,
         )
 
     @staticmethod
-    def get_musixmatch_config() -> MusixmatchConfig:
+    def get_musixmatch_config() -> 'MusixmatchConfig':
+        from src.clients.musixmatch import MusixmatchConfig
+
         return MusixmatchConfig(
             Config.MUSIXMATCH_API_KEY,
         )
+
+    @staticmethod
+    def get_http_config() -> HttpConfig:
+        return HttpConfig(
+            Config.HTTP_POOL_CONNECTIONS,
+            Config.HTTP_POOL_MAXSIZE,
+        )
+
+    @staticmethod
+    def get_watcher_config() -> 'WatcherConfig':
+        from src.watcher import WatcherConfig
+
+        return WatcherConfig(
+            min_interval_secs=Config.WATCHER_MIN_INTERVAL_SECS,
+            max_interval_secs=Config.WATCHER_MAX_INTERVAL_SECS,
+            paused_interval_secs=Config.WATCHER_PAUSED_INTERVAL_SECS,
+            idle_interval_secs=Config.WATCHER_IDLE_INTERVAL_SECS,
+            lyrics=Config.WATCHER_LYRICS,
+        )
+
+    @staticmethod
+    def get_prefetch_config(lyrics: bool = True) -> 'PrefetchConfig':
+        from src.prefetch import PrefetchConfig
+
+        return PrefetchConfig(
+            depth=Config.PREFETCH_DEPTH,
+            max_workers=Config.PREFETCH_MAX_WORKERS,
+            max_lookups=Config.PREFETCH_MAX_LOOKUPS_PER_HOUR,
+            lyrics=lyrics,
+        )
@@ -1,98 +1,221 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Iterator
+
 from tweet_counter import count_tweet
 
 from src.clients.spotify import (
     Spotify,
     Album,
     Track,
-)
-from src.clients.twitter import (
-    Twitter,
-    PublishedTweet,
-)
-from src.clients.musixmatch import (
-    Musixmatch,
-    Song,
-    MusixmatchApiError,
+    Playback,
 )
 from src.templates import (
     TweetTemplate,
     TweetConfig,
     TweetSongConfig,
     TweetAlbumConfig,
+    TweetPacker,
+    LyricSplitter,
 )
+from src.tracing import tracer, propagate
 
+if TYPE_CHECKING:
+    from src.clients.twitter import Twitter, PublishedTweet
+    from src.clients.musixmatch import Musixmatch, Song, LyricCache
 
-class Gorrion:
+
+class BaseGorrion:
     def __init__(self,
                  spotify: Spotify,
-                 twitter: Twitter,
-                 musixmatch: Musixmatch) -> None:
+                 twitter: 'Twitter',
+                 musixmatch: 'Musixmatch',
+                 lyric_cache: 'LyricCache' = None,
+                 lyric_objective: str = LyricSplitter.STANZA) -> None:
+        # a bad objective fails here, before any song tweet is posted
+        LyricSplitter.check_objective(lyric_objective)
+
         self._spotify = spotify
         self._twitter = twitter
         self._musixmatch = musixmatch
+        self._lyric_cache = lyric_cache
+        self._lyric_objective = lyric_objective
+
+    def _new_song(self, album: Album) -> 'Song':
+        # musixmatch is only loaded by the commands that look up lyrics
+        from src.clients.musixmatch import Song
+
+        return Song(
+            album.tracks[0].name,
+            album.artists[0].name,
+            album.name,
+        )
+
+    def _load_cached_lyric(self, album: Album, song: 'Song') -> bool:
+        if self._lyric_cache is None:
+            return False
+
+        cached = self._lyric_cache.get(album.tracks[0].id_, song.name, song.artist)
+        if cached is None:
+            return False
+
+        song.lyric = cached.lyric
+        return True
+
+    def _cache_lyric(self, album: Album, song: 'Song') -> None:
+        if self._lyric_cache is None:
+            return
+
+        if song.lyric:
+            self._lyric_cache.put(album.tracks[0].id_, song.name, song.artist, song.lyric)
+        else:
+            self._lyric_cache.put_no_lyric(album.tracks[0].id_, song.name, song.artist)
+
+    @tracer.traced('gorrion.render')
+    def build_status(self, album: Album, config: TweetConfig):
+        template = TweetTemplate(album, config)
+
+        return template.to_tweet(self._twitter.max_tweet_length)
+
+    def is_valid_tweet_status(self, status: str) -> bool:
+        return count_tweet(status) <= self._twitter.max_tweet_length
+
+    @tracer.traced('gorrion.lyrics_to_tweets')
+    def lyrics_to_tweets(self, lyrics: list) -> list:
+        splitter = LyricSplitter(TweetPacker(self._twitter.max_tweet_length), objective=self._lyric_objective)
+
+        return list(splitter.split(lyrics))
+
+    def _tracks_to_tweets(self, tracks: Iterable[Track]) -> Iterator[str]:
+        # tracks may be a stream of album pages, every full tweet is handed
+        # out before the next page is requested
+        packer = TweetPacker(self._twitter.max_tweet_length)
+        lines = (f'{self._track_to_tweet(track)}\n' for track in tracks)
+
+        tweet = None
+        for next_tweet in packer.pack(lines):
+            if tweet is not None:
+                yield tweet
+            tweet = next_tweet
+
+        if tweet is not None:
+            yield tweet.strip()
+
+    def _track_to_tweet(self, track: Track) -> str:
+        return f'{track.disc_number}.{track.track_number}) {track.name} {self._format_duration(track.duration)}'
+
+    def _format_duration(self, duration: int) -> str:
+        seconds = int((duration / 1000) % 60)
+        minutes = int((duration / (1000 * 60)) % 60)
+
+        return f'⏳{minutes}:{seconds:02d}'
 
-    def playing(self) -> PublishedTweet:
+
+class Gorrion(BaseGorrion):
+    def __init__(self,
+                 spotify: Spotify,
+                 twitter: 'Twitter',
+                 musixmatch: 'Musixmatch',
+                 pipeline: bool = True,
+                 lyric_cache: 'LyricCache' = None,
+                 lyric_objective: str = LyricSplitter.STANZA) -> None:
+        super().__init__(spotify, twitter, musixmatch, lyric_cache, lyric_objective)
+        self._pipeline = pipeline
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gorrion') if pipeline else None
+
+    @tracer.traced('gorrion.playing')
+    def playing(self) -> 'PublishedTweet':
         current_album = self._spotify.get_current_track()
 
         return self.publish_track(current_album)
 
+    @tracer.traced('gorrion.playing_with_lyrics')
     def playing_with_lyrics(self) -> list:
-        current_album_tweet = self.playing()
+        current_album = self._spotify.get_current_track()
+
+        return self.publish_track_with_lyrics(current_album)
+
+    def playback(self) -> Playback | None:
+        return self._spotify.get_playback()
+
+    def upcoming(self, depth: int) -> list:
+        return self._spotify.get_queue()[:depth]
+
+    def get_album(self, album: Album) -> Album:
+        return self._spotify.get_album(album.id_)
+
+    @tracer.traced('gorrion.publish_track_with_lyrics')
+    def publish_track_with_lyrics(self, album: Album) -> list:
+        if not self._pipeline:
+            current_album_tweet = self.publish_track(album)
+            song = self.get_lyric(album)
+            lyrics_tweets = self.publish_lyrics(current_album_tweet, song)
+
+            return [current_album_tweet, *lyrics_tweets]
 
-        song = self.get_lyric(current_album_tweet.entity)
+        # the lyric lookup only needs the album, so it runs while the song
+        # tweet is being posted
+        song_future = self._executor.submit(propagate(self.get_lyric), album)
+
+        current_album_tweet = self.publish_track(album)
+        song = song_future.result()
         lyrics_tweets = self.publish_lyrics(current_album_tweet, song)
 
         return [current_album_tweet, *lyrics_tweets]
 
-    def playing_album(self) -> PublishedTweet:
+    @tracer.traced('gorrion.playing_album')
+    def playing_album(self) -> 'PublishedTweet':
         current_album = self._spotify.get_current_track()
 
         return self.publish_album(current_album)
 
+    @tracer.traced('gorrion.playing_album_with_tracks')
     def playing_album_with_tracks(self) -> list:
-        album = self._spotify.get_current_album()
+        album = self._spotify.get_current_album(stream_tracks=True)
         album_tweet = self.publish_album(album)
         tracks = self.publish_tracks(album_tweet)
 
         return [album_tweet, *tracks]
 
-    def get_lyric(self, album: Album) -> Song:
-        song = Song(
-            album.tracks[0].name,
-            album.artists[0].name,
-            album.name,
-        )
+    @tracer.traced('gorrion.get_lyric')
+    def get_lyric(self, album: Album) -> 'Song':
+        from src.clients.musixmatch import MusixmatchApiError, SongNotFound, SongHasNoLyrics
+
+        song = self._new_song(album)
+
+        if self._load_cached_lyric(album, song):
+            return song
 
         try:
             song = self._musixmatch.search_song(song)
             song = self._musixmatch.fetch_lyric(song)
+        except (SongNotFound, SongHasNoLyrics):
+            self._cache_lyric(album, song)
         except MusixmatchApiError:
             pass
+        else:
+            self._cache_lyric(album, song)
 
         return song
 
-    def publish_track(self, album: Album) -> PublishedTweet:
+    @tracer.traced('gorrion.publish_track')
+    def publish_track(self, album: Album) -> 'PublishedTweet':
         tweet_track = self.build_status(album, TweetSongConfig())
         tweeted_track = self._twitter.post(tweet_track)
         tweeted_track.entity = album
 
         return tweeted_track
 
-    def publish_lyrics(self, tweeted_track: PublishedTweet, song: Song) -> list:
+    @tracer.traced('gorrion.publish_lyrics')
+    def publish_lyrics(self, tweeted_track: 'PublishedTweet', song: 'Song') -> list:
         if not song.lyric:
             return []
 
-        tweet = tweeted_track
-        published_tweets = []
         lyrics = self.lyrics_to_tweets(song.lyric.content)
 
-        for lyric in lyrics:
-            tweet = self._twitter.reply(lyric, tweet.id_)
-            published_tweets.append(tweet)
+        return self._twitter.reply_thread(lyrics, tweeted_track.id_)
 
-        return published_tweets
-
-    def publish_album(self, album: Album) -> PublishedTweet:
+    @tracer.traced('gorrion.publish_album')
+    def publish_album(self, album: Album) -> 'PublishedTweet':
         tweet_album = self.build_status(album, TweetAlbumConfig())
 
         tweeted_album = self._twitter.post(tweet_album)
@@ -100,75 +223,17 @@ class Gorrion:
 
         return tweeted_album
 
-    def publish_tracks(self, tweeted_album: PublishedTweet) -> list:
+    @tracer.traced('gorrion.publish_tracks')
+    def publish_tracks(self, tweeted_album: 'PublishedTweet') -> list:
         album = tweeted_album.entity
 
-        tweet = tweeted_album
-        published_tweets = []
         tracks = self._tracks_to_tweets(album.tracks)
 
-        for track in tracks:
-            tweet = self._twitter.reply(track, tweet.id_)
-            published_tweets.append(tweet)
-
-        return published_tweets
+        return self._twitter.reply_thread(tracks, tweeted_album.id_)
 
-    def build_status(self, album: Album, config: TweetConfig):
-        template = TweetTemplate(album, config)
-        tweet_status = template.to_tweet()
-
-        if not self.is_valid_tweet_status(tweet_status):
-            config.footer_config.with_artists_hashtag = False
-            template = TweetTemplate(album, config)
-            tweet_status = template.to_tweet()
-
-        return tweet_status
-
-    def is_valid_tweet_status(self, status: str) -> bool:
-        return count_tweet(status) <= self._twitter.max_tweet_length
-
-    def lyrics_to_tweets(self, lyrics: list) -> list:
-        lyric_tweets = []
-        for paragraph in lyrics:
-            if self.is_valid_tweet_status(paragraph):
-                lyric_tweets.append(paragraph)
-            else:
-                lines = paragraph.split('\n')
-                lines_group = self._chunks(lines, 4)
-                new_paragraphs = ['\n'.join(new_paragraph)
-                                  for new_paragraph in lines_group]
-                lyric_tweets += new_paragraphs
-
-        return lyric_tweets
-
-    def _tracks_to_tweets(self, tracks: list) -> list:
-        track_tweets = []
-
-        tweet = ''
-        for track in tracks:
-            tweet_content = self._track_to_tweet(track)
-            if self.is_valid_tweet_status(tweet + tweet_content + '\n'):
-                tweet += tweet_content + '\n'
-            else:
-                track_tweets.append(tweet)
-                tweet = tweet_content + '\n'
-
-        if tweet:
-            track_tweets.append(tweet)
-
-        track_tweets[-1] = track_tweets[-1].strip()
-
-        return track_tweets
-
-    def _track_to_tweet(self, track: Track) -> str:
-        return f'{track.disc_number}.{track.track_number}) {track.name} {self._format_duration(track.duration)}'
-
-    def _format_duration(self, duration: int) -> str:
-        seconds = int((duration / 1000) % 60)
-        minutes = int((duration / (1000 * 60)) % 60)
-
-        return f'⏳{minutes}:{seconds:02d}'
+    @tracer.traced('gorrion.resume_replies')
+    def resume_replies(self) -> list:
+        return self._twitter.resume_replies()
 
-    def _chunks(self, elements: list, size: int) -> list:
-        return [elements[element:element + size]
-                for element in range(0, len(elements), size)]
+    def wait_replies(self, timeout: float = None) -> bool:
+        return self._twitter.wait_replies(timeout)
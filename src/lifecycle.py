@@ -0,0 +1,48 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+
+class Lifecycle:
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._resources = {}
+        self._lock = threading.Lock()
+        self._invocations = 0
+        self._init_secs = 0
+        self.timings = deque(maxlen=128)
+
+    @property
+    def invocations(self) -> int:
+        return self._invocations
+
+    def resource(self, key: str, factory: Callable[[], object]) -> object:
+        # built on the first (cold) invocation and kept for as long as the
+        # container stays warm
+        with self._lock:
+            if key not in self._resources:
+                started_at = time.perf_counter()
+                self._resources[key] = factory()
+                self._init_secs += time.perf_counter() - started_at
+            return self._resources[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._resources.clear()
+
+    @contextmanager
+    def invocation(self) -> Iterator[bool]:
+        cold = not self._resources
+        self._init_secs = 0
+        started_at = time.perf_counter()
+
+        try:
+            yield cold
+        finally:
+            total_secs = time.perf_counter() - started_at
+            self._invocations += 1
+            self.timings.append((cold, self._init_secs, total_secs))
+            print(f'{self._name} {"cold" if cold else "warm"} invocation #{self._invocations}: '
+                  f'init={self._init_secs * 1000:.1f}ms total={total_secs * 1000:.1f}ms')
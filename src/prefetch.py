@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from src.clients.spotify import Album
+from src.gorrion import Gorrion
+
+if TYPE_CHECKING:
+    from src.async_gorrion import AsyncGorrion
+
+
+@dataclass
+class PrefetchConfig:
+    depth: int = 2
+    max_workers: int = 2
+    max_lookups: int = 60
+    window_secs: float = 3600
+    lyrics: bool = True
+    albums: bool = True
+
+
+class BasePrefetcher:
+    MAX_SEEN = 256
+
+    def __init__(self, gorrion: 'Gorrion | AsyncGorrion', config: PrefetchConfig = None) -> None:
+        self._gorrion = gorrion
+        self._config = config if config is not None else PrefetchConfig()
+        self._lock = threading.Lock()
+        self._seen = OrderedDict()
+        self._lookups = deque()
+        self.skipped = 0
+
+    def _fetches(self, upcoming: list) -> list:
+        fetches = []
+        for album in upcoming:
+            if self._config.lyrics:
+                fetches += self._reserve(f'lyric:{album.tracks[0].id_}', self._gorrion.get_lyric, album)
+            if self._config.albums:
+                fetches += self._reserve(f'album:{album.id_}', self._gorrion.get_album, album)
+
+        return fetches
+
+    def _reserve(self, key: str, fetch: Callable[[Album], object], album: Album) -> list:
+        # every queued item is fetched once, and never more than max_lookups
+        # per window so a long queue can not burn the api quotas
+        with self._lock:
+            if key in self._seen:
+                self._seen.move_to_end(key)
+                return []
+            if not self._acquire_lookup():
+                self.skipped += 1
+                return []
+
+            self._seen[key] = True
+            while len(self._seen) > BasePrefetcher.MAX_SEEN:
+                self._seen.popitem(last=False)
+
+        return [(key, fetch, album)]
+
+    def _acquire_lookup(self) -> bool:
+        now = time.monotonic()
+        while self._lookups and self._lookups[0] <= now - self._config.window_secs:
+            self._lookups.popleft()
+
+        if len(self._lookups) >= self._config.max_lookups:
+            return False
+
+        self._lookups.append(now)
+        return True
+
+    def _release(self, key: str, error: Exception) -> None:
+        # a failed lookup is tried again the next time the item is queued
+        with self._lock:
+            self._seen.pop(key, None)
+        print(f'Prefetch of {key} failed: {error}')
+
+
+class Prefetcher(BasePrefetcher):
+    def __init__(self, gorrion: Gorrion, config: PrefetchConfig = None) -> None:
+        super().__init__(gorrion, config)
+        self._executor = ThreadPoolExecutor(max_workers=self._config.max_workers, thread_name_prefix='prefetch')
+        self._futures = []
+
+    def prefetch(self) -> list:
+        if self._config.depth <= 0:
+            return []
+
+        try:
+            upcoming = self._gorrion.upcoming(self._config.depth)
+        except Exception as error:
+            print(f'Prefetch failed to read the queue: {error}')
+            return []
+
+        futures = [self._executor.submit(self._fetch, *fetch) for fetch in self._fetches(upcoming)]
+
+        with self._lock:
+            self._futures = [future for future in self._futures if not future.done()] + futures
+
+        return futures
+
+    def wait(self, timeout: float = None) -> bool:
+        with self._lock:
+            futures = list(self._futures)
+
+        _, not_done = wait(futures, timeout)
+        return not not_done
+
+    def _fetch(self, key: str, fetch: Callable[[Album], object], album: Album) -> object:
+        try:
+            return fetch(album)
+        except Exception as error:
+            self._release(key, error)
+
+
+class AsyncPrefetcher(BasePrefetcher):
+    def __init__(self, gorrion: 'AsyncGorrion', config: PrefetchConfig = None) -> None:
+        super().__init__(gorrion, config)
+        self._semaphore = None
+        self._tasks = set()
+
+    async def prefetch(self) -> list:
+        # asyncio is only loaded by the async bot, the sync prefetcher runs
+        # on threads
+        import asyncio
+
+        if self._config.depth <= 0:
+            return []
+
+        try:
+            upcoming = await self._gorrion.upcoming(self._config.depth)
+        except Exception as error:
+            print(f'Prefetch failed to read the queue: {error}')
+            return []
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._config.max_workers)
+
+        tasks = [asyncio.create_task(self._fetch(*fetch)) for fetch in self._fetches(upcoming)]
+        self._tasks.update(tasks)
+        for task in tasks:
+            task.add_done_callback(self._tasks.discard)
+
+        return tasks
+
+    async def wait(self, timeout: float = None) -> bool:
+        import asyncio
+
+        if not self._tasks:
+            return True
+
+        _, not_done = await asyncio.wait(list(self._tasks), timeout=timeout)
+        return not not_done
+
+    async def _fetch(self, key: str, fetch: Callable[[Album], Awaitable], album: Album) -> object:
+        async with self._semaphore:
+            try:
+                return await fetch(album)
+            except Exception as error:
+                self._release(key, error)
@@ -2,14 +2,28 @@ from telegram import Bot, Update
 
 from src.gorrion import Gorrion
 from src.config import Config
-from src.clients.spotify import Spotify, SpotifyApiError
-from src.clients.twitter import Twitter, TwitterLocal
-from src.clients.musixmatch import Musixmatch
+from src.clients.http import shared_session
+from src.clients.spotify import Spotify, AlbumCache, SpotifyApiError
+from src.lifecycle import Lifecycle
+from src import tracing
+
+
+lifecycle = Lifecycle('telegram_bot')
+
+
+def command_errors() -> tuple:
+    # the twitter package loads with the first command, its errors are
+    # looked up once a command fails
+    from src.clients.twitter import RateLimitExceeded
+
+    return SpotifyApiError, RateLimitExceeded
 
 
 class TelegramBot:
-    def __init__(self) -> None:
+    def __init__(self, gorrion: Gorrion = None) -> None:
         self._bot = Bot(token=Config.TELEGRAM_TOKEN)
+        self._gorrion = gorrion
+        self._prefetcher = None
 
     def process_event(self, event: dict) -> None:
         update = Update.de_json(event, self._bot)
@@ -20,25 +34,29 @@ class TelegramBot:
         if not self._is_event_valid(event, chat_id, text):
             return
 
+        gorrion = self._get_gorrion()
         try:
-            gorrion = self._build_gorrion(False, False)
             if text == '/playing':
                 self.playing(chat_id, gorrion)
-                return
-            if text == '/lyric':
+            elif text == '/lyric':
                 self.playing_with_lyrics(chat_id, gorrion)
-                return
-            if text == '/album':
+            elif text == '/album':
                 self.playing_album(chat_id, gorrion)
-                return
-            if text == '/tracks':
+            elif text == '/tracks':
                 self.playing_album_with_tracks(chat_id, gorrion)
-                return
-        except SpotifyApiError as error:
+        except command_errors() as error:
             self._bot.send_message(
                 chat_id=chat_id,
                 text=f'{error}',
             )
+        else:
+            # a failing command means spotify is down, the queue is not read
+            # until it answers again
+            self._prefetch(gorrion)
+        finally:
+            # lambda freezes the process once the handler returns, so
+            # scheduled replies have to be out before that
+            gorrion.wait_replies()
 
     def start(self, chat_id: str) -> None:
         self._bot.send_message(
@@ -122,16 +140,48 @@ class TelegramBot:
             text='Sorry 💔. I can only chat with my creator 🧙🏼.'
         )
 
+    def warm_up(self) -> None:
+        self._get_gorrion()
+
+    def _get_gorrion(self) -> Gorrion:
+        if self._gorrion is None:
+            self._gorrion = self._build_gorrion(False, False)
+
+        return self._gorrion
+
+    def _prefetch(self, gorrion: Gorrion) -> None:
+        # the answer is already sent, the rest of the invocation warms the
+        # caches for the songs queued next
+        if self._prefetcher is None:
+            from src.prefetch import Prefetcher
+
+            self._prefetcher = Prefetcher(gorrion, Config.get_prefetch_config())
+
+        self._prefetcher.prefetch()
+        self._prefetcher.wait()
+
     def _build_gorrion(self, local_mode: bool, delay_mode: bool) -> Gorrion:
-        spotify = Spotify(Config.get_spotify_config())
-        musixmatch = Musixmatch(Config.get_musixmatch_config())
+        # the clients load when the first command builds gorrion, not when
+        # the handler module is imported
+        from src.clients.twitter import Twitter, TwitterLocal
+        from src.clients.musixmatch import Musixmatch, LyricCache
+
+        session = shared_session(Config.get_http_config())
+        spotify = Spotify(
+            Config.get_spotify_config(),
+            session=session,
+            album_cache=AlbumCache.shared(Config.SPOTIFY_ALBUM_CACHE_PATH),
+        )
+        musixmatch = Musixmatch(Config.get_musixmatch_config(), session)
 
         twitter_config = Config.get_twitter_config()
         twitter_config.retweet_delay = delay_mode
         twitter = (TwitterLocal(twitter_config)
                    if local_mode else Twitter(twitter_config))
 
-        return Gorrion(spotify, twitter, musixmatch)
+        lyric_cache = LyricCache.shared(Config.LYRIC_CACHE_PATH)
+
+        return Gorrion(spotify, twitter, musixmatch, lyric_cache=lyric_cache, lyric_objective=Config.LYRIC_OBJECTIVE)
 
     def _is_event_valid(self, event: dict, chat_id: str, text: str) -> bool:
         if not self._is_telegram_owner_sending(event):
@@ -162,13 +212,22 @@ class TelegramBot:
         return Config.TELEGRAM_OWNER_USERNAME == event.get('message', {}).get('from', {}).get('username', '')
 
 
+def _new_telegram_bot() -> TelegramBot:
+    tracing.configure(log=Config.TRACING_LOG)
+    telegram_bot = TelegramBot()
+    telegram_bot.warm_up()
+
+    return telegram_bot
+
+
 def do_work(event, context) -> dict:
-    try:
-        print('EVENT', event)
-        telegram_bot = TelegramBot()
-        telegram_bot.process_event(event)
-    except Exception as error:
-        print('ERROR', error)
+    with lifecycle.invocation():
+        try:
+            print('EVENT', event)
+            telegram_bot = lifecycle.resource('telegram_bot', _new_telegram_bot)
+            telegram_bot.process_event(event)
+        except Exception as error:
+            print('ERROR', error)
 
     return {
         'status_code': 200,
@@ -9,30 +9,57 @@ from telegram.ext import (
     filters,
 )
 
-from src.gorrion import Gorrion
+from src.async_gorrion import AsyncGorrion
 from src.config import Config
-from src.clients.spotify import Spotify, NotPlayingError
-from src.clients.twitter import Twitter, TwitterLocal
-from src.clients.musixmatch import Musixmatch
+from src.clients.http import new_async_client
+from src.clients.spotify import AsyncSpotify, AlbumCache, NotPlayingError
+from src.clients.twitter import AsyncTwitter, AsyncTwitterLocal
+from src.clients.musixmatch import AsyncMusixmatch, LyricCache
+from src.lifecycle import Lifecycle
+from src.prefetch import AsyncPrefetcher
+from src import tracing
 
 
-application = ApplicationBuilder().token(Config.TELEGRAM_TOKEN).build()
+lifecycle = Lifecycle('telegram_bot_v2')
+_application = None
+_loop = None
 
 
-def _new_gorrion(local_mode: bool, delay_mode: bool) -> Gorrion:
-    spotify = Spotify(Config.get_spotify_config())
-    musixmatch = Musixmatch(Config.get_musixmatch_config())
+def get_application() -> Application:
+    global _application
+
+    # built on first use so importing the module needs neither a token nor
+    # the bot setup
+    if _application is None:
+        _application = ApplicationBuilder().token(Config.TELEGRAM_TOKEN).concurrent_updates(True).build()
+
+    return _application
+
+
+def _new_gorrion(local_mode: bool, delay_mode: bool) -> AsyncGorrion:
+    client = new_async_client(Config.get_http_config())
+    spotify = AsyncSpotify(
+        Config.get_spotify_config(),
+        client,
+        album_cache=AlbumCache.shared(Config.SPOTIFY_ALBUM_CACHE_PATH),
+    )
+    musixmatch = AsyncMusixmatch(Config.get_musixmatch_config(), client)
 
     twitter_config = Config.get_twitter_config()
     twitter_config.retweet_delay = delay_mode
-    twitter = (TwitterLocal(twitter_config) if local_mode else Twitter(twitter_config))
+    if local_mode:
+        twitter_config.outbox_path = None
+    twitter = (AsyncTwitterLocal(twitter_config) if local_mode else AsyncTwitter(twitter_config))
 
-    return Gorrion(spotify, twitter, musixmatch)
+    lyric_cache = LyricCache.shared(Config.LYRIC_CACHE_PATH)
+
+    return AsyncGorrion(spotify, twitter, musixmatch, lyric_cache=lyric_cache, lyric_objective=Config.LYRIC_OBJECTIVE)
 
 
 class TelegramBot:
-    def __init__(self, gorrion: Gorrion) -> None:
+    def __init__(self, gorrion: AsyncGorrion, prefetcher: AsyncPrefetcher = None) -> None:
         self._gorrion = gorrion
+        self._prefetcher = prefetcher
         self._commands = ['/start', '/playing', '/lyric', '/album', '/tracks', '/about']
 
     async def start(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -40,12 +67,13 @@ class TelegramBot:
         await self._send_message(update, context, f'Supported commands are: \n\n{"\n".join(self._commands)}')
 
     async def playing(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        song = self._gorrion.playing()
+        song = await self._gorrion.playing()
 
         await self._send_message(update, context, song.tweet)
+        await self._prefetch()
 
     async def playing_with_lyrics(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        tweets = self._gorrion.playing_with_lyrics()
+        tweets = await self._gorrion.playing_with_lyrics()
         song, *lyrics = tweets
 
         await self._send_message(update, context, song.tweet)
@@ -54,13 +82,16 @@ class TelegramBot:
             for lyric in lyrics:
                 await self._send_message(update, context, lyric.tweet)
 
+        await self._prefetch()
+
     async def playing_album(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        song = self._gorrion.playing_album()
+        song = await self._gorrion.playing_album()
 
         await self._send_message(update, context, song.tweet)
+        await self._prefetch()
 
     async def playing_album_with_tracks(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        tweets = self._gorrion.playing_album_with_tracks()
+        tweets = await self._gorrion.playing_album_with_tracks()
         album, *tracks = tweets
 
         await self._send_message(update, context, album.tweet)
@@ -69,6 +100,8 @@ class TelegramBot:
             for track in tracks:
                 await self._send_message(update, context, track.tweet)
 
+        await self._prefetch()
+
     async def about(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         await self._send_message(update, context, 'Made with ❤️ by @juanitodread')
 
@@ -76,6 +109,19 @@ class TelegramBot:
         commands = '\n'.join(self._commands)
         await self._send_message(update, context, f'I can only reply to you based on the commands: \n\n{commands}')
 
+    async def wait(self) -> None:
+        # lambda freezes the process once the handler returns, so scheduled
+        # replies and prefetches have to be done before that
+        await self._gorrion.wait_replies()
+        if self._prefetcher is not None:
+            await self._prefetcher.wait()
+
+    async def _prefetch(self) -> None:
+        # only reached once the command answered, a failing command goes to
+        # the error handler and leaves the queue alone
+        if self._prefetcher is not None:
+            await self._prefetcher.prefetch()
+
     async def _send_message(self, update: Update | object, context: ContextTypes.DEFAULT_TYPE, message: str) -> None:
         if not self._is_bot_owner(update.effective_chat.username):
             await context.bot.send_message(
@@ -104,48 +150,68 @@ class TelegramBot:
 
 def _setup_app(app: Application, bot: TelegramBot) -> Application:
     start_handler = CommandHandler('start', bot.start)
-    application.add_handler(start_handler)
+    app.add_handler(start_handler)
 
     playing_handler = CommandHandler('playing', bot.playing)
-    application.add_handler(playing_handler)
+    app.add_handler(playing_handler)
 
     lyric_handler = CommandHandler('lyric', bot.playing_with_lyrics)
-    application.add_handler(lyric_handler)
+    app.add_handler(lyric_handler)
 
     album_handler = CommandHandler('album', bot.playing_album)
-    application.add_handler(album_handler)
+    app.add_handler(album_handler)
 
     tracks_handler = CommandHandler('tracks', bot.playing_album_with_tracks)
-    application.add_handler(tracks_handler)
+    app.add_handler(tracks_handler)
 
     about_handler = CommandHandler('about', bot.about)
-    application.add_handler(about_handler)
+    app.add_handler(about_handler)
 
     any_other_message_handler = MessageHandler(filters.TEXT & (~filters.COMMAND), bot.any_other_message)
-    application.add_handler(any_other_message_handler)
+    app.add_handler(any_other_message_handler)
 
-    application.add_error_handler(bot._on_error)
+    app.add_error_handler(bot._on_error)
 
     return app
 
 
 def _do_work_local(event, context) -> None:
+    tracing.configure(log=Config.TRACING_LOG, metrics_port=Config.METRICS_PORT)
     gorrion = _new_gorrion(local_mode=True, delay_mode=False)
-    bot = TelegramBot(gorrion)
+    bot = TelegramBot(gorrion, AsyncPrefetcher(gorrion, Config.get_prefetch_config()))
 
-    app = _setup_app(application, bot)
+    app = _setup_app(get_application(), bot)
     app.run_polling(allowed_updates=Update.ALL_TYPES)
 
 
-async def _do_work_lambda(event, context) -> dict:
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+
+    # the loop outlives invocations, the http clients and the application
+    # built on it are reused while the container is warm
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+        lifecycle.clear()
+
+    return _loop
+
+
+async def _new_lambda_app() -> tuple:
+    tracing.configure(log=Config.TRACING_LOG)
     gorrion = _new_gorrion(local_mode=False, delay_mode=False)
-    bot = TelegramBot(gorrion)
+    bot = TelegramBot(gorrion, AsyncPrefetcher(gorrion, Config.get_prefetch_config()))
+
+    app = _setup_app(get_application(), bot)
+    await app.initialize()
 
-    app = _setup_app(application, bot)
+    return app, bot
 
+
+async def _do_work_lambda(app: Application, bot: TelegramBot, event: dict) -> dict:
     try:
-        await app.initialize()
         await app.process_update(Update.de_json(event, app.bot))
+        await bot.wait()
     except Exception as error:
         print(f'Error: {error}')
 
@@ -159,7 +225,11 @@ def do_work(event, context):
     print(f'Event: {event}')
 
     # run in lambda
-    return asyncio.get_event_loop().run_until_complete(_do_work_lambda(event, context))
+    with lifecycle.invocation():
+        loop = _get_loop()
+        app, bot = lifecycle.resource('application', lambda: loop.run_until_complete(_new_lambda_app()))
+
+        return loop.run_until_complete(_do_work_lambda(app, bot, event))
 
     # run in local
     # _do_work_local(event, context)
@@ -1,3 +1,5 @@
 # flake8: noqa
 from src.templates.config import TweetConfig, TweetAlbumConfig, TweetSongConfig
 from src.templates.twitter import TweetTemplate
+from src.templates.packing import TweetPacker
+from src.templates.lyric import LyricSplitter
@@ -0,0 +1,36 @@
+import re
+import unicodedata
+from functools import lru_cache
+
+
+NON_WORD_PATTERN = re.compile(r'\W+')
+SEPARATOR_PATTERN = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=4096)
+def build_hashtag(text: str) -> str:
+    if not text:
+        return ''
+
+    words = SEPARATOR_PATTERN.split(unicodedata.normalize('NFC', text))
+
+    hashtags = []
+    for word in words:
+        word = _remove_non_word(word)
+        word = (word.capitalize() if len(word) > 0 and word[0].islower()
+                else word)
+        hashtags.append(word)
+
+    hashtags = ''.join(hashtags)
+
+    return f'#{hashtags}'
+
+
+def _remove_non_word(word: str) -> str:
+    if word.isascii():
+        return NON_WORD_PATTERN.sub('', word)
+
+    # \W drops combining marks, which are part of words in scripts such as
+    # Devanagari and in names written with decomposed accents
+    return ''.join(char for char in word
+                   if char == '_' or unicodedata.category(char)[0] in 'LNM')
@@ -0,0 +1,154 @@
+from itertools import islice
+from typing import Iterable, Iterator
+
+from src.templates.packing import TweetPacker
+
+
+class LyricSplitter:
+    STANZA = 'stanza'
+    FEWEST = 'fewest'
+    BALANCED = 'balanced'
+    OBJECTIVES = (STANZA, FEWEST, BALANCED)
+
+    def __init__(self, packer: TweetPacker, lines_per_tweet: int = 4, objective: str = STANZA) -> None:
+        LyricSplitter.check_objective(objective)
+
+        self._packer = packer
+        self._lines_per_tweet = lines_per_tweet
+        self._objective = objective
+
+    @staticmethod
+    def check_objective(objective: str) -> None:
+        if objective not in LyricSplitter.OBJECTIVES:
+            raise ValueError(f'Invalid lyric objective: {objective}. Use: {LyricSplitter.OBJECTIVES}')
+
+    def split(self, paragraphs: Iterable[str]) -> Iterator[str]:
+        # a blank status is rejected by twitter in the middle of a thread
+        paragraphs = (paragraph for paragraph in paragraphs if paragraph.strip())
+        if self._objective == LyricSplitter.STANZA:
+            yield from self._split_stanzas(paragraphs)
+            return
+
+        # stanzas that fit are joined with their neighbours, the lines of a
+        # stanza that does not fit only share tweets among themselves
+        stanzas = []
+        for paragraph in paragraphs:
+            if self._packer.fits(paragraph):
+                stanzas.append(paragraph)
+                continue
+
+            yield from self._fill(stanzas, '\n\n')
+            stanzas = []
+
+            lines = [fragment for line in self._lines(paragraph) for fragment in self._split_line(line)]
+            yield from self._fill(lines, '\n')
+
+        yield from self._fill(stanzas, '\n\n')
+
+    def _split_stanzas(self, paragraphs: Iterable[str]) -> Iterator[str]:
+        for paragraph in paragraphs:
+            if self._packer.fits(paragraph):
+                yield paragraph
+                continue
+
+            lines = iter(self._lines(paragraph))
+            while group := list(islice(lines, self._lines_per_tweet)):
+                yield from self._split_group(group)
+
+    def _lines(self, paragraph: str) -> list:
+        # blank lines, and the ones left empty by a stripped repeat marker,
+        # would end up as blank tweets next to a line over budget
+        return [line.strip() for line in paragraph.split('\n') if line.strip()]
+
+    def _split_group(self, lines: list) -> Iterator[str]:
+        group = '\n'.join(lines)
+        if self._packer.fits(group):
+            yield group
+            return
+
+        # lines that still do not fit are packed one by one, and the ones
+        # over budget on their own are cut on words
+        fragments = (f'{fragment}\n' for line in lines for fragment in self._split_line(line))
+        for tweet in self._packer.pack(fragments):
+            yield tweet[:-1]
+
+    def _split_line(self, line: str) -> Iterator[str]:
+        if self._packer.fits(line):
+            yield line
+            return
+
+        words = (piece for word in line.split() for piece in self._split_word(word))
+        for fragment in self._packer.pack(f'{word} ' for word in words):
+            yield fragment[:-1]
+
+    def _split_word(self, word: str) -> Iterator[str]:
+        if self._packer.fits(word):
+            yield word
+            return
+
+        yield from self._packer.pack(word)
+
+    def _fill(self, units: list, separator: str) -> Iterator[str]:
+        if not units:
+            return
+
+        weights = [self._packer.weight(unit) for unit in units]
+        groups = self._fewest_groups(weights, len(separator))
+        if self._objective == LyricSplitter.BALANCED and len(groups) > 1:
+            groups = self._balanced_groups(weights, len(separator), len(groups))
+
+        for start, end in groups:
+            yield separator.join(units[start:end])
+
+    def _fewest_groups(self, weights: list, separator_weight: int) -> list:
+        # filling every tweet before starting the next one gives the fewest
+        # tweets for units that keep their order
+        groups = []
+        start = 0
+        group_weight = weights[0]
+        for index in range(1, len(weights)):
+            if group_weight + separator_weight + weights[index] > self._packer.max_length:
+                groups.append((start, index))
+                start = index
+                group_weight = weights[index]
+            else:
+                group_weight += separator_weight + weights[index]
+
+        groups.append((start, len(weights)))
+        return groups
+
+    def _balanced_groups(self, weights: list, separator_weight: int, count: int) -> list:
+        # same number of tweets as the fewest split, with the smallest sum of
+        # squared tweet weights so none of them is left almost empty
+        prefix = [0]
+        for weight in weights:
+            prefix.append(prefix[-1] + weight)
+
+        def group_weight(start: int, end: int) -> int:
+            return prefix[end] - prefix[start] + separator_weight * (end - start - 1)
+
+        size = len(weights)
+        infinity = float('inf')
+        costs = [[infinity] * (size + 1) for _ in range(count + 1)]
+        starts = [[0] * (size + 1) for _ in range(count + 1)]
+        costs[0][0] = 0
+
+        for groups in range(1, count + 1):
+            for end in range(groups, size + 1):
+                for start in range(end - 1, groups - 2, -1):
+                    weight = group_weight(start, end)
+                    if weight > self._packer.max_length:
+                        break
+                    cost = costs[groups - 1][start] + weight * weight
+                    if cost < costs[groups][end]:
+                        costs[groups][end] = cost
+                        starts[groups][end] = start
+
+        bounds = []
+        end = size
+        for groups in range(count, 0, -1):
+            start = starts[groups][end]
+            bounds.append((start, end))
+            end = start
+
+        return bounds[::-1]
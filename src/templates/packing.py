@@ -0,0 +1,38 @@
+from typing import Iterable, Iterator
+
+from tweet_counter import count_tweet
+
+
+class TweetPacker:
+    def __init__(self, max_length: int) -> None:
+        self._max_length = max_length
+
+    @property
+    def max_length(self) -> int:
+        return self._max_length
+
+    def weight(self, text: str) -> int:
+        return count_tweet(text)
+
+    def fits(self, text: str) -> bool:
+        return self.weight(text) <= self._max_length
+
+    def pack(self, fragments: Iterable[str]) -> Iterator[str]:
+        # urls and wide characters never span a line break, so the weight of
+        # newline terminated fragments adds up to the weight of their join
+        tweet = []
+        tweet_weight = 0
+
+        for fragment in fragments:
+            fragment_weight = self.weight(fragment)
+
+            if tweet and tweet_weight + fragment_weight > self._max_length:
+                yield ''.join(tweet)
+                tweet = []
+                tweet_weight = 0
+
+            tweet.append(fragment)
+            tweet_weight += fragment_weight
+
+        if tweet:
+            yield ''.join(tweet)
@@ -1,4 +1,4 @@
-import re
+from tweet_counter import count_tweet
 
 from src.clients.spotify import Album
 from src.templates.config import (
@@ -6,6 +6,7 @@ from src.templates.config import (
     TweetBodyConfig,
     TweetFooterConfig,
 )
+from src.templates.hashtag import build_hashtag
 
 
 class TweetTemplate:
@@ -13,12 +14,20 @@ class TweetTemplate:
         self._album = album
         self._config = config
 
-    def to_tweet(self) -> str:
-        return (
-            f'{self.header()}'
-            f'{self.body()}'
-            f'{self.footer()}'
-        )
+    def to_tweet(self, max_length: int = None) -> str:
+        if max_length is None:
+            return (
+                f'{self.header()}'
+                f'{self.body()}'
+                f'{self.footer()}'
+            )
+
+        content = f'{self.header()}{self.body()}'
+        if not self._config.with_footer:
+            return content
+
+        footer = FooterTemplate(self._album, self._config.footer_config)
+        return f'{content}{footer.to_footer(max_length - count_tweet(content))}'
 
     def header(self) -> str:
         return 'Now listening 🔊🎶:\n\n' if self._config.with_header else ''
@@ -85,12 +94,18 @@ class FooterTemplate:
         self._album = album
         self._config = config
 
-    def to_footer(self) -> str:
-        return (
-            f'{self.hashtags()}'
-            f'{self.song_media_link()}'
-            f'{self.album_media_link()}'
-        )
+    def to_footer(self, max_length: int = None) -> str:
+        if max_length is None:
+            return (
+                f'{self.hashtags()}'
+                f'{self.song_media_link()}'
+                f'{self.album_media_link()}'
+            )
+
+        links = f'{self.song_media_link()}{self.album_media_link()}'
+        hashtags = self._fit_hashtags(max_length - count_tweet(links))
+
+        return f'{hashtags}{links}'
 
     def hashtags(self) -> str:
         hashtags = (
@@ -116,6 +131,36 @@ class FooterTemplate:
                             for artist in self._album.artists]
         return ' '.join(artists_hashtags)
 
+    def _fit_hashtags(self, max_length: int) -> str:
+        gorrion_hashtags = self.gorrion_hashtags().split()
+        album_hashtags = self.album_hashtags().split()
+        artists_hashtags = self.artists_hashtags().split()
+        hashtags = [*gorrion_hashtags, *album_hashtags, *artists_hashtags]
+
+        # optional hashtags are dropped in this order, artists from the last
+        # one so the main artists are kept
+        optional = list(range(len(hashtags) - 1, len(gorrion_hashtags) - 1, -1))
+
+        weights = [count_tweet(hashtag) for hashtag in hashtags]
+        kept = [True] * len(hashtags)
+        kept_count = len(hashtags)
+        kept_weight = sum(weights)
+
+        for index in optional:
+            if self._hashtags_weight(kept_weight, kept_count) <= max_length:
+                break
+
+            kept[index] = False
+            kept_count -= 1
+            kept_weight -= weights[index]
+
+        line = ' '.join(hashtag for hashtag, keep in zip(hashtags, kept) if keep)
+        return f'{line}\n\n' if line else ''
+
+    def _hashtags_weight(self, weight: int, count: int) -> int:
+        # hashtags are joined by single spaces and followed by a blank line
+        return weight + count + 1 if count else 0
+
     def song_media_link(self) -> str:
         return (f'{self._album.tracks[0].public_url}'
                 if self._config.with_song_media_link else '')
@@ -125,18 +170,4 @@ class FooterTemplate:
                 if self._config.with_album_media_link else '')
 
     def _build_hashtag(self, text: str) -> str:
-        if not text or len(text) == 0:
-            return ''
-
-        words = text.split(' ')
-
-        hashtags = []
-        for word in words:
-            word = re.sub(r'\W+', '', word)
-            word = (word.capitalize() if len(word) > 0 and word[0].islower()
-                    else word)
-            hashtags.append(word)
-
-        hashtags = ''.join(hashtags)
-
-        return f'#{hashtags}'
+        return build_hashtag(text)
@@ -0,0 +1,285 @@
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Iterator
+
+
+@dataclass(slots=True)
+class Span:
+    name: str
+    trace_id: int
+    span_id: int
+    parent_id: int | None
+    started_at: float
+    duration_secs: float = 0
+    status: str = 'ok'
+    error: str | None = None
+    attributes: dict = field(default_factory=dict)
+
+
+_current_span = contextvars.ContextVar('current_span', default=None)
+_span_ids = itertools.count(1)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def annotate(**attributes) -> None:
+    span = _current_span.get()
+    if span is not None:
+        span.attributes.update(attributes)
+
+
+def annotate_response(response: object) -> None:
+    span = _current_span.get()
+    if span is None:
+        return
+
+    status_code = getattr(response, 'status_code', None)
+    if isinstance(status_code, int):
+        span.attributes['status_code'] = status_code
+
+    content = getattr(response, 'content', None)
+    if isinstance(content, bytes):
+        span.attributes['bytes'] = len(content)
+
+
+def propagate(function: Callable) -> Callable:
+    # thread pools do not inherit context variables, spans opened by the
+    # function still belong to the trace of the caller
+    context = contextvars.copy_context()
+
+    return functools.partial(context.run, function)
+
+
+class Tracer:
+    def __init__(self) -> None:
+        self._exporters = ()
+        self._lock = threading.Lock()
+
+    def add_exporter(self, exporter: object) -> None:
+        # the exporters are swapped as a whole, spans ending in other threads
+        # iterate the tuple they read
+        with self._lock:
+            self._exporters = (*self._exporters, exporter)
+
+    def remove_exporter(self, exporter: object) -> None:
+        with self._lock:
+            exporters = list(self._exporters)
+            exporters.remove(exporter)
+            self._exporters = tuple(exporters)
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        parent = _current_span.get()
+        span_id = next(_span_ids)
+        span = Span(
+            name=name,
+            trace_id=parent.trace_id if parent is not None else span_id,
+            span_id=span_id,
+            parent_id=parent.span_id if parent is not None else None,
+            started_at=time.time(),
+            attributes=attributes,
+        )
+        token = _current_span.set(span)
+        started_at = time.perf_counter()
+
+        try:
+            yield span
+        except BaseException as error:
+            span.status = 'error'
+            span.error = f'{type(error).__name__}: {error}'
+            raise
+        finally:
+            span.duration_secs = time.perf_counter() - started_at
+            _current_span.reset(token)
+            for exporter in self._exporters:
+                exporter.export(span)
+
+    def traced(self, name: str) -> Callable:
+        def decorator(function: Callable) -> Callable:
+            if inspect.iscoroutinefunction(function):
+                @functools.wraps(function)
+                async def traced_coroutine(*args, **kwargs):
+                    with self.span(name):
+                        return await function(*args, **kwargs)
+
+                return traced_coroutine
+
+            @functools.wraps(function)
+            def traced_function(*args, **kwargs):
+                with self.span(name):
+                    return function(*args, **kwargs)
+
+            return traced_function
+
+        return decorator
+
+
+class LogExporter:
+    def export(self, span: Span) -> None:
+        print(json.dumps({
+            'span': span.name,
+            'trace_id': span.trace_id,
+            'span_id': span.span_id,
+            'parent_id': span.parent_id,
+            'duration_ms': round(span.duration_secs * 1000, 3),
+            'status': span.status,
+            'error': span.error,
+            **span.attributes,
+        }, default=str))
+
+
+class MemoryRecorder:
+    def __init__(self, max_spans: int = 1024) -> None:
+        self.spans = deque(maxlen=max_spans)
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+    def find(self, name: str) -> list:
+        return [span for span in self.spans if span.name == name]
+
+    def names(self) -> list:
+        return [span.name for span in self.spans]
+
+    def clear(self) -> None:
+        self.spans.clear()
+
+
+class PrometheusExporter:
+    BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, prefix: str = 'gorrion') -> None:
+        self._prefix = prefix
+        self._lock = threading.Lock()
+        self._durations = {}
+        self._retries = {}
+        self._payload_bytes = {}
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            key = (span.name, span.status)
+            buckets, total = self._durations.get(key, ([0] * len(self.BUCKETS), [0, 0]))
+            for index, bucket in enumerate(self.BUCKETS):
+                if span.duration_secs <= bucket:
+                    buckets[index] += 1
+            total[0] += 1
+            total[1] += span.duration_secs
+            self._durations[key] = (buckets, total)
+
+            self._retries[span.name] = self._retries.get(span.name, 0) + span.attributes.get('retries', 0)
+            if 'bytes' in span.attributes:
+                self._payload_bytes[span.name] = self._payload_bytes.get(span.name, 0) + span.attributes['bytes']
+
+    def render(self) -> str:
+        metric = f'{self._prefix}_span_duration_seconds'
+        lines = [
+            f'# HELP {metric} Duration of the gorrion spans.',
+            f'# TYPE {metric} histogram',
+        ]
+
+        with self._lock:
+            for (name, status), (buckets, (count, total)) in sorted(self._durations.items()):
+                labels = f'span="{name}",status="{status}"'
+                for bucket, bucket_count in zip(self.BUCKETS, buckets):
+                    lines.append(f'{metric}_bucket{{{labels},le="{bucket}"}} {bucket_count}')
+                lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f'{metric}_sum{{{labels}}} {total:.6f}')
+                lines.append(f'{metric}_count{{{labels}}} {count}')
+
+            lines += self._render_counter('span_retries_total', 'Retried calls of the gorrion spans.', self._retries)
+            lines += self._render_counter('span_payload_bytes_total', 'Payload bytes of the gorrion spans.',
+                                          self._payload_bytes)
+
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port: int, host: str = '0.0.0.0') -> object:
+        # only the long running processes serve metrics, the http server is
+        # not loaded by the others
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path != '/metrics':
+                    self.send_error(404)
+                    return
+
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(target=server.serve_forever, name='metrics', daemon=True).start()
+
+        return server
+
+    def _render_counter(self, name: str, description: str, values: dict) -> list:
+        metric = f'{self._prefix}_{name}'
+        lines = [
+            f'# HELP {metric} {description}',
+            f'# TYPE {metric} counter',
+        ]
+        lines += [f'{metric}{{span="{span}"}} {value}' for span, value in sorted(values.items())]
+
+        return lines
+
+
+tracer = Tracer()
+_configured = []
+_metrics = []
+
+
+def configure(log: bool = False, metrics_port: int = None) -> PrometheusExporter | None:
+    # warm containers build their resources again after a reset, the
+    # exporters added by a previous call are replaced instead of doubled
+    for exporter in _configured:
+        tracer.remove_exporter(exporter)
+    _configured.clear()
+
+    if log:
+        _configured.append(LogExporter())
+    metrics = _serve_metrics(metrics_port)
+    if metrics is not None:
+        _configured.append(metrics)
+
+    for exporter in _configured:
+        tracer.add_exporter(exporter)
+
+    return metrics
+
+
+def _serve_metrics(port: int | None) -> PrometheusExporter | None:
+    # the endpoint keeps its server and exporter across calls, another port
+    # closes the previous server before binding
+    if _metrics and _metrics[0][0] == port:
+        return _metrics[0][1]
+
+    if _metrics:
+        _, _, server = _metrics.pop()
+        server.shutdown()
+        server.server_close()
+
+    if not port:
+        return None
+
+    metrics = PrometheusExporter()
+    _metrics.append((port, metrics, metrics.serve(port)))
+
+    return metrics
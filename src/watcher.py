@@ -0,0 +1,83 @@
+import threading
+from dataclasses import dataclass
+
+from src.clients.spotify import Playback
+from src.gorrion import Gorrion
+from src.prefetch import Prefetcher
+
+
+@dataclass
+class WatcherConfig:
+    min_interval_secs: float = 2
+    max_interval_secs: float = 30
+    paused_interval_secs: float = 60
+    idle_interval_secs: float = 120
+    error_interval_secs: float = 60
+    end_margin_secs: float = 1
+    lyrics: bool = False
+
+
+class Watcher:
+    def __init__(self, gorrion: Gorrion, config: WatcherConfig = None, prefetcher: Prefetcher = None) -> None:
+        self._gorrion = gorrion
+        self._config = config if config is not None else WatcherConfig()
+        self._prefetcher = prefetcher
+        self._stopped = threading.Event()
+        self._last_track_id = None
+        self.polls = 0
+        self.posts = 0
+
+    def run(self, post_current: bool = False, max_polls: int = None) -> None:
+        # the first track seen is only posted when asked, a restarted watcher
+        # must not post again the song that was already tweeted
+        if not post_current:
+            self._stopped.wait(self.poll(publish=False))
+
+        while not self._stopped.is_set() and (max_polls is None or self.polls < max_polls):
+            self._stopped.wait(self.poll())
+
+    def stop(self) -> None:
+        self._stopped.set()
+
+    def poll(self, publish: bool = True) -> float:
+        self.polls += 1
+        try:
+            playback = self._gorrion.playback()
+        except Exception as error:
+            # connection errors left after the retries or unreadable error
+            # bodies must not stop the daemon, the next poll tries again
+            print(f'Watcher poll failed: {error}')
+            return self._config.error_interval_secs
+
+        if playback is not None and playback.track.id_ != self._last_track_id:
+            self._last_track_id = playback.track.id_
+            if publish:
+                self._publish(playback)
+            if self._prefetcher is not None:
+                self._prefetcher.prefetch()
+
+        return self.next_interval(playback)
+
+    def next_interval(self, playback: Playback | None) -> float:
+        if playback is None:
+            return self._config.idle_interval_secs
+        if not playback.is_playing:
+            return self._config.paused_interval_secs
+
+        # wake up right after the song is expected to end, long songs are
+        # still checked every max interval to catch skips
+        remaining_secs = playback.remaining / 1000 + self._config.end_margin_secs
+        return min(max(remaining_secs, self._config.min_interval_secs), self._config.max_interval_secs)
+
+    def _publish(self, playback: Playback) -> None:
+        try:
+            if self._config.lyrics:
+                tweets = self._gorrion.publish_track_with_lyrics(playback.album)
+            else:
+                tweets = [self._gorrion.publish_track(playback.album)]
+        except Exception as error:
+            print(f'Watcher failed to publish {playback.track.name}: {error}')
+            return
+
+        self.posts += 1
+        print(f'Watcher published {playback.track.name} ({len(tweets)} tweets)')
@@ -0,0 +1,151 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.clients.retry import RetryPolicy, RetryConfig
+from src.clients.musixmatch import (
+    AsyncMusixmatch,
+    MusixmatchConfig,
+    Song,
+    Lyric,
+    Track,
+    SongNotFound,
+    ServiceError,
+)
+
+
+def build_musixmatch(handler, hedge_delay_secs: float = AsyncMusixmatch.HEDGE_DELAY_SECS) -> AsyncMusixmatch:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return AsyncMusixmatch(MusixmatchConfig('api_key'), client, RetryPolicy(RetryConfig(max_attempts=1)),
+                           hedge_delay_secs=hedge_delay_secs)
+
+
+def build_song(*track_ids: str) -> Song:
+    return Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+        Track(track_id, f'{track_id}0', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo')
+        for track_id in track_ids
+    ])
+
+
+def build_response(code: int, body) -> httpx.Response:
+    return httpx.Response(200, json={
+        'message': {
+            'header': {'status_code': code},
+            'body': body,
+        }
+    })
+
+
+class TestAsyncMusixmatch:
+    def test_constructor_does_not_start_threads_or_sessions(self):
+        musixmatch = build_musixmatch(lambda request: build_response(200, {}))
+
+        assert not hasattr(musixmatch, '_executor')
+        assert not hasattr(musixmatch, '_session')
+
+    def test_search_song(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params['apikey'] == 'api_key'
+            return build_response(200, {'track_list': [{
+                'track': {
+                    'track_id': '123',
+                    'commontrack_id': '456',
+                    'track_name': 'Cumbiera Intelectual',
+                    'instrumental': 0,
+                    'explicit': 0,
+                    'album_name': 'En Vivo',
+                    'artist_name': 'Kevin Johansen',
+                }
+            }]})
+
+        musixmatch = build_musixmatch(handler)
+        song = asyncio.run(musixmatch.search_song(
+            Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo')))
+
+        assert song.tracks_length == 1
+        assert song.tracks[0].id_ == '123'
+
+    def test_search_song_when_song_not_found(self):
+        musixmatch = build_musixmatch(lambda request: build_response(404, {}))
+
+        with pytest.raises(SongNotFound):
+            asyncio.run(musixmatch.search_song(
+                Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo')))
+
+    def test_fetch_lyric(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params['track_id'] == '123'
+            return build_response(200, {'lyrics': {
+                'lyrics_id': '987',
+                'lyrics_body': 'Gotita de mezcal\n\nOtra gotita',
+            }})
+
+        musixmatch = build_musixmatch(handler)
+        song = Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track('123', '456', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo'),
+        ])
+        song = asyncio.run(musixmatch.fetch_lyric(song))
+
+        assert song.lyric == Lyric('987', '123', '456', ['Gotita de mezcal', 'Otra gotita'])
+
+    def test_fetch_lyric_when_lyric_not_provided_yet(self):
+        musixmatch = build_musixmatch(lambda request: build_response(200, []))
+        song = Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track('123', '456', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo'),
+        ])
+        song = asyncio.run(musixmatch.fetch_lyric(song))
+
+        assert song.lyric is None
+
+    def test_fetch_lyric_probes_next_candidate_on_miss(self):
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.params['track_id'])
+            if request.url.params['track_id'] == '1':
+                return build_response(404, {})
+            return build_response(200, {'lyrics': {
+                'lyrics_id': f'lyric-{request.url.params["track_id"]}',
+                'lyrics_body': 'Gotita de mezcal',
+            }})
+
+        musixmatch = build_musixmatch(handler, hedge_delay_secs=60)
+        song = asyncio.run(musixmatch.fetch_lyric(build_song('1', '2', '3')))
+
+        assert song.lyric.id_ == 'lyric-2'
+        assert requested == ['1', '2']
+
+    def test_fetch_lyric_hedges_a_slow_top_candidate(self):
+        async def fetch_lyric():
+            hedged = asyncio.Event()
+
+            async def handler(request: httpx.Request) -> httpx.Response:
+                if request.url.params['track_id'] == '1':
+                    # the top candidate only answers once the hedge started
+                    await asyncio.wait_for(hedged.wait(), timeout=5)
+                else:
+                    hedged.set()
+                return build_response(200, {'lyrics': {
+                    'lyrics_id': f'lyric-{request.url.params["track_id"]}',
+                    'lyrics_body': 'Gotita de mezcal',
+                }})
+
+            musixmatch = build_musixmatch(handler, hedge_delay_secs=0.01)
+            song = await musixmatch.fetch_lyric(build_song('1', '2', '3'))
+            return song, hedged.is_set()
+
+        song, hedged = asyncio.run(fetch_lyric())
+
+        assert song.lyric.id_ == 'lyric-1'
+        assert hedged
+
+    def test_fetch_lyric_when_service_error(self):
+        musixmatch = build_musixmatch(lambda request: build_response(401, {}))
+        song = Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track('123', '456', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo'),
+        ])
+
+        with pytest.raises(ServiceError):
+            asyncio.run(musixmatch.fetch_lyric(song))
@@ -0,0 +1,63 @@
+from src.clients.musixmatch import LyricCache, CachedLyric, Lyric
+
+
+class TestLyricCache:
+    def test_get_when_empty(self):
+        cache = LyricCache()
+
+        assert cache.get('spotify-1', 'Peligro', 'Ely Guerra') is None
+        assert cache.stats()['misses'] == 1
+
+    def test_put_and_get_by_track_id(self):
+        cache = LyricCache()
+        lyric = Lyric('1', '2', '3', ['lyric1'])
+        cache.put('spotify-1', 'Peligro', 'Ely Guerra', lyric)
+
+        assert cache.get('spotify-1', 'Other', 'Other') == CachedLyric(lyric)
+
+    def test_put_and_get_by_normalized_song(self):
+        cache = LyricCache()
+        lyric = Lyric('1', '2', '3', ['lyric1'])
+        cache.put('spotify-1', 'Peligro', 'Ely Guerra', lyric)
+
+        assert cache.get('spotify-2', ' PELIGRO ', 'ely  guerra') == CachedLyric(lyric)
+
+    def test_put_no_lyric(self):
+        cache = LyricCache()
+        cache.put_no_lyric('spotify-1', 'Peligro', 'Ely Guerra')
+
+        assert cache.get('spotify-1', 'Peligro', 'Ely Guerra') == CachedLyric(None)
+        assert cache.stats()['negative_hits'] == 1
+
+    def test_put_no_lyric_uses_negative_ttl(self):
+        cache = LyricCache(negative_ttl_secs=0)
+        cache.put_no_lyric('spotify-1', 'Peligro', 'Ely Guerra')
+
+        assert cache.get('spotify-1', 'Peligro', 'Ely Guerra') is None
+
+    def test_stats(self):
+        cache = LyricCache()
+        cache.put('spotify-1', 'Peligro', 'Ely Guerra', Lyric('1', '2', '3', ['lyric1']))
+        cache.get('spotify-1', 'Peligro', 'Ely Guerra')
+        cache.get('spotify-2', 'Tierra', 'Ely Guerra')
+
+        assert cache.stats() == {
+            'hits': 1,
+            'negative_hits': 0,
+            'misses': 1,
+            'hit_ratio': 0.5,
+        }
+
+    def test_disk_tier(self, tmp_path):
+        path = str(tmp_path / 'lyrics.db')
+        lyric = Lyric('1', '2', '3', ['lyric1', 'lyric2'])
+        LyricCache(path).put('spotify-1', 'Peligro', 'Ely Guerra', lyric)
+        LyricCache(path).put_no_lyric('spotify-2', 'Tierra', 'Ely Guerra')
+
+        cache = LyricCache(path)
+
+        assert cache.get('spotify-1', 'Peligro', 'Ely Guerra') == CachedLyric(lyric)
+        assert cache.get('spotify-2', 'Tierra', 'Ely Guerra') == CachedLyric(None)
+
+    def test_shared(self):
+        assert LyricCache.shared() is LyricCache.shared()
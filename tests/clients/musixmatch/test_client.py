@@ -1,19 +1,28 @@
-from unittest.mock import patch, MagicMock
+from json import dumps
+import threading
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.clients.musixmatch.client import (
+from src.clients.decoder import JsonDecoder
+from src.clients.retry import RetryPolicy, RetryConfig, CircuitBreaker
+from src.clients.musixmatch import (
     Musixmatch,
     MusixmatchConfig,
     Song, Track, Lyric,
-    SongNotFound, ServiceError,
+    SongNotFound, ServiceError, ServiceUnavailable,
 )
 
 
 @pytest.fixture()
-def musixmatch() -> Musixmatch:
+def session() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture()
+def musixmatch(session) -> Musixmatch:
     config = MusixmatchConfig('api_key')
-    return Musixmatch(config)
+    return Musixmatch(config, session, RetryPolicy(RetryConfig(max_attempts=1)))
 
 
 @pytest.fixture()
@@ -31,10 +40,10 @@ def song() -> Song:
 class TestMusixmatch:
     def test_constructor(self, musixmatch):
         assert musixmatch._api_key == 'api_key'
+        assert musixmatch._session is not None
 
-    @patch('src.clients.musixmatch.client.requests')
-    def test_search_song(self, requests_mock, musixmatch, song):
-        requests_mock.get.return_value = self._build_response_mock(
+    def test_search_song(self, session, musixmatch, song):
+        session.get.return_value = self._build_response_mock(
             json={
                 'track_list': [
                     {
@@ -73,9 +82,8 @@ class TestMusixmatch:
             lyric=None
         )
 
-    @patch('src.clients.musixmatch.client.requests')
-    def test_search_song_when_song_not_found(self, requests_mock, musixmatch):
-        requests_mock.get.return_value = self._build_response_mock(
+    def test_search_song_when_song_not_found(self, session, musixmatch):
+        session.get.return_value = self._build_response_mock(
             code=404,
             json={}
         )
@@ -90,12 +98,11 @@ class TestMusixmatch:
             "tracks_length=0, lyric=None)"
         )
 
-    @patch('src.clients.musixmatch.client.requests')
     def test_search_song_when_service_error(self,
-                                            requests_mock,
+                                            session,
                                             musixmatch,
                                             song):
-        requests_mock.get.return_value = self._build_response_mock(
+        session.get.return_value = self._build_response_mock(
             code=500,
             json={}
         )
@@ -105,9 +112,44 @@ class TestMusixmatch:
 
         assert str(error.value) == 'Response API error: response="500"'
 
-    @patch('src.clients.musixmatch.client.requests')
-    def test_fetch_lyric(self, requests_mock, musixmatch, song):
-        requests_mock.get.return_value = self._build_response_mock(
+    @patch('src.clients.retry.time.sleep')
+    def test_search_song_retries_service_error(self, sleep_mock, session, musixmatch, song):
+        musixmatch._retry_policy = RetryPolicy(breaker=CircuitBreaker())
+        unavailable = self._build_response_mock(json={})
+        unavailable.content = dumps({'message': {'header': {'status_code': 503}, 'body': {}}}).encode('utf-8')
+        session.get.side_effect = [unavailable, self._build_response_mock(code=404, json={})]
+
+        with pytest.raises(SongNotFound):
+            musixmatch.search_song(song)
+
+        assert session.get.call_count == 2
+
+    def test_search_song_decodes_the_body_once(self, session, song):
+        decoder = JsonDecoder()
+        decoder.decode = MagicMock(wraps=decoder.decode)
+        musixmatch = Musixmatch(MusixmatchConfig('api_key'), session, RetryPolicy(RetryConfig(max_attempts=1)), decoder)
+        response = self._build_response_mock(code=404, json={})
+        session.get.return_value = response
+
+        with pytest.raises(SongNotFound):
+            musixmatch.search_song(song)
+
+        decoder.decode.assert_called_once_with(response)
+        response.json.assert_not_called()
+
+    def test_search_song_when_service_unavailable(self, session, musixmatch, song):
+        musixmatch._retry_policy = RetryPolicy(RetryConfig(max_attempts=1), CircuitBreaker(failure_threshold=1))
+        session.get.return_value = self._build_response_mock(code=500, json={})
+
+        with pytest.raises(ServiceError):
+            musixmatch.search_song(song)
+        with pytest.raises(ServiceUnavailable):
+            musixmatch.search_song(song)
+
+        session.get.assert_called_once()
+
+    def test_fetch_lyric(self, session, musixmatch, song):
+        session.get.return_value = self._build_response_mock(
             json={
                 'lyrics': {
                     'lyrics_body': 'Gotita de mezcal',
@@ -125,39 +167,130 @@ class TestMusixmatch:
             ['Gotita de mezcal']
         )
 
-    @patch('src.clients.musixmatch.client.requests')
     def test_fetch_lyric_when_lyric_not_found(self,
-                                              requests_mock,
+                                              session,
                                               musixmatch,
                                               song):
-        requests_mock.get.return_value = self._build_response_mock(json=[])
+        session.get.return_value = self._build_response_mock(json=[])
 
         song_found = musixmatch.fetch_lyric(song)
 
         assert song_found.lyric is None
 
-    @patch('src.clients.musixmatch.client.requests')
     def test_fetch_lyric_when_service_error(self,
-                                            requests_mock,
+                                            session,
                                             musixmatch,
                                             song):
-        requests_mock.get.return_value = self._build_response_mock(json=[])
+        session.get.return_value = self._build_response_mock(json=[])
 
         song_found = musixmatch.fetch_lyric(song)
 
         assert song_found.lyric is None
 
-    @patch('src.clients.musixmatch.client.requests')
     def test_fetch_lyric_when_lyric_not_provided_yet(self,
-                                                     requests_mock,
+                                                     session,
                                                      musixmatch,
                                                      song):
-        requests_mock.get.return_value = self._build_response_mock(json=[])
+        session.get.return_value = self._build_response_mock(json=[])
 
         song_found = musixmatch.fetch_lyric(song)
 
         assert song_found.lyric is None
 
+    @patch('builtins.print')
+    def test_fetch_lyric_probes_next_candidate_on_miss(self, print_mock, session):
+        def get(url, params, timeout):
+            if params['track_id'] == '1':
+                return self._build_response_mock(json=[])
+            return self._build_response_mock(json={'lyrics': {
+                'lyrics_id': f'lyric-{params["track_id"]}',
+                'lyrics_body': 'Gotita de mezcal',
+            }})
+
+        session.get.side_effect = get
+        musixmatch = Musixmatch(MusixmatchConfig('api_key'), session, RetryPolicy(RetryConfig(max_attempts=1)),
+                                hedge_delay_secs=60)
+
+        song = musixmatch.fetch_lyric(self._build_song('1', '2', '3'))
+
+        assert song.lyric.id_ == 'lyric-2'
+        assert [call.kwargs['params']['track_id'] for call in session.get.call_args_list] == ['1', '2']
+
+    def test_fetch_lyric_hedges_a_slow_top_candidate(self, session):
+        hedged = threading.Event()
+
+        def get(url, params, timeout):
+            if params['track_id'] == '1':
+                # the top candidate only answers once the hedge started
+                assert hedged.wait(timeout=5)
+            else:
+                hedged.set()
+            return self._build_response_mock(json={'lyrics': {
+                'lyrics_id': f'lyric-{params["track_id"]}',
+                'lyrics_body': 'Gotita de mezcal',
+            }})
+
+        session.get.side_effect = get
+        musixmatch = Musixmatch(MusixmatchConfig('api_key'), session, RetryPolicy(RetryConfig(max_attempts=1)),
+                                hedge_delay_secs=0.01)
+
+        song = musixmatch.fetch_lyric(self._build_song('1', '2', '3'))
+
+        assert song.lyric.id_ == 'lyric-1'
+        assert hedged.is_set()
+
+    def test_fetch_lyric_skips_instrumental_tracks(self, session, musixmatch):
+        session.get.return_value = self._build_response_mock(json={'lyrics': {
+            'lyrics_id': '987',
+            'lyrics_body': 'Gotita de mezcal',
+        }})
+        song = Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track('1', '10', 'Cumbiera Intelectual', 1, 0, 'Kevin Johansen', 'En Vivo'),
+            Track('2', '20', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo'),
+        ])
+
+        song = musixmatch.fetch_lyric(song)
+
+        assert song.lyric.track_id == '2'
+        session.get.assert_called_once()
+
+    @patch('builtins.print')
+    def test_fetch_lyric_probes_top_candidates(self, print_mock, session, musixmatch):
+        session.get.return_value = self._build_response_mock(json=[])
+        song = Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track(str(index), str(index), 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo')
+            for index in range(5)
+        ])
+
+        song = musixmatch.fetch_lyric(song)
+
+        assert song.lyric is None
+        assert session.get.call_count == Musixmatch.LYRIC_CANDIDATES
+
+    @patch('builtins.print')
+    def test_fetch_lyric_when_candidates_fail_with_service_error(self, print_mock, session, musixmatch):
+        session.get.side_effect = [
+            self._build_response_mock(json=[]),
+            self._build_response_mock(code=500, json={}),
+        ]
+        song = Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track('1', '10', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo'),
+            Track('2', '20', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo'),
+        ])
+
+        with pytest.raises(ServiceError):
+            musixmatch.fetch_lyric(song)
+
+    @patch('builtins.print')
+    def test_fetch_lyric_when_candidates_fail_with_connection_error(self, print_mock, session, musixmatch):
+        session.get.side_effect = ConnectionError('connection reset')
+        song = Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track('1', '10', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo'),
+        ])
+
+        with pytest.raises(ServiceError, match='connection reset'):
+            musixmatch.fetch_lyric(song)
+
     def _build_response_mock(self,
                              code: int = 200,
                              text: str = '',
@@ -173,5 +306,12 @@ class TestMusixmatch:
                 'body': json,
             }
         } if json is not None else {}
+        response_mock.content = dumps(response_mock.json.return_value).encode('utf-8')
 
         return response_mock
+
+    def _build_song(self, *track_ids: str) -> Song:
+        return Song('Cumbiera Intelectual', 'Kevin Johansen', 'En Vivo', [
+            Track(track_id, f'{track_id}0', 'Cumbiera Intelectual', 0, 0, 'Kevin Johansen', 'En Vivo')
+            for track_id in track_ids
+        ])
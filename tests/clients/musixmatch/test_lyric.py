@@ -0,0 +1,15 @@
+from src.clients.musixmatch.lyric import clean_paragraphs
+
+
+class TestCleanParagraphs:
+    def test_clean_paragraphs(self):
+        raw_lyric = ('Gotita de mezcal (2)\nOtra gotita...\n\n \n\nUna más\n\n'
+                     '******* This Lyrics is NOT for Commercial use *******\n(1409623000000)')
+
+        assert list(clean_paragraphs(raw_lyric)) == [
+            'Gotita de mezcal \nOtra gotita',
+            'Una más',
+        ]
+
+    def test_clean_paragraphs_when_empty(self):
+        assert list(clean_paragraphs('')) == []
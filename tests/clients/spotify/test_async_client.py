@@ -0,0 +1,250 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.clients.retry import RetryPolicy, RetryConfig, CircuitBreaker
+from src.clients.spotify import (
+    AsyncSpotify,
+    SpotifyConfig,
+    ServiceError,
+    NotPlayingError,
+    TokenCache,
+)
+
+
+CURRENT_PLAYING = {
+    'item': {
+        'id': '1',
+        'name': 'Peligro',
+        'href': '',
+        'track_number': 1,
+        'external_urls': {'spotify': 'https://open.spotify.com/track/1'},
+        'disc_number': 1,
+        'duration_ms': 1000,
+        'album': {
+            'id': '11',
+            'name': 'Pa morirse de amor',
+            'href': '',
+            'external_urls': {'spotify': 'https://open.spotify.com/album/11'},
+            'release_date': '2006-01-01',
+            'total_tracks': 19,
+        },
+        'artists': [{
+            'id': '12',
+            'name': 'Ely Guerra',
+            'href': '',
+            'external_urls': {'spotify': 'https://open.spotify.com/artist/12'},
+        }],
+    }
+}
+
+
+def build_spotify(handler) -> AsyncSpotify:
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    config = SpotifyConfig('client_id', 'client_secret', 'refresh_token')
+
+    return AsyncSpotify(config, client, TokenCache(), retry_policy=RetryPolicy(RetryConfig(max_attempts=1)))
+
+
+class TestAsyncSpotify:
+    def test_get_current_track(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token', 'expires_in': 3600})
+            return httpx.Response(200, json=CURRENT_PLAYING)
+
+        spotify = build_spotify(handler)
+        album = asyncio.run(spotify.get_current_track())
+
+        assert album.name == 'Pa morirse de amor'
+        assert album.artists[0].name == 'Ely Guerra'
+        assert album.tracks[0].name == 'Peligro'
+        assert requests == ['/api/token', '/v1/me/player/currently-playing']
+
+    def test_get_current_track_retries_rate_limited_response(self):
+        responses = [
+            httpx.Response(429, headers={'Retry-After': '0'}, json={}),
+            httpx.Response(200, json=CURRENT_PLAYING),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token', 'expires_in': 3600})
+            return responses.pop(0)
+
+        spotify = build_spotify(handler)
+        spotify._retry_policy = RetryPolicy(breaker=CircuitBreaker())
+        album = asyncio.run(spotify.get_current_track())
+
+        assert album.name == 'Pa morirse de amor'
+        assert responses == []
+
+    def test_get_current_track_reuses_token(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request.url.path)
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token', 'expires_in': 3600})
+            return httpx.Response(200, json=CURRENT_PLAYING)
+
+        spotify = build_spotify(handler)
+
+        async def run():
+            await spotify.get_current_track()
+            await spotify.get_current_track()
+
+        asyncio.run(run())
+
+        assert requests.count('/api/token') == 1
+
+    def test_get_current_track_refreshes_rejected_token(self):
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'new-token', 'expires_in': 3600})
+            requests.append(request.headers['Authorization'])
+            if request.headers['Authorization'] == 'Bearer revoked-token':
+                return httpx.Response(401, json={'error': 'invalid access token'})
+            return httpx.Response(200, json=CURRENT_PLAYING)
+
+        spotify = build_spotify(handler)
+        spotify._token_cache.put(spotify._token_cache_key(), 'revoked-token', 3600)
+
+        album = asyncio.run(spotify.get_current_track())
+
+        assert album.name == 'Pa morirse de amor'
+        assert requests == ['Bearer revoked-token', 'Bearer new-token']
+
+    def test_get_current_album(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token'})
+            if request.url.path == '/v1/albums/11':
+                return httpx.Response(200, json={
+                    **CURRENT_PLAYING['item']['album'],
+                    'artists': CURRENT_PLAYING['item']['artists'],
+                    'tracks': {'items': [CURRENT_PLAYING['item']]},
+                })
+            return httpx.Response(200, json=CURRENT_PLAYING)
+
+        spotify = build_spotify(handler)
+        album = asyncio.run(spotify.get_current_album())
+
+        assert album.id_ == '11'
+        assert [track.name for track in album.tracks] == ['Peligro']
+
+    def test_get_current_album_with_paginated_tracks(self):
+        def track(number: int) -> dict:
+            return {**CURRENT_PLAYING['item'], 'id': str(number), 'track_number': number}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token'})
+            if request.url.path == '/v1/albums/11':
+                return httpx.Response(200, json={
+                    **CURRENT_PLAYING['item']['album'],
+                    'artists': CURRENT_PLAYING['item']['artists'],
+                    'tracks': {
+                        'items': [track(number) for number in range(1, 51)],
+                        'offset': 0,
+                        'limit': 50,
+                        'total': 75,
+                        'next': 'https://api.spotify.com/v1/albums/11/tracks?offset=50&limit=50',
+                    },
+                })
+            if request.url.path == '/v1/albums/11/tracks':
+                assert request.url.params['offset'] == '50'
+                return httpx.Response(200, json={'items': [track(number) for number in range(51, 76)]})
+            return httpx.Response(200, json=CURRENT_PLAYING)
+
+        spotify = build_spotify(handler)
+        album = asyncio.run(spotify.get_current_album())
+
+        assert [track.track_number for track in album.tracks] == list(range(1, 76))
+
+    def test_get_playback(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token'})
+            return httpx.Response(200, json={**CURRENT_PLAYING, 'is_playing': True, 'progress_ms': 400})
+
+        spotify = build_spotify(handler)
+        playback = asyncio.run(spotify.get_playback())
+
+        assert playback.track.name == 'Peligro'
+        assert playback.is_playing
+        assert playback.remaining == 600
+
+    def test_get_playback_when_not_playing(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token'})
+            return httpx.Response(204)
+
+        spotify = build_spotify(handler)
+
+        assert asyncio.run(spotify.get_playback()) is None
+
+    def test_get_queue(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token'})
+            assert request.url.path == '/v1/me/player/queue'
+            return httpx.Response(200, json={
+                'currently_playing': CURRENT_PLAYING['item'],
+                'queue': [{**CURRENT_PLAYING['item'], 'id': '2'}, {'id': '3', 'type': 'episode'}],
+            })
+
+        spotify = build_spotify(handler)
+        queue = asyncio.run(spotify.get_queue())
+
+        assert [album.tracks[0].id_ for album in queue] == ['2']
+
+    def test_get_album(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token'})
+            assert request.url.path == '/v1/albums/11'
+            return httpx.Response(200, json={
+                **CURRENT_PLAYING['item']['album'],
+                'artists': CURRENT_PLAYING['item']['artists'],
+                'tracks': {'items': [CURRENT_PLAYING['item']]},
+            })
+
+        spotify = build_spotify(handler)
+        album = asyncio.run(spotify.get_album('11'))
+
+        assert album.name == 'Pa morirse de amor'
+        assert [track.name for track in album.tracks] == ['Peligro']
+
+    def test_constructor_does_not_start_threads_or_sessions(self):
+        spotify = build_spotify(lambda request: httpx.Response(204))
+
+        assert not hasattr(spotify, '_executor')
+        assert not hasattr(spotify, '_session')
+
+    def test_get_current_track_when_not_playing_error(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == '/api/token':
+                return httpx.Response(200, json={'access_token': 'token'})
+            return httpx.Response(204)
+
+        spotify = build_spotify(handler)
+
+        with pytest.raises(NotPlayingError):
+            asyncio.run(spotify.get_current_track())
+
+    def test_get_current_track_when_error_response(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500, json={'error': 'internal server error'})
+
+        spotify = build_spotify(handler)
+
+        with pytest.raises(ServiceError):
+            asyncio.run(spotify.get_current_track())
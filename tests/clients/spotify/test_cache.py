@@ -0,0 +1,69 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.clients.spotify import AlbumCache, Album, Artist, Track
+
+
+@pytest.fixture()
+def album() -> Album:
+    return Album(
+        id_='11',
+        name='Pa morirse de amor',
+        href='',
+        public_url='http://spotify.com/album/11',
+        release_date='2006-01-01',
+        total_tracks=19,
+        artists=[Artist('12', 'Ely Guerra', '', 'http://spotify.com/artist/12')],
+        tracks=[Track('1', 'Peligro', '', 'http://spotify.com/track/1', 1, 1, 1000)],
+    )
+
+
+class TestAlbumCache:
+    def test_get_when_empty(self):
+        assert AlbumCache().get('11') is None
+
+    def test_put_and_get(self, album):
+        cache = AlbumCache()
+        cache.put('11', album, '"etag"')
+
+        cached = cache.get('11')
+
+        assert cached.album == album
+        assert cached.etag == '"etag"'
+        assert cache.is_fresh(cached)
+
+    @patch('src.clients.spotify.cache.time')
+    @patch('src.clients.cache.time')
+    def test_stale_entry_is_kept_for_revalidation(self, lru_time_mock, time_mock, album):
+        lru_time_mock.time.return_value = time_mock.time.return_value = 1000
+        cache = AlbumCache(ttl_secs=60, stale_ttl_secs=600)
+        cache.put('11', album, '"etag"')
+
+        lru_time_mock.time.return_value = time_mock.time.return_value = 1100
+        cached = cache.get('11')
+
+        assert cached.album == album
+        assert not cache.is_fresh(cached)
+
+    def test_disk_tier(self, album, tmp_path):
+        path = str(tmp_path / 'albums.db')
+        AlbumCache(path).put('11', album, '"etag"')
+
+        cached = AlbumCache(path).get('11')
+
+        assert cached.album == album
+        assert cached.etag == '"etag"'
+
+    def test_disk_tier_with_local_files(self, album, tmp_path):
+        path = str(tmp_path / 'albums.db')
+        album.artists.append(Artist(None, 'Ely Guerra', None, None))
+        album.tracks.append(Track(None, 'Peligro (demo)', None, None, 0, 0, 1000))
+        AlbumCache(path).put('11', album, None)
+
+        cached = AlbumCache(path).get('11')
+
+        assert cached.album == album
+
+    def test_shared(self):
+        assert AlbumCache.shared() is AlbumCache.shared()
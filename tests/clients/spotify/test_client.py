@@ -1,19 +1,29 @@
-from unittest.mock import patch, MagicMock
+from json import dumps
+from unittest.mock import patch, MagicMock, ANY
 
 import pytest
 
-from src.clients.spotify.client import (
+from src.clients.spotify import (
     Spotify,
     SpotifyConfig,
-    ServiceError, NotPlayingError,
+    ServiceError, NotPlayingError, ServiceUnavailable, Unauthorized,
     Track, Album, Artist,
 )
+from src.clients.retry import RetryPolicy, RetryConfig, CircuitBreaker
+from src.clients.spotify.token import TokenCache
+from src.clients.spotify.cache import AlbumCache
+from src.tracing import tracer, MemoryRecorder
 
 
 @pytest.fixture()
-def spotify() -> Spotify:
+def session() -> MagicMock:
+    return MagicMock()
+
+
+@pytest.fixture()
+def spotify(session) -> Spotify:
     config = SpotifyConfig('client_id', 'client_secret', 'refresh_token')
-    return Spotify(config)
+    return Spotify(config, TokenCache(), session, retry_policy=RetryPolicy(RetryConfig(max_attempts=1)))
 
 
 class TestSpotify:
@@ -22,11 +32,15 @@ class TestSpotify:
         assert spotify._client_secret == 'client_secret'
         assert spotify._refresh_token == 'refresh_token'
 
-    @patch('src.clients.spotify.client.requests')
+    def test_constructor_uses_shared_session(self):
+        config = SpotifyConfig('client_id', 'client_secret', 'refresh_token')
+
+        assert Spotify(config)._session is Spotify(config)._session
+
     @patch('src.clients.spotify.client.Spotify._refresh_access_token')
     def test_get_current_track(self,
                                refresh_access_token_mock,
-                               requests_mock,
+                               session,
                                spotify):
         json_response = {
             'item': {
@@ -61,7 +75,7 @@ class TestSpotify:
                 ]
             }
         }
-        requests_mock.get.return_value = self._build_response_mock(
+        session.get.return_value = self._build_response_mock(
             code=200,
             json=json_response
         )
@@ -95,13 +109,12 @@ class TestSpotify:
             ],
         )
 
-    @patch('src.clients.spotify.client.requests')
     @patch('src.clients.spotify.client.Spotify._refresh_access_token')
     def test_get_current_track_when_not_playing_error(self,
                                                       refresh_access_token_mock,
-                                                      requests_mock,
+                                                      session,
                                                       spotify):
-        requests_mock.get.return_value = self._build_response_mock(
+        session.get.return_value = self._build_response_mock(
             code=204,
             text=''
         )
@@ -111,13 +124,132 @@ class TestSpotify:
 
         assert str(error.value) == 'Not playing any song at this moment'
 
-    @patch('src.clients.spotify.client.requests')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_playback(self, refresh_access_token_mock, session, spotify):
+        session.get.return_value = self._build_response_mock(
+            code=200,
+            json={
+                'is_playing': True,
+                'progress_ms': 400,
+                'currently_playing_type': 'track',
+                'item': {
+                    'id': '1',
+                    'name': 'Peligro',
+                    'href': '',
+                    'track_number': 1,
+                    'external_urls': {'spotify': 'https://open.spotify.com/track/1'},
+                    'disc_number': 1,
+                    'duration_ms': 1000,
+                    'album': {
+                        'id': '11',
+                        'name': 'Pa morirse de amor',
+                        'href': '',
+                        'external_urls': {'spotify': 'https://open.spotify.com/album/11'},
+                        'release_date': '2006-01-01',
+                        'total_tracks': 19,
+                    },
+                    'artists': [],
+                },
+            }
+        )
+
+        playback = spotify.get_playback()
+
+        assert playback.track.id_ == '1'
+        assert playback.album.id_ == '11'
+        assert playback.is_playing
+        assert playback.remaining == 600
+
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_playback_when_not_playing(self, refresh_access_token_mock, session, spotify):
+        session.get.return_value = self._build_response_mock(code=204)
+
+        assert spotify.get_playback() is None
+
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_playback_when_playing_an_ad(self, refresh_access_token_mock, session, spotify):
+        session.get.return_value = self._build_response_mock(
+            code=200,
+            json={'is_playing': True, 'currently_playing_type': 'ad', 'item': None}
+        )
+
+        assert spotify.get_playback() is None
+
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_queue(self, refresh_access_token_mock, session, spotify):
+        def item(track_id: str, album_id: str) -> dict:
+            return {
+                'type': 'track',
+                'id': track_id,
+                'name': f'song-{track_id}',
+                'href': '',
+                'track_number': 1,
+                'external_urls': {'spotify': ''},
+                'disc_number': 1,
+                'duration_ms': 1000,
+                'album': {
+                    'id': album_id,
+                    'name': 'album',
+                    'href': '',
+                    'external_urls': {'spotify': ''},
+                    'release_date': '2006-01-01',
+                    'total_tracks': 19,
+                },
+                'artists': [],
+            }
+
+        session.get.return_value = self._build_response_mock(
+            code=200,
+            json={
+                'currently_playing': item('1', '11'),
+                'queue': [item('2', '22'), {'type': 'episode', 'id': '3'}, item('4', '44')],
+            }
+        )
+
+        queue = spotify.get_queue()
+
+        assert [(album.id_, album.tracks[0].id_) for album in queue] == [('22', '2'), ('44', '4')]
+        assert session.get.call_args.args[0] == 'https://api.spotify.com/v1/me/player/queue'
+
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_album(self, refresh_access_token_mock, session, spotify):
+        refresh_access_token_mock.return_value = 'token'
+        spotify._get_album = MagicMock()
+
+        spotify.get_album('11')
+
+        spotify._get_album.assert_called_once_with('token', '11')
+
+    def test_mappers_intern_artist_names_and_track_ids(self, spotify):
+        artist = {'id': ''.join(['1', '2']), 'name': ''.join(['Ely ', 'Guerra']), 'href': '', 'external_urls': {'spotify': ''}}
+        track = {'id': ''.join(['4', '2']), 'name': 'Peligro', 'href': '', 'external_urls': {'spotify': ''},
+                 'disc_number': 1, 'track_number': 1, 'duration_ms': 1000}
+
+        first, second = spotify._to_artists([artist, dict(artist, name=''.join(['Ely ', 'Guerra']))])
+        [first_track], [second_track] = spotify._to_tracks([track]), spotify._to_tracks([dict(track, id=''.join(['4', '2']))])
+
+        assert first.name is second.name
+        assert first.id_ is second.id_
+        assert first_track.id_ is second_track.id_
+
+    def test_mappers_with_local_file(self, spotify):
+        # local files come with null ids and without spotify urls
+        artist = {'id': None, 'name': 'Ely Guerra', 'href': None, 'external_urls': {}, 'type': 'artist'}
+        track = {'id': None, 'name': 'Peligro (demo)', 'href': None, 'external_urls': {}, 'is_local': True,
+                 'disc_number': 0, 'track_number': 0, 'duration_ms': 1000}
+
+        [mapped_artist] = spotify._to_artists([artist])
+        [mapped_track] = spotify._to_tracks([track])
+
+        assert mapped_artist == Artist(None, 'Ely Guerra', None, None)
+        assert mapped_track == Track(None, 'Peligro (demo)', None, None, 0, 0, 1000)
+
     @patch('src.clients.spotify.client.Spotify._refresh_access_token')
     def test_get_current_track_when_error_response(self,
                                                    refresh_access_token_mock,
-                                                   requests_mock,
+                                                   session,
                                                    spotify):
-        requests_mock.get.return_value = self._build_response_mock(
+        session.get.return_value = self._build_response_mock(
             code=500,
             json={'error': 'internal server error'}
         )
@@ -130,13 +262,12 @@ class TestSpotify:
             "'body': {'error': 'internal server error'}}"
         )
 
-    @patch('src.clients.spotify.client.requests')
     @patch('src.clients.spotify.client.Spotify._get_current_playing')
     @patch('src.clients.spotify.client.Spotify._refresh_access_token')
     def test_get_current_album(self,
                                _refresh_access_token_mock,
                                _get_current_playing_mock,
-                               requests_mock,
+                               session,
                                spotify):
         _get_current_playing_mock.return_value = {
             'item': {
@@ -146,7 +277,7 @@ class TestSpotify:
             }
         }
 
-        requests_mock.get.return_value = self._build_response_mock(
+        session.get.return_value = self._build_response_mock(
             json={
                 'id': '11',
                 'name': 'Pa morirse de amor',
@@ -229,13 +360,223 @@ class TestSpotify:
             ],
         )
 
-    @patch('src.clients.spotify.client.requests')
+    @patch('src.clients.spotify.client.Spotify._get_current_playing')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_album_when_album_cached(self,
+                                                 _refresh_access_token_mock,
+                                                 _get_current_playing_mock,
+                                                 session,
+                                                 spotify):
+        _get_current_playing_mock.return_value = {'item': {'album': {'id': '11'}}}
+        spotify._album_cache = AlbumCache()
+        session.get.return_value = self._build_response_mock(json=self._album_json())
+        session.get.return_value.headers = {'ETag': '"etag-1"'}
+
+        first_album = spotify.get_current_album()
+        second_album = spotify.get_current_album()
+
+        assert first_album == second_album
+        session.get.assert_called_once()
+
+    @patch('src.clients.spotify.client.Spotify._get_current_playing')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_album_when_album_not_modified(self,
+                                                       _refresh_access_token_mock,
+                                                       _get_current_playing_mock,
+                                                       session,
+                                                       spotify):
+        _get_current_playing_mock.return_value = {'item': {'album': {'id': '11'}}}
+        _refresh_access_token_mock.return_value = 'token'
+        spotify._album_cache = AlbumCache(ttl_secs=0)
+        first_response = self._build_response_mock(json=self._album_json())
+        first_response.headers = {'ETag': '"etag-1"'}
+        second_response = self._build_response_mock(code=304)
+        session.get.side_effect = [first_response, second_response]
+
+        first_album = spotify.get_current_album()
+        second_album = spotify.get_current_album()
+
+        assert first_album == second_album
+        session.get.assert_called_with(
+            'https://api.spotify.com/v1/albums/11',
+            headers={
+                'Authorization': 'Bearer token',
+                'If-None-Match': '"etag-1"',
+            },
+            timeout=ANY,
+        )
+
+    @patch('src.clients.spotify.client.Spotify._get_current_playing')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_album_when_album_modified(self,
+                                                   _refresh_access_token_mock,
+                                                   _get_current_playing_mock,
+                                                   session,
+                                                   spotify):
+        _get_current_playing_mock.return_value = {'item': {'album': {'id': '11'}}}
+        spotify._album_cache = AlbumCache(ttl_secs=0)
+        first_response = self._build_response_mock(json=self._album_json())
+        first_response.headers = {'ETag': '"etag-1"'}
+        second_response = self._build_response_mock(json={**self._album_json(), 'name': 'Sweet & Sour'})
+        second_response.headers = {'ETag': '"etag-2"'}
+        session.get.side_effect = [first_response, second_response]
+
+        spotify.get_current_album()
+        album = spotify.get_current_album()
+
+        assert album.name == 'Sweet & Sour'
+        assert spotify._album_cache.get('11').etag == '"etag-2"'
+
+    @patch('src.clients.spotify.client.Spotify._get_current_playing')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_album_with_paginated_tracks(self,
+                                                     _refresh_access_token_mock,
+                                                     _get_current_playing_mock,
+                                                     session,
+                                                     spotify):
+        _get_current_playing_mock.return_value = {'item': {'album': {'id': '11'}}}
+        session.get.side_effect = self._paginated_album_responses(total=120)
+
+        album = spotify.get_current_album()
+
+        assert [track.track_number for track in album.tracks] == list(range(1, 121))
+        assert session.get.call_count == 3
+
+    @patch('src.clients.spotify.client.Spotify._get_current_playing')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_album_traces_pages_under_the_caller(self,
+                                                             _refresh_access_token_mock,
+                                                             _get_current_playing_mock,
+                                                             session,
+                                                             spotify):
+        _get_current_playing_mock.return_value = {'item': {'album': {'id': '11'}}}
+        session.get.side_effect = self._paginated_album_responses(total=120)
+        recorder = MemoryRecorder()
+        tracer.add_exporter(recorder)
+
+        try:
+            with tracer.span('gorrion.playing_album') as root:
+                spotify.get_current_album()
+        finally:
+            tracer.remove_exporter(recorder)
+
+        pages = recorder.find('spotify.album_tracks')
+        assert len(pages) == 2
+        assert all(page.parent_id == root.span_id for page in pages)
+
+    @patch('src.clients.spotify.client.Spotify._get_current_playing')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_album_with_streamed_tracks(self,
+                                                    _refresh_access_token_mock,
+                                                    _get_current_playing_mock,
+                                                    session,
+                                                    spotify):
+        _get_current_playing_mock.return_value = {'item': {'album': {'id': '11'}}}
+        session.get.side_effect = self._paginated_album_responses(total=120)
+        spotify._album_cache = AlbumCache()
+
+        album = spotify.get_current_album(stream_tracks=True)
+
+        assert next(album.tracks).track_number == 1
+        assert spotify._album_cache.get('11') is None
+
+        remaining = list(album.tracks)
+
+        assert len(remaining) == 119
+        assert len(album.tracks) == 120
+        assert spotify._album_cache.get('11').album == album
+
+    @patch('src.clients.spotify.client.Spotify._get_current_playing')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_album_with_streamed_tracks_when_page_unauthorized(self,
+                                                                           _refresh_access_token_mock,
+                                                                           _get_current_playing_mock,
+                                                                           session,
+                                                                           spotify):
+        _get_current_playing_mock.return_value = {'item': {'album': {'id': '11'}}}
+        _refresh_access_token_mock.side_effect = ['token', 'token', 'token', 'new-token']
+        pages = self._paginated_album_responses(total=120)
+        unauthorized = self._build_response_mock(code=401)
+
+        def get(url: str, headers: dict, params: dict = None, timeout: float = None):
+            if params is not None and params['offset'] == 100 and headers['Authorization'] == 'Bearer token':
+                return unauthorized
+            return pages(url, headers, params, timeout)
+
+        session.get.side_effect = get
+
+        album = spotify.get_current_album(stream_tracks=True)
+        tracks = list(album.tracks)
+
+        assert [track.track_number for track in tracks] == list(range(1, 121))
+        session.get.assert_any_call(
+            'https://api.spotify.com/v1/albums/11/tracks',
+            headers={'Authorization': 'Bearer new-token'},
+            params={'offset': 100, 'limit': 50},
+            timeout=ANY,
+        )
+
+    @patch('src.clients.retry.time.sleep')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_track_retries_rate_limited_response(self,
+                                                             _refresh_access_token_mock,
+                                                             sleep_mock,
+                                                             session,
+                                                             spotify):
+        spotify._retry_policy = RetryPolicy(breaker=CircuitBreaker())
+        rate_limited = self._build_response_mock(code=429)
+        rate_limited.headers = {'Retry-After': '1'}
+        session.get.side_effect = [rate_limited, self._build_response_mock(code=204)]
+
+        with pytest.raises(NotPlayingError):
+            spotify.get_current_track()
+
+        assert session.get.call_count == 2
+        sleep_mock.assert_called_once_with(1)
+
+    @patch('src.clients.retry.time.sleep')
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_track_records_span(self, _refresh_access_token_mock, _sleep_mock, session, spotify):
+        spotify._retry_policy = RetryPolicy(breaker=CircuitBreaker())
+        rate_limited = self._build_response_mock(code=429)
+        rate_limited.headers = {'Retry-After': '1'}
+        not_playing = self._build_response_mock(code=204)
+        not_playing.content = b''
+        session.get.side_effect = [rate_limited, not_playing]
+        recorder = MemoryRecorder()
+        tracer.add_exporter(recorder)
+
+        try:
+            with pytest.raises(NotPlayingError):
+                spotify.get_current_track()
+        finally:
+            tracer.remove_exporter(recorder)
+
+        span, = recorder.find('spotify.currently_playing')
+        assert span.status == 'ok'
+        assert span.attributes == {'retries': 1, 'status_code': 204, 'bytes': 0}
+
+    @patch('src.clients.spotify.client.Spotify._refresh_access_token')
+    def test_get_current_track_when_service_unavailable(self,
+                                                        _refresh_access_token_mock,
+                                                        session,
+                                                        spotify):
+        spotify._retry_policy = RetryPolicy(RetryConfig(max_attempts=1), CircuitBreaker(failure_threshold=1))
+        session.get.return_value = self._build_response_mock(code=503)
+
+        with pytest.raises(ServiceError):
+            spotify.get_current_track()
+        with pytest.raises(ServiceUnavailable):
+            spotify.get_current_track()
+
+        session.get.assert_called_once()
+
     @patch('src.clients.spotify.client.Spotify._refresh_access_token')
     def test_get_current_album_when_not_playing_error(self,
                                                       _refresh_access_token_mock,
-                                                      requests_mock,
+                                                      session,
                                                       spotify):
-        requests_mock.get.return_value = self._build_response_mock(
+        session.get.return_value = self._build_response_mock(
             code=204,
             text=''
         )
@@ -245,13 +586,12 @@ class TestSpotify:
 
         assert str(error.value) == 'Not playing any song at this moment'
 
-    @patch('src.clients.spotify.client.requests')
     @patch('src.clients.spotify.client.Spotify._refresh_access_token')
     def test_get_current_album_when_error_response(self,
                                                    _refresh_access_token_mock,
-                                                   requests_mock,
+                                                   session,
                                                    spotify):
-        requests_mock.get.return_value = self._build_response_mock(
+        session.get.return_value = self._build_response_mock(
             code=500,
             json={'error': 'internal server error'}
         )
@@ -264,13 +604,12 @@ class TestSpotify:
             "'body': {'error': 'internal server error'}}"
         )
 
-    @patch('src.clients.spotify.client.requests')
     @patch('src.clients.spotify.client.Spotify._refresh_access_token')
     def test_get_current_album_when_album_error_response(self,
                                                          _refresh_access_token_mock,
-                                                         requests_mock,
+                                                         session,
                                                          spotify):
-        requests_mock.get.side_effect = [
+        session.get.side_effect = [
             self._build_response_mock(
                 code=200,
                 json={
@@ -289,15 +628,14 @@ class TestSpotify:
         with pytest.raises(ServiceError) as error:
             _ = spotify.get_current_album()
 
-        assert requests_mock.get.call_count == 2
+        assert session.get.call_count == 2
         assert str(error.value) == (
             "Response API error:\n\nReason: {'header': {}, "
             "'body': {'error': 'internal server error'}}"
         )
 
-    @patch('src.clients.spotify.client.requests')
-    def test_refresh_access_token(self, requests_mock, spotify):
-        requests_mock.post.return_value = self._build_response_mock(
+    def test_refresh_access_token(self, session, spotify):
+        session.post.return_value = self._build_response_mock(
             json={'access_token': '92170cdc034b2ff819323ff670d3b7266c8bffcd'}
         )
 
@@ -305,9 +643,35 @@ class TestSpotify:
 
         assert token == '92170cdc034b2ff819323ff670d3b7266c8bffcd'
 
-    @patch('src.clients.spotify.client.requests')
-    def test_refresh_token_when_error_response(self, requests_mock, spotify):
-        requests_mock.post.return_value = self._build_response_mock(
+    def test_refresh_access_token_when_token_cached(self, session, spotify):
+        session.post.return_value = self._build_response_mock(
+            json={
+                'access_token': '92170cdc034b2ff819323ff670d3b7266c8bffcd',
+                'expires_in': 3600,
+            }
+        )
+
+        first_token = spotify._refresh_access_token()
+        second_token = spotify._refresh_access_token()
+
+        assert first_token == second_token == '92170cdc034b2ff819323ff670d3b7266c8bffcd'
+        session.post.assert_called_once()
+
+    def test_refresh_access_token_when_token_expired(self, session, spotify):
+        session.post.return_value = self._build_response_mock(
+            json={
+                'access_token': '92170cdc034b2ff819323ff670d3b7266c8bffcd',
+                'expires_in': 30,
+            }
+        )
+
+        spotify._refresh_access_token()
+        spotify._refresh_access_token()
+
+        assert session.post.call_count == 2
+
+    def test_refresh_token_when_error_response(self, session, spotify):
+        session.post.return_value = self._build_response_mock(
             code=500,
             json={'error': 'internal server error'}
         )
@@ -320,11 +684,98 @@ class TestSpotify:
             "'body': {'error': 'internal server error'}}"
         )
 
+    def test_get_current_track_refreshes_rejected_token(self, session, spotify):
+        spotify._token_cache.put(spotify._token_cache_key(), 'revoked-token', 3600)
+        session.post.return_value = self._build_response_mock(
+            json={'access_token': 'new-token', 'expires_in': 3600}
+        )
+        session.get.side_effect = [
+            self._build_response_mock(code=401, json={'error': 'invalid access token'}),
+            self._build_response_mock(code=204),
+        ]
+
+        with pytest.raises(NotPlayingError):
+            spotify.get_current_track()
+
+        tokens = [call.kwargs['headers']['Authorization'] for call in session.get.call_args_list]
+        assert tokens == ['Bearer revoked-token', 'Bearer new-token']
+        assert spotify._token_cache.get(spotify._token_cache_key()) == 'new-token'
+
+    def test_get_current_track_when_refreshed_token_is_rejected(self, session, spotify):
+        session.post.return_value = self._build_response_mock(
+            json={'access_token': 'new-token', 'expires_in': 3600}
+        )
+        session.get.return_value = self._build_response_mock(code=401, json={'error': 'invalid access token'})
+
+        with pytest.raises(Unauthorized):
+            spotify.get_current_track()
+
+        assert session.get.call_count == 2
+        assert session.post.call_count == 2
+
     def test_get_basic_auth_token(self, spotify):
         basic_auth_token = spotify._get_basic_auth_token()
 
         assert basic_auth_token == 'Y2xpZW50X2lkOmNsaWVudF9zZWNyZXQ='
 
+    def _paginated_album_responses(self, total: int):
+        def track(number: int) -> dict:
+            return {
+                'id': str(number),
+                'name': f'Track {number}',
+                'href': '',
+                'external_urls': {'spotify': f'https://open.spotify.com/track/{number}'},
+                'disc_number': 1,
+                'track_number': number,
+                'duration_ms': 1000,
+            }
+
+        def get(url: str, headers: dict, params: dict = None, timeout: float = None):
+            if params is None:
+                album_json = self._album_json()
+                album_json['total_tracks'] = total
+                album_json['tracks'] = {
+                    'items': [track(number) for number in range(1, 51)],
+                    'offset': 0,
+                    'limit': 50,
+                    'total': total,
+                    'next': 'https://api.spotify.com/v1/albums/11/tracks?offset=50&limit=50',
+                }
+                return self._build_response_mock(json=album_json)
+
+            offset = params['offset']
+            numbers = range(offset + 1, min(offset + params['limit'], total) + 1)
+            return self._build_response_mock(json={'items': [track(number) for number in numbers]})
+
+        return get
+
+    def _album_json(self) -> dict:
+        return {
+            'id': '11',
+            'name': 'Pa morirse de amor',
+            'href': '',
+            'external_urls': {'spotify': 'https://open.spotify.com/album/11'},
+            'release_date': '2006-01-01',
+            'total_tracks': 1,
+            'artists': [{
+                'id': '12',
+                'name': 'Ely Guerra',
+                'href': '',
+                'external_urls': {'spotify': 'https://open.spotify.com/artist/12'},
+            }],
+            'tracks': {
+                'items': [{
+                    'id': '1',
+                    'name': 'Peligro',
+                    'href': '',
+                    'external_urls': {'spotify': 'https://open.spotify.com/track/1'},
+                    'disc_number': 1,
+                    'track_number': 1,
+                    'duration_ms': 1000,
+                }],
+            },
+        }
+
     def _build_response_mock(self,
                              code: int = 200,
                              text: str = '',
@@ -333,5 +784,6 @@ class TestSpotify:
         response_mock.status_code = code
         response_mock.text = text
         response_mock.json.return_value = json if json else {}
+        response_mock.content = dumps(response_mock.json.return_value).encode('utf-8')
 
         return response_mock
@@ -0,0 +1,24 @@
+import pytest
+
+from src.clients.spotify import Album, Artist, Track
+
+
+@pytest.fixture()
+def track() -> Track:
+    return Track('1', 'Peligro', '', 'http://spotify.com/track/1', 1, 1, 1000)
+
+
+class TestModels:
+    def test_models_are_slotted(self, track):
+        album = Album('11', 'Pa morirse de amor', '', '', '2006-01-01', 19, [], [track])
+
+        for entity in (track, album, Artist('12', 'Ely Guerra', '', '')):
+            assert not hasattr(entity, '__dict__')
+
+        with pytest.raises(AttributeError):
+            track.popularity = 10
+
+    def test_equality_and_repr(self, track):
+        assert track == Track('1', 'Peligro', '', 'http://spotify.com/track/1', 1, 1, 1000)
+        assert repr(track) == ("Track(id_='1', name='Peligro', href='', public_url='http://spotify.com/track/1', "
+                               "disc_number=1, track_number=1, duration=1000)")
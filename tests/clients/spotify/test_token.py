@@ -0,0 +1,62 @@
+from unittest.mock import patch
+
+from src.clients.spotify.token import TokenCache
+
+
+class TestTokenCache:
+    def test_get_when_empty(self):
+        cache = TokenCache()
+
+        assert cache.get('key') is None
+
+    def test_put_and_get(self):
+        cache = TokenCache()
+        cache.put('key', 'access-token', 3600)
+
+        assert cache.get('key') == 'access-token'
+
+    @patch('src.clients.spotify.token.time')
+    def test_get_when_expired(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = TokenCache(expiry_margin_secs=60)
+        cache.put('key', 'access-token', 3600)
+
+        time_mock.time.return_value = 1000 + 3600 - 60
+
+        assert cache.get('key') is None
+
+    def test_clear(self):
+        cache = TokenCache()
+        cache.put('key', 'access-token', 3600)
+        cache.clear()
+
+        assert cache.get('key') is None
+
+    def test_delete(self, tmp_path):
+        path = str(tmp_path / 'tokens.json')
+        cache = TokenCache(path)
+        cache.put('key', 'access-token', 3600)
+        cache.put('other', 'other-token', 3600)
+        cache.delete('key')
+        cache.delete('missing')
+
+        assert cache.get('key') is None
+        assert TokenCache(path).get('key') is None
+        assert TokenCache(path).get('other') == 'other-token'
+
+    def test_shared(self):
+        assert TokenCache.shared() is TokenCache.shared()
+        assert TokenCache.shared('/tmp/tokens.json') is not TokenCache.shared()
+
+    def test_persisted_to_file(self, tmp_path):
+        path = str(tmp_path / 'tokens.json')
+        TokenCache(path).put('key', 'access-token', 3600)
+
+        assert TokenCache(path).get('key') == 'access-token'
+        assert 'key' not in (tmp_path / 'tokens.json').read_text()
+
+    def test_ignores_corrupted_file(self, tmp_path):
+        path = tmp_path / 'tokens.json'
+        path.write_text('{not json')
+
+        assert TokenCache(str(path)).get('key') is None
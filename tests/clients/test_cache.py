@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+from src.clients.cache import LruCache, SqliteStore
+
+
+class TestLruCache:
+    def test_get_when_empty(self):
+        assert LruCache().get('key') is None
+
+    def test_put_and_get(self):
+        cache = LruCache()
+        cache.put('key', 'value', 60)
+
+        assert cache.get('key') == 'value'
+
+    @patch('src.clients.cache.time')
+    def test_get_when_expired(self, time_mock):
+        time_mock.time.return_value = 1000
+        cache = LruCache()
+        cache.put('key', 'value', 60)
+
+        time_mock.time.return_value = 1060
+
+        assert cache.get('key') is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = LruCache(max_entries=2)
+        cache.put('a', 1, 60)
+        cache.put('b', 2, 60)
+        cache.get('a')
+        cache.put('c', 3, 60)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_clear(self):
+        cache = LruCache()
+        cache.put('key', 'value', 60)
+        cache.clear()
+
+        assert cache.get('key') is None
+
+
+class TestSqliteStore:
+    def test_put_and_get(self, tmp_path):
+        store = SqliteStore(str(tmp_path / 'cache.db'), 'entries')
+        store.put('key', {'content': ['a', 'b']}, 60)
+
+        value, expires_at = store.get('key')
+
+        assert value == {'content': ['a', 'b']}
+        assert expires_at > 0
+
+    def test_persisted(self, tmp_path):
+        path = str(tmp_path / 'cache.db')
+        SqliteStore(path, 'entries').put('key', None, 60)
+
+        value, _ = SqliteStore(path, 'entries').get('key')
+
+        assert value is None
+
+    @patch('src.clients.cache.time')
+    def test_get_when_expired(self, time_mock, tmp_path):
+        time_mock.time.return_value = 1000
+        store = SqliteStore(str(tmp_path / 'cache.db'), 'entries')
+        store.put('key', 'value', 60)
+
+        time_mock.time.return_value = 1060
+
+        assert store.get('key') is None
+
+    @patch('src.clients.cache.time')
+    def test_purge_expired(self, time_mock, tmp_path):
+        time_mock.time.return_value = 1000
+        store = SqliteStore(str(tmp_path / 'cache.db'), 'entries')
+        store.put('old', 'value', 10)
+        store.put('new', 'value', 100)
+
+        time_mock.time.return_value = 1050
+        store.purge_expired()
+        time_mock.time.return_value = 0
+
+        assert store.get('old') is None
+        assert store.get('new') is not None
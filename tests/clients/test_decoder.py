@@ -0,0 +1,42 @@
+from unittest.mock import MagicMock
+
+import requests
+
+from src.clients.decoder import JsonDecoder, BACKEND
+
+
+def new_response(content: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    return response
+
+
+class TestJsonDecoder:
+    def test_backend(self):
+        assert BACKEND in ('orjson', 'json')
+
+    def test_decode(self):
+        decoder = JsonDecoder()
+
+        assert decoder.decode(new_response(b'{"name": "Peligro", "markets": ["MX"]}')) == {
+            'name': 'Peligro',
+            'markets': ['MX'],
+        }
+
+    def test_decode_reads_raw_content(self):
+        response = MagicMock()
+        response.content = b'{"name": "Peligro"}'
+
+        assert JsonDecoder().decode(response) == {'name': 'Peligro'}
+        response.json.assert_not_called()
+
+    def test_loads_text(self):
+        assert JsonDecoder().loads('{"name": "Corazón"}') == {'name': 'Corazón'}
+
+    def test_loads_with_custom_backend(self):
+        loads = MagicMock(return_value={'id': '1'})
+        decoder = JsonDecoder(loads=loads)
+
+        assert decoder.loads(b'{"id": "1"}') == {'id': '1'}
+        loads.assert_called_once_with(b'{"id": "1"}')
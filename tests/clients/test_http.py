@@ -0,0 +1,23 @@
+from src.clients.http import HttpConfig, shared_session, new_session, close_sessions
+
+
+class TestHttp:
+    def test_shared_session(self):
+        assert shared_session() is shared_session()
+        assert shared_session() is shared_session(HttpConfig())
+
+    def test_shared_session_per_config(self):
+        assert shared_session(HttpConfig(pool_maxsize=2)) is not shared_session()
+
+    def test_new_session_pool_sizes(self):
+        session = new_session(HttpConfig(pool_connections=2, pool_maxsize=3))
+        adapter = session.get_adapter('https://api.spotify.com')
+
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 3
+
+    def test_close_sessions(self):
+        session = shared_session()
+        close_sessions()
+
+        assert shared_session() is not session
@@ -0,0 +1,272 @@
+import asyncio
+from unittest.mock import MagicMock, AsyncMock, patch
+
+import pytest
+import requests
+
+from src.clients.retry import CircuitBreaker, CircuitOpenError, RetryConfig, RetryPolicy
+
+
+def build_response(code: int, headers: dict = None) -> MagicMock:
+    response = MagicMock()
+    response.status_code = code
+    response.headers = headers or {}
+    return response
+
+
+@pytest.fixture()
+def policy() -> RetryPolicy:
+    return RetryPolicy(RetryConfig(max_attempts=3, base_delay_secs=0.01, deadline_secs=5), CircuitBreaker())
+
+
+class TestCircuitBreaker:
+    def test_check_when_closed(self):
+        breaker = CircuitBreaker()
+
+        breaker.check()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_opens_after_failure_threshold(self):
+        breaker = CircuitBreaker('spotify', failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_failure()
+
+        with pytest.raises(CircuitOpenError, match='spotify is unavailable'):
+            breaker.check()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_success_resets_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        breaker.check()
+
+    @patch('src.clients.retry.time.monotonic')
+    def test_half_open_lets_a_single_probe_through(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_secs=30)
+        breaker.record_failure()
+
+        monotonic_mock.return_value = 131
+        breaker.check()
+
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.check()
+
+    @patch('src.clients.retry.time.monotonic')
+    def test_half_open_closes_on_success(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_secs=30)
+        breaker.record_failure()
+        monotonic_mock.return_value = 131
+        breaker.check()
+
+        breaker.record_success()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @patch('src.clients.retry.time.monotonic')
+    def test_half_open_opens_again_on_failure(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout_secs=30)
+        for _ in range(3):
+            breaker.record_failure()
+        monotonic_mock.return_value = 131
+        breaker.check()
+
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+
+    @patch('src.clients.retry.time.monotonic')
+    def test_release_probe_opens_again(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_secs=30)
+        breaker.record_failure()
+        monotonic_mock.return_value = 131
+        breaker.check()
+
+        breaker.release_probe()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        monotonic_mock.return_value = 162
+        breaker.check()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    def test_release_probe_when_closed(self):
+        breaker = CircuitBreaker()
+
+        breaker.release_probe()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_shared(self):
+        assert CircuitBreaker.shared('spotify') is CircuitBreaker.shared('spotify')
+        assert CircuitBreaker.shared('spotify') is not CircuitBreaker.shared('musixmatch')
+
+
+class TestRetryPolicy:
+    def test_call(self, policy):
+        request = MagicMock(return_value=build_response(200))
+
+        response = policy.call(request)
+
+        assert response.status_code == 200
+        request.assert_called_once()
+        assert 0 < request.call_args.args[0] <= 5
+
+    def test_call_retries_server_errors(self, policy):
+        request = MagicMock(side_effect=[build_response(503), build_response(502), build_response(200)])
+
+        response = policy.call(request)
+
+        assert response.status_code == 200
+        assert request.call_count == 3
+
+    def test_call_returns_last_response_when_attempts_run_out(self, policy):
+        request = MagicMock(return_value=build_response(500))
+
+        response = policy.call(request)
+
+        assert response.status_code == 500
+        assert request.call_count == 3
+
+    def test_call_does_not_retry_client_errors(self, policy):
+        request = MagicMock(return_value=build_response(404))
+
+        response = policy.call(request)
+
+        assert response.status_code == 404
+        request.assert_called_once()
+
+    def test_call_retries_transient_errors(self, policy):
+        request = MagicMock(side_effect=[requests.ConnectionError('reset'), build_response(200)])
+
+        assert policy.call(request).status_code == 200
+
+    def test_call_raises_last_transient_error(self, policy):
+        request = MagicMock(side_effect=requests.Timeout('timed out'))
+
+        with pytest.raises(requests.Timeout):
+            policy.call(request)
+        assert request.call_count == 3
+
+    @patch('src.clients.retry.time.sleep')
+    def test_call_respects_retry_after(self, sleep_mock, policy):
+        request = MagicMock(side_effect=[build_response(429, {'Retry-After': '2'}), build_response(200)])
+
+        policy.call(request)
+
+        sleep_mock.assert_called_once_with(2)
+
+    @patch('src.clients.retry.time.sleep')
+    def test_call_gives_up_when_retry_after_exceeds_deadline(self, sleep_mock, policy):
+        request = MagicMock(return_value=build_response(429, {'Retry-After': '60'}))
+
+        response = policy.call(request)
+
+        assert response.status_code == 429
+        request.assert_called_once()
+        sleep_mock.assert_not_called()
+
+    @patch('src.clients.retry.random.uniform')
+    @patch('src.clients.retry.time.sleep')
+    def test_call_backs_off_exponentially_with_jitter(self, sleep_mock, uniform_mock):
+        uniform_mock.side_effect = lambda low, high: high
+        policy = RetryPolicy(RetryConfig(max_attempts=4, base_delay_secs=0.5, max_delay_secs=1.5), CircuitBreaker())
+
+        policy.call(MagicMock(return_value=build_response(500)))
+
+        assert [call.args[0] for call in sleep_mock.call_args_list] == [0.5, 1, 1.5]
+
+    def test_call_with_custom_retryable(self, policy):
+        request = MagicMock(side_effect=[build_response(200), build_response(201)])
+
+        response = policy.call(request, lambda response: response.status_code == 200)
+
+        assert response.status_code == 201
+
+    def test_call_fails_fast_when_circuit_is_open(self):
+        breaker = CircuitBreaker(failure_threshold=3)
+        policy = RetryPolicy(RetryConfig(max_attempts=3, base_delay_secs=0), breaker)
+        request = MagicMock(return_value=build_response(503))
+        policy.call(request)
+
+        with pytest.raises(CircuitOpenError):
+            policy.call(request)
+        assert request.call_count == 3
+
+    def test_call_async(self, policy):
+        request = AsyncMock(side_effect=[build_response(503), build_response(200)])
+
+        response = asyncio.run(policy.call_async(request))
+
+        assert response.status_code == 200
+        assert request.await_count == 2
+
+    def test_call_async_fails_fast_when_circuit_is_open(self):
+        policy = RetryPolicy(RetryConfig(max_attempts=1), CircuitBreaker(failure_threshold=1))
+        request = AsyncMock(return_value=build_response(500))
+        asyncio.run(policy.call_async(request))
+
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(policy.call_async(request))
+
+    @patch('src.clients.retry.time.monotonic')
+    def test_call_reopens_circuit_when_probe_raises(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_secs=30)
+        breaker.record_failure()
+        monotonic_mock.return_value = 131
+        policy = RetryPolicy(RetryConfig(max_attempts=1), breaker)
+
+        with pytest.raises(ValueError):
+            policy.call(MagicMock(side_effect=ValueError('invalid body')))
+        assert breaker.state == CircuitBreaker.OPEN
+
+        monotonic_mock.return_value = 162
+        response = policy.call(MagicMock(return_value=build_response(200)))
+
+        assert response.status_code == 200
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_call_does_not_count_non_transient_errors_when_closed(self):
+        breaker = CircuitBreaker(failure_threshold=1)
+        policy = RetryPolicy(RetryConfig(max_attempts=1), breaker)
+
+        with pytest.raises(ValueError):
+            policy.call(MagicMock(side_effect=ValueError('invalid body')))
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    @patch('src.clients.retry.time.monotonic')
+    def test_call_async_reopens_circuit_when_probe_is_cancelled(self, monotonic_mock):
+        monotonic_mock.return_value = 100
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout_secs=30)
+        breaker.record_failure()
+        monotonic_mock.return_value = 131
+        policy = RetryPolicy(RetryConfig(max_attempts=1), breaker)
+
+        async def probe():
+            started = asyncio.Event()
+
+            async def request(timeout):
+                started.set()
+                await asyncio.Event().wait()
+
+            task = asyncio.create_task(policy.call_async(request))
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(probe())
+
+        assert breaker.state == CircuitBreaker.OPEN
+        monotonic_mock.return_value = 162
+        breaker.check()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import patch, MagicMock, AsyncMock
+
+import pytest
+import tweepy
+
+from src.clients.twitter import AsyncTwitter, AsyncTwitterLocal, TwitterConfig, PublishedTweet, TweetOutbox
+
+
+@pytest.fixture()
+@patch('src.clients.twitter.async_client.AsyncClient')
+def twitter(async_client_mock) -> AsyncTwitter:
+    response = MagicMock()
+    response.headers = {}
+    response.json = AsyncMock(return_value={'data': {'id': '123456'}})
+    async_client_mock.return_value.create_tweet = AsyncMock(return_value=response)
+
+    return AsyncTwitter(TwitterConfig(
+        'consumer-key',
+        'consumer-secret',
+        'access-token',
+        'access-token-secret',
+    ))
+
+
+class TestAsyncTwitter:
+    def test_post(self, twitter):
+        status = asyncio.run(twitter.post('tweet status'))
+
+        assert status == PublishedTweet('123456', 'tweet status', None)
+
+    def test_reply(self, twitter):
+        status = asyncio.run(twitter.reply('tweet status', '123456'))
+
+        assert status == PublishedTweet('123456', 'tweet status', None)
+        twitter._client.create_tweet.assert_awaited_once_with(
+            text='tweet status',
+            in_reply_to_tweet_id='123456',
+        )
+
+    def test_reply_thread(self, twitter):
+        replies = asyncio.run(twitter.reply_thread(['a', 'b'], 'head'))
+
+        assert replies == [
+            PublishedTweet('123456', 'a', None),
+            PublishedTweet('123456', 'b', None),
+        ]
+        twitter._client.create_tweet.assert_awaited_with(
+            text='b',
+            in_reply_to_tweet_id='123456',
+        )
+
+    def test_reply_thread_with_async_replies(self, twitter):
+        twitter._async_replies = True
+
+        async def reply_thread():
+            replies = await twitter.reply_thread(['a', 'b'], 'head')
+            pending = [reply.future.done() for reply in replies]
+            await twitter.wait_replies(1)
+
+            return replies, pending
+
+        replies, pending = asyncio.run(reply_thread())
+
+        assert pending == [False, False]
+        assert [reply.id_ for reply in replies] == ['123456', '123456']
+        assert not twitter._reply_tasks
+
+    def test_reply_thread_with_async_replies_reads_pending_ids(self, twitter):
+        twitter._async_replies = True
+
+        async def reply_thread():
+            replies = await twitter.reply_thread(['a', 'b'], 'head')
+            with pytest.raises(RuntimeError, match='Reply still pending'):
+                replies[0].id_
+
+            return [(await reply.published()).id_ for reply in replies], [reply.id_ for reply in replies]
+
+        published_ids, ids = asyncio.run(reply_thread())
+
+        assert published_ids == ids == ['123456', '123456']
+
+    def test_reply_thread_with_async_replies_fails_remaining_replies(self, twitter):
+        twitter._async_replies = True
+        twitter._client.create_tweet.side_effect = Exception('service unavailable')
+
+        async def reply_thread():
+            replies = await twitter.reply_thread(['a', 'b'], 'head')
+            return await asyncio.gather(*[reply.future for reply in replies], return_exceptions=True)
+
+        results = asyncio.run(reply_thread())
+
+        assert [str(result) for result in results] == ['service unavailable', 'service unavailable']
+
+    def test_resume_replies(self, twitter):
+        twitter._outbox = TweetOutbox(lease_secs=0)
+        twitter._outbox.plan(['a', 'b'], 'head')
+        twitter._outbox.confirm('head', PublishedTweet('1', 'a', None))
+
+        replies = asyncio.run(twitter.resume_replies())
+
+        assert replies == [PublishedTweet('123456', 'b', None)]
+        twitter._client.create_tweet.assert_awaited_once_with(
+            text='b',
+            in_reply_to_tweet_id='1',
+        )
+        assert twitter._outbox.pending() == []
+
+    @patch('asyncio.sleep')
+    def test_post_when_rate_limited(self, sleep_mock, twitter):
+        rate_limited = MagicMock()
+        rate_limited.status = 429
+        rate_limited.headers = {'retry-after': '30'}
+        response = twitter._client.create_tweet.return_value
+        twitter._client.create_tweet.side_effect = [
+            tweepy.TooManyRequests(rate_limited, response_json={}),
+            response,
+        ]
+
+        status = asyncio.run(twitter.post('tweet status'))
+
+        assert status == PublishedTweet('123456', 'tweet status', None)
+        assert sleep_mock.await_args.args[0] == pytest.approx(30, abs=1)
+        assert twitter.rate_limit_budget().rate_limited == 1
+
+
+class TestAsyncTwitterLocal:
+    def test_post(self):
+        twitter = AsyncTwitterLocal(TwitterConfig('key', 'secret', 'token', 'token-secret'))
+
+        status = asyncio.run(twitter.post('tweet status'))
+
+        assert status == PublishedTweet('fake-status-id', 'tweet status', None)
@@ -1,17 +1,34 @@
+import time
 from unittest.mock import patch, MagicMock
 
 import pytest
+import tweepy
 
 from src.clients.twitter.client import Twitter, TwitterConfig
 from src.clients.twitter.models import PublishedTweet
+from src.clients.twitter.outbox import TweetOutbox, OutboxThread
+from src.clients.twitter.ratelimit import RateLimitGovernor
+
+
+def new_response(status_id: str, headers: dict = None) -> MagicMock:
+    response = MagicMock()
+    response.headers = headers or {}
+    response.json.return_value = {'data': {'id': status_id}}
+    return response
+
+
+def new_rate_limited(headers: dict) -> tweepy.TooManyRequests:
+    response = MagicMock()
+    response.status_code = 429
+    response.headers = headers
+    response.json.return_value = {}
+    return tweepy.TooManyRequests(response)
 
 
 @pytest.fixture()
 @patch('src.clients.twitter.client.tweepy.Client')
 def twitter(tweepy_client_mock) -> Twitter:
-    status = MagicMock()
-    status.data = {'id': '123456'}
-    tweepy_client_mock.return_value.create_tweet = MagicMock(return_value=status)
+    tweepy_client_mock.return_value.create_tweet = MagicMock(return_value=new_response('123456'))
 
     return Twitter(TwitterConfig(
         'consumer-key',
@@ -21,6 +38,10 @@ def twitter(tweepy_client_mock) -> Twitter:
     ))
 
 
+def new_status(text: str, in_reply_to_tweet_id: str) -> MagicMock:
+    return new_response(f'{in_reply_to_tweet_id}>{text}')
+
+
 class TestTwitter:
     def test_constructor(self, twitter):
         assert twitter._consumer_key == 'consumer-key'
@@ -39,5 +60,105 @@ class TestTwitter:
 
         assert status == PublishedTweet('123456', 'tweet status', None)
 
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_reply_with_delay(self, sleep_mock, twitter):
+        twitter._governor = RateLimitGovernor(pacing=True, fallback_interval_secs=3)
+
+        twitter.reply('tweet status', '123456')
+        twitter.reply('tweet status', '123456')
+
+        sleep_mock.assert_called_once()
+        assert sleep_mock.call_args.args[0] == pytest.approx(3, abs=0.1)
+
+    def test_post_observes_rate_limit_headers(self, twitter):
+        reset_at = int(time.time()) + 900
+        twitter._client.create_tweet.return_value = new_response('123456', {
+            'x-rate-limit-limit': '200',
+            'x-rate-limit-remaining': '150',
+            'x-rate-limit-reset': str(reset_at),
+        })
+
+        twitter.post('tweet status')
+
+        budget = twitter.rate_limit_budget()
+        assert budget.limit == 200
+        assert budget.remaining == 150
+        assert budget.reset_at == reset_at
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_post_when_rate_limited(self, sleep_mock, twitter):
+        twitter._client.create_tweet.side_effect = [
+            new_rate_limited({'retry-after': '30'}),
+            new_response('123456'),
+        ]
+
+        status = twitter.post('tweet status')
+
+        assert status == PublishedTweet('123456', 'tweet status', None)
+        assert sleep_mock.call_args.args[0] == pytest.approx(30, abs=1)
+        assert twitter.rate_limit_budget().rate_limited == 1
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_post_when_rate_limited_too_many_times(self, sleep_mock, twitter):
+        twitter._client.create_tweet.side_effect = new_rate_limited({})
+
+        with pytest.raises(tweepy.TooManyRequests):
+            twitter.post('tweet status')
+
+        assert twitter._client.create_tweet.call_count == Twitter.MAX_RATE_LIMITED_ATTEMPTS
+
+    def test_reply_thread(self, twitter):
+        twitter._client.create_tweet.side_effect = lambda text, in_reply_to_tweet_id: new_status(text, in_reply_to_tweet_id)
+
+        replies = twitter.reply_thread(['a', 'b'], 'head')
+
+        assert replies == [
+            PublishedTweet('head>a', 'a', None),
+            PublishedTweet('head>a>b', 'b', None),
+        ]
+        assert twitter._scheduler is None
+
+    def test_reply_thread_with_async_replies(self, twitter):
+        twitter._async_replies = True
+        twitter._client.create_tweet.side_effect = lambda text, in_reply_to_tweet_id: new_status(text, in_reply_to_tweet_id)
+
+        replies = twitter.reply_thread(['a', 'b'], 'head')
+
+        assert [reply.tweet for reply in replies] == ['a', 'b']
+        assert twitter.wait_replies(1)
+        assert [reply.id_ for reply in replies] == ['head>a', 'head>a>b']
+
+    def test_reply_thread_with_outbox(self, twitter):
+        twitter._outbox = TweetOutbox()
+        twitter._client.create_tweet.side_effect = [
+            new_status('a', 'head'),
+            Exception('connection reset'),
+        ]
+
+        with pytest.raises(Exception, match='connection reset'):
+            twitter.reply_thread(['a', 'b', 'c'], 'head')
+
+        assert twitter._outbox.pending() == [OutboxThread('head', 'head>a', ['b', 'c'])]
+
+    def test_resume_replies(self, twitter):
+        twitter._outbox = TweetOutbox(lease_secs=0)
+        twitter._outbox.plan(['a', 'b', 'c'], 'head')
+        twitter._outbox.confirm('head', PublishedTweet('head>a', 'a', None))
+        twitter._client.create_tweet.side_effect = lambda text, in_reply_to_tweet_id: new_status(text, in_reply_to_tweet_id)
+
+        replies = twitter.resume_replies()
+
+        assert replies == [
+            PublishedTweet('head>a>b', 'b', None),
+            PublishedTweet('head>a>b>c', 'c', None),
+        ]
+        assert twitter._outbox.pending() == []
+
+    def test_resume_replies_without_outbox(self, twitter):
+        assert twitter.resume_replies() == []
+
+    def test_wait_replies_without_scheduled_replies(self, twitter):
+        assert twitter.wait_replies(0)
+
     def test_max_tweet_length(self, twitter):
         assert twitter.max_tweet_length == 280
@@ -0,0 +1,117 @@
+import sqlite3
+from unittest.mock import patch
+
+from src.clients.twitter import TweetOutbox, OutboxThread, PublishedTweet
+
+
+class TestTweetOutbox:
+    def test_plan(self):
+        outbox = TweetOutbox()
+
+        planned = outbox.plan(iter(['a', 'b']), 'head')
+
+        assert planned == ['a', 'b']
+        assert outbox.pending() == [OutboxThread('head', 'head', ['a', 'b'])]
+
+    def test_plan_twice_does_not_duplicate_replies(self):
+        outbox = TweetOutbox()
+
+        outbox.plan(['a', 'b'], 'head')
+        outbox.plan(['a', 'b'], 'head')
+
+        assert outbox.pending() == [OutboxThread('head', 'head', ['a', 'b'])]
+
+    def test_confirm(self):
+        outbox = TweetOutbox()
+        outbox.plan(['a', 'b', 'c'], 'head')
+
+        outbox.confirm('head', PublishedTweet('1', 'a', None))
+
+        assert outbox.pending() == [OutboxThread('head', '1', ['b', 'c'])]
+
+    def test_confirm_last_reply_removes_thread(self):
+        outbox = TweetOutbox()
+        outbox.plan(['a', 'b'], 'head')
+
+        outbox.confirm('head', PublishedTweet('1', 'a', None))
+        outbox.confirm('1', PublishedTweet('2', 'b', None))
+
+        assert outbox.pending() == []
+
+    def test_confirm_unknown_parent(self):
+        outbox = TweetOutbox()
+        outbox.plan(['a'], 'head')
+
+        outbox.confirm('other', PublishedTweet('1', 'a', None))
+
+        assert outbox.pending() == [OutboxThread('head', 'head', ['a'])]
+
+    def test_pending_survives_restart(self, tmp_path):
+        path = str(tmp_path / 'outbox.db')
+        outbox = TweetOutbox(path)
+        outbox.plan(['a', 'b'], 'head')
+        outbox.confirm('head', PublishedTweet('1', 'a', None))
+        outbox.close()
+
+        assert TweetOutbox(path).pending() == [OutboxThread('head', '1', ['b'])]
+
+    def test_claim_skips_thread_being_sent(self):
+        outbox = TweetOutbox()
+        outbox.plan(['a', 'b'], 'head')
+
+        assert outbox.claim() == []
+
+    @patch('src.clients.twitter.outbox.time.time')
+    def test_claim_expired_thread(self, time_mock):
+        outbox = TweetOutbox(lease_secs=60)
+        time_mock.return_value = 1000
+        outbox.plan(['a', 'b'], 'head')
+
+        time_mock.return_value = 1060
+        assert outbox.claim() == [OutboxThread('head', 'head', ['a', 'b'])]
+        assert outbox.claim() == []
+
+    @patch('src.clients.twitter.outbox.time.time')
+    def test_confirm_renews_claim(self, time_mock):
+        outbox = TweetOutbox(lease_secs=60)
+        time_mock.return_value = 1000
+        outbox.plan(['a', 'b'], 'head')
+
+        time_mock.return_value = 1050
+        outbox.confirm('head', PublishedTweet('1', 'a', None))
+
+        time_mock.return_value = 1100
+        assert outbox.claim() == []
+
+    @patch('src.clients.twitter.outbox.time.time')
+    def test_claim_once_across_processes(self, time_mock, tmp_path):
+        path = str(tmp_path / 'outbox.db')
+        time_mock.return_value = 1000
+        TweetOutbox(path, lease_secs=60).plan(['a', 'b'], 'head')
+
+        time_mock.return_value = 2000
+        first = TweetOutbox(path, lease_secs=60).claim()
+        second = TweetOutbox(path, lease_secs=60).claim()
+
+        assert first == [OutboxThread('head', 'head', ['a', 'b'])]
+        assert second == []
+
+    def test_adds_claim_column_to_old_outbox(self, tmp_path):
+        path = str(tmp_path / 'outbox.db')
+        connection = sqlite3.connect(path)
+        connection.execute(
+            'CREATE TABLE outbox '
+            '(thread_id TEXT NOT NULL, position INTEGER NOT NULL, tweet TEXT NOT NULL, '
+            'parent_id TEXT, published_id TEXT, planned_at REAL NOT NULL, '
+            'PRIMARY KEY (thread_id, position))'
+        )
+        connection.execute("INSERT INTO outbox VALUES ('head', 0, 'a', 'head', NULL, 0)")
+        connection.commit()
+        connection.close()
+
+        assert TweetOutbox(path).claim() == [OutboxThread('head', 'head', ['a'])]
+
+    def test_shared(self, tmp_path):
+        path = str(tmp_path / 'outbox.db')
+
+        assert TweetOutbox.shared(path) is TweetOutbox.shared(path)
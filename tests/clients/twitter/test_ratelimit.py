@@ -0,0 +1,135 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.clients.twitter.ratelimit import RateLimitGovernor, RateLimitExceeded
+
+
+def rate_limit_headers(remaining: int, reset_in_secs: int, limit: int = 200) -> dict:
+    return {
+        'x-rate-limit-limit': str(limit),
+        'x-rate-limit-remaining': str(remaining),
+        'x-rate-limit-reset': str(int(time.time()) + reset_in_secs),
+    }
+
+
+class TestRateLimitGovernor:
+    def test_acquire_without_pacing(self):
+        governor = RateLimitGovernor()
+
+        assert [governor.acquire() for _ in range(5)] == [0, 0, 0, 0, 0]
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_acquire_with_fallback_interval(self, sleep_mock):
+        governor = RateLimitGovernor(pacing=True, fallback_interval_secs=3)
+
+        assert governor.acquire() == 0
+        assert governor.acquire() == pytest.approx(3, abs=0.1)
+        assert governor.acquire() == pytest.approx(6, abs=0.1)
+        assert sleep_mock.call_count == 2
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_acquire_keeps_min_interval_with_headroom(self, sleep_mock):
+        governor = RateLimitGovernor(pacing=True, fallback_interval_secs=3, min_interval_secs=1)
+        governor.observe(rate_limit_headers(remaining=199, reset_in_secs=900))
+
+        waits = [governor.acquire() for _ in range(4)]
+
+        assert waits == pytest.approx([0, 1, 2, 3], abs=0.1)
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_acquire_spreads_the_budget_close_to_exhaustion(self, sleep_mock):
+        governor = RateLimitGovernor(pacing=True, fallback_interval_secs=3, min_interval_secs=1, reserve=10)
+        governor.acquire()
+        governor.observe(rate_limit_headers(remaining=5, reset_in_secs=100))
+
+        assert governor.acquire() == pytest.approx(20, abs=1)
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_acquire_raises_when_reset_is_too_far(self, sleep_mock):
+        governor = RateLimitGovernor(max_wait_secs=15 * 60)
+        governor.observe(rate_limit_headers(remaining=0, reset_in_secs=24 * 60 * 60))
+
+        with pytest.raises(RateLimitExceeded) as error:
+            governor.acquire()
+
+        assert error.value.wait_secs == pytest.approx(24 * 60 * 60, abs=1)
+        sleep_mock.assert_not_called()
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_on_rate_limited_raises_when_reset_is_too_far(self, sleep_mock):
+        governor = RateLimitGovernor()
+        governor.on_rate_limited(rate_limit_headers(remaining=0, reset_in_secs=60 * 60))
+
+        with pytest.raises(RateLimitExceeded):
+            governor.acquire()
+
+        sleep_mock.assert_not_called()
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_acquire_waits_for_reset_when_budget_is_exhausted(self, sleep_mock):
+        governor = RateLimitGovernor()
+        governor.observe(rate_limit_headers(remaining=0, reset_in_secs=60))
+
+        assert governor.acquire() == pytest.approx(60, abs=1)
+        assert governor.budget().remaining is None
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_on_rate_limited_with_reset(self, sleep_mock):
+        governor = RateLimitGovernor()
+        governor.on_rate_limited(rate_limit_headers(remaining=0, reset_in_secs=120))
+
+        assert governor.acquire() == pytest.approx(120, abs=1)
+        assert governor.budget().rate_limited == 1
+
+    @patch('src.clients.twitter.ratelimit.time.sleep')
+    def test_on_rate_limited_with_retry_after(self, sleep_mock):
+        governor = RateLimitGovernor()
+        governor.on_rate_limited({'retry-after': '30'})
+
+        assert governor.acquire() == pytest.approx(30, abs=1)
+
+    def test_on_rate_limited_without_hints_backs_off(self):
+        governor = RateLimitGovernor(backoff_secs=5)
+
+        governor.on_rate_limited({})
+        first_reset_at = governor.budget().reset_at
+        governor.on_rate_limited({})
+        second_reset_at = governor.budget().reset_at
+
+        assert first_reset_at - time.time() == pytest.approx(5, abs=1)
+        assert second_reset_at - time.time() == pytest.approx(10, abs=1)
+
+    def test_budget(self):
+        governor = RateLimitGovernor(pacing=True)
+        governor.observe(rate_limit_headers(remaining=100, reset_in_secs=100, limit=200))
+
+        budget = governor.budget()
+
+        assert budget.limit == 200
+        assert budget.remaining == 100
+        assert budget.rate_per_sec == pytest.approx(1, abs=0.05)
+        assert budget.next_in_secs == 0
+        assert budget.throttled_secs == 0
+        assert budget.rate_limited == 0
+
+    def test_observe_ignores_missing_headers(self):
+        governor = RateLimitGovernor()
+        governor.observe({'x-rate-limit-remaining': 'unknown'})
+
+        assert governor.budget().remaining is None
+
+    @patch('asyncio.sleep')
+    def test_acquire_async(self, sleep_mock):
+        governor = RateLimitGovernor(pacing=True, fallback_interval_secs=3)
+
+        async def acquire():
+            return [await governor.acquire_async(), await governor.acquire_async()]
+
+        waits = asyncio.run(acquire())
+
+        assert waits[0] == 0
+        assert waits[1] == pytest.approx(3, abs=0.1)
+        sleep_mock.assert_awaited_once()
@@ -0,0 +1,78 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.clients.twitter.models import PublishedTweet
+from src.clients.twitter.scheduler import ReplyScheduler
+
+
+def send_reply(tweet: str, tweet_id: str) -> PublishedTweet:
+    return PublishedTweet(f'{tweet_id}>{tweet}', tweet, None)
+
+
+class TestReplyScheduler:
+    def test_schedule_thread(self):
+        scheduler = ReplyScheduler(send_reply)
+
+        replies = scheduler.schedule_thread(['a', 'b', 'c'], 'head')
+
+        assert [reply.tweet for reply in replies] == ['a', 'b', 'c']
+        assert scheduler.wait(1)
+        assert [reply.id_ for reply in replies] == ['head>a', 'head>a>b', 'head>a>b>c']
+
+    def test_published_awaits_thread_replies(self):
+        scheduler = ReplyScheduler(send_reply)
+
+        async def published(replies: list) -> list:
+            return [await reply.published() for reply in replies]
+
+        replies = scheduler.schedule_thread(['a', 'b'], 'head')
+
+        assert [reply.id_ for reply in asyncio.run(published(replies))] == ['head>a', 'head>a>b']
+
+    def test_schedule_thread_without_tweets(self):
+        scheduler = ReplyScheduler(send_reply)
+
+        assert scheduler.schedule_thread([], 'head') == []
+        assert scheduler._worker is None
+
+    def test_schedule_thread_returns_before_replies_are_sent(self):
+        release = threading.Event()
+        scheduler = ReplyScheduler(lambda tweet, tweet_id: release.wait() and send_reply(tweet, tweet_id))
+
+        replies = scheduler.schedule_thread(['a', 'b'], 'head')
+
+        assert not replies[0].future.done()
+        release.set()
+        assert scheduler.wait(1)
+        assert replies[1].id_ == 'head>a>b'
+
+    def test_schedule_thread_fails_remaining_replies(self):
+        error = Exception('service unavailable')
+        scheduler = ReplyScheduler(MagicMock(side_effect=[send_reply('a', 'head'), error]))
+
+        replies = scheduler.schedule_thread(['a', 'b', 'c'], 'head')
+        scheduler.wait(1)
+
+        assert replies[0].id_ == 'head>a'
+        for reply in replies[1:]:
+            with pytest.raises(Exception, match='service unavailable'):
+                reply.id_
+
+    def test_schedule_thread_cancels_remaining_replies(self):
+        release = threading.Event()
+        scheduler = ReplyScheduler(lambda tweet, tweet_id: release.wait() and send_reply(tweet, tweet_id))
+
+        replies = scheduler.schedule_thread(['a', 'b', 'c'], 'head')
+        replies[1].future.cancel()
+        release.set()
+        scheduler.wait(1)
+
+        assert replies[0].id_ == 'head>a'
+        assert replies[1].future.cancelled()
+        assert replies[2].future.cancelled()
+
+    def test_wait_without_threads(self):
+        assert ReplyScheduler(send_reply).wait(0)
@@ -0,0 +1,34 @@
+import unicodedata
+
+from src.templates.hashtag import build_hashtag
+
+
+class TestHashtag:
+    def test_build_hashtag(self):
+        assert build_hashtag('') == ''
+        assert build_hashtag(None) == ''
+        assert build_hashtag('Ely Guerra') == '#ElyGuerra'
+        assert build_hashtag('pa morirse de amor') == '#PaMorirseDeAmor'
+        assert build_hashtag('AC/DC') == '#ACDC'
+        assert build_hashtag('  alone   ') == '#Alone'
+
+    def test_build_hashtag_with_unicode_separators(self):
+        assert build_hashtag('ely\tguerra') == '#ElyGuerra'
+        assert build_hashtag('ely guerra') == '#ElyGuerra'
+
+    def test_build_hashtag_with_accents(self):
+        assert build_hashtag('Sigur Rós') == '#SigurRós'
+        assert build_hashtag('mötley crüe') == '#MötleyCrüe'
+
+    def test_build_hashtag_with_decomposed_accents(self):
+        assert build_hashtag(unicodedata.normalize('NFD', 'Beyoncé')) == '#Beyoncé'
+
+    def test_build_hashtag_with_combining_marks(self):
+        assert build_hashtag('हिंदी गाना') == '#हिंदीगाना'
+
+    def test_build_hashtag_is_memoized(self):
+        build_hashtag.cache_clear()
+        build_hashtag('Ely Guerra')
+        build_hashtag('Ely Guerra')
+
+        assert build_hashtag.cache_info().hits == 1
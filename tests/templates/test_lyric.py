@@ -0,0 +1,105 @@
+import pytest
+from tweet_counter import count_tweet
+
+from src.templates import TweetPacker, LyricSplitter
+
+
+class TestLyricSplitter:
+    def test_split_short_paragraphs(self):
+        splitter = LyricSplitter(TweetPacker(280))
+
+        assert list(splitter.split(['lyric1', 'lyric2\nlyric3'])) == ['lyric1', 'lyric2\nlyric3']
+
+    def test_split_long_paragraph_in_groups_of_lines(self):
+        splitter = LyricSplitter(TweetPacker(20))
+        paragraph = '\n'.join(['abc'] * 6)
+
+        assert list(splitter.split([paragraph])) == ['abc\nabc\nabc\nabc', 'abc\nabc']
+
+    def test_split_group_over_budget(self):
+        splitter = LyricSplitter(TweetPacker(20))
+        paragraph = '\n'.join(['123456789'] * 4)
+
+        assert list(splitter.split([paragraph])) == ['123456789\n123456789', '123456789\n123456789']
+
+    def test_split_line_over_budget_on_words(self):
+        splitter = LyricSplitter(TweetPacker(10))
+
+        assert list(splitter.split(['uno dos tres cuatro cinco'])) == ['uno dos', 'tres', 'cuatro', 'cinco']
+
+    def test_split_word_over_budget(self):
+        splitter = LyricSplitter(TweetPacker(4))
+
+        assert list(splitter.split(['abcdefghij'])) == ['abcd', 'efgh', 'ij']
+
+    def test_split_is_lazy(self):
+        splitter = LyricSplitter(TweetPacker(280))
+
+        def paragraphs():
+            yield 'lyric1'
+            raise AssertionError('read too far')
+
+        assert next(splitter.split(paragraphs())) == 'lyric1'
+
+    def test_split_always_fits(self):
+        splitter = LyricSplitter(TweetPacker(280))
+        paragraphs = [
+            '\n'.join(['corazón ' * 20] * 4),
+            'amor ' * 200,
+            '🔥' * 300,
+            '\n'.join(['luna'] * 3),
+        ]
+
+        tweets = list(splitter.split(paragraphs))
+
+        assert all(count_tweet(tweet) <= 280 for tweet in tweets)
+        assert ''.join(tweets).replace('\n', '').replace(' ', '') == ''.join(paragraphs).replace('\n', '').replace(' ', '')
+
+    def test_split_with_invalid_objective(self):
+        with pytest.raises(ValueError):
+            LyricSplitter(TweetPacker(280), objective='shortest')
+
+    def test_split_fewest_joins_stanzas(self):
+        splitter = LyricSplitter(TweetPacker(12), objective=LyricSplitter.FEWEST)
+
+        assert list(splitter.split(['abc', 'def', 'ghijklmnop', 'q'])) == ['abc\n\ndef', 'ghijklmnop', 'q']
+
+    def test_split_fewest_fills_lines_of_long_stanzas(self):
+        splitter = LyricSplitter(TweetPacker(20), objective=LyricSplitter.FEWEST)
+        paragraph = '\n'.join(['abc'] * 6)
+
+        assert list(splitter.split(['intro', paragraph, 'outro'])) == [
+            'intro',
+            'abc\nabc\nabc\nabc\nabc',
+            'abc',
+            'outro',
+        ]
+
+    def test_split_balanced(self):
+        splitter = LyricSplitter(TweetPacker(20), objective=LyricSplitter.BALANCED)
+        paragraph = '\n'.join(['abc'] * 6)
+
+        assert list(splitter.split([paragraph])) == ['abc\nabc\nabc', 'abc\nabc\nabc']
+
+    @pytest.mark.parametrize('objective', LyricSplitter.OBJECTIVES)
+    def test_split_keeps_lines_and_budget(self, objective):
+        splitter = LyricSplitter(TweetPacker(280), objective=objective)
+        paragraphs = [
+            '\n'.join(f'linea {line} de la estrofa {stanza} 🔥' for line in range(stanza % 9 + 1))
+            for stanza in range(30)
+        ] + ['amor ' * 100]
+
+        tweets = list(splitter.split(paragraphs))
+
+        assert all(count_tweet(tweet) <= 280 for tweet in tweets)
+        assert ' '.join(tweets).split() == ' '.join(paragraphs).split()
+
+    @pytest.mark.parametrize('objective', LyricSplitter.OBJECTIVES)
+    def test_split_skips_blank_lines_next_to_long_lines(self, objective):
+        splitter = LyricSplitter(TweetPacker(280), objective=objective)
+
+        tweets = list(splitter.split([' \n' + 'b' * 300 + '\nc\nd\ne', '  ']))
+
+        assert all(tweet.strip() for tweet in tweets)
+        assert all(count_tweet(tweet) <= 280 for tweet in tweets)
+        assert ''.join(tweets).replace('\n', '') == 'b' * 300 + 'cde'
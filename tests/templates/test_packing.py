@@ -0,0 +1,49 @@
+from src.templates import TweetPacker
+
+
+class TestTweetPacker:
+    def test_weight(self):
+        packer = TweetPacker(280)
+
+        assert packer.weight('hello') == 5
+        assert packer.weight('⏳') == 2
+        assert packer.weight('http://spotify.com/album/11?si=g') == 23
+
+    def test_max_length(self):
+        assert TweetPacker(280).max_length == 280
+
+    def test_fits(self):
+        packer = TweetPacker(10)
+
+        assert packer.fits('1' * 10)
+        assert not packer.fits('1' * 11)
+
+    def test_pack(self):
+        packer = TweetPacker(10)
+
+        tweets = list(packer.pack(['abc\n', 'def\n', 'ghi\n', 'jkl\n']))
+
+        assert tweets == ['abc\ndef\n', 'ghi\njkl\n']
+
+    def test_pack_when_fragment_fills_tweet(self):
+        packer = TweetPacker(4)
+
+        assert list(packer.pack(['abc\n', 'de\n'])) == ['abc\n', 'de\n']
+
+    def test_pack_when_fragment_overflows(self):
+        packer = TweetPacker(4)
+
+        assert list(packer.pack(['abcdef\n', 'g\n'])) == ['abcdef\n', 'g\n']
+
+    def test_pack_when_empty(self):
+        assert list(TweetPacker(280).pack([])) == []
+
+    def test_pack_is_lazy(self):
+        def fragments():
+            yield 'abc\n'
+            yield 'def\n'
+            raise AssertionError('read past the first tweet')
+
+        tweets = TweetPacker(4).pack(fragments())
+
+        assert next(tweets) == 'abc\n'
@@ -85,6 +85,27 @@ class TestTweetTemplate:
 
         assert template.to_tweet() == ''
 
+    def test_to_tweet_with_max_length(self, album_fixture, song_config_fixture):
+        template = TweetTemplate(album_fixture, song_config_fixture)
+
+        assert template.to_tweet(280) == template.to_tweet()
+
+    def test_to_tweet_with_max_length_drops_artists_hashtags(self, album_fixture, song_config_fixture):
+        template = TweetTemplate(album_fixture, song_config_fixture)
+
+        assert template.to_tweet(100) == ('Now listening 🔊🎶:\n\n'
+                                          'Track: 1. Peligro\n'
+                                          'Album: Pa morirse de amor\n'
+                                          'Artist: Ely Guerra\n\n'
+                                          '#gorrion #NowPlaying\n\n'
+                                          'http://spotify.com/track/1')
+
+    def test_to_tweet_with_max_length_without_footer(self, album_fixture, song_config_fixture):
+        song_config_fixture.with_footer = False
+        template = TweetTemplate(album_fixture, song_config_fixture)
+
+        assert template.to_tweet(10) == template.to_tweet()
+
     def test_header_with_header_true(self, album_fixture, song_config_fixture):
         song_config_fixture.with_header = True
         template = TweetTemplate(album_fixture, song_config_fixture)
@@ -327,6 +348,22 @@ class TestFooterTemplate:
 
         assert footer_template.to_footer() == ''
 
+    def test_to_footer_with_max_length(self, album_fixture, config_fixture):
+        config_fixture.footer_config.with_gorrion_hashtags = True
+        config_fixture.footer_config.with_album_hashtag = True
+        config_fixture.footer_config.with_artists_hashtag = True
+        footer_template = FooterTemplate(album_fixture, config_fixture.footer_config)
+
+        assert footer_template.to_footer(200) == '#gorrion #NowPlaying #PaMorirseDeAmor #ElyGuerra\n\n'
+        assert footer_template.to_footer(45) == '#gorrion #NowPlaying #PaMorirseDeAmor\n\n'
+        assert footer_template.to_footer(10) == '#gorrion #NowPlaying\n\n'
+
+    def test_to_footer_with_max_length_without_hashtags(self, album_fixture, config_fixture):
+        config_fixture.footer_config.with_album_media_link = True
+        footer_template = FooterTemplate(album_fixture, config_fixture.footer_config)
+
+        assert footer_template.to_footer(10) == 'http://spotify.com/album/11?si=g'
+
     def test_gorrion_hashtags_with_gorrion_hashtags_true(self,
                                                          album_fixture,
                                                          config_fixture):
@@ -0,0 +1,233 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.async_gorrion import AsyncGorrion
+from src.config import Config
+from src.clients.spotify import Track, Album, Artist, Playback
+from src.clients.musixmatch import Song, Lyric, SongNotFound
+from src.clients.twitter import AsyncTwitterLocal, PublishedTweet
+
+
+LATENCY_SECS = 0.05
+
+
+@pytest.fixture()
+def twitter():
+    return AsyncTwitterLocal(Config.get_twitter_config())
+
+
+@pytest.fixture()
+def album():
+    return Album(
+        id_='11',
+        name='Pa morirse de amor',
+        href='',
+        public_url='http://spotify.com/album/11',
+        release_date='2006-01-01',
+        total_tracks=19,
+        artists=[
+            Artist(
+                id_='12',
+                name='Ely Guerra',
+                href='',
+                public_url='http://spotify.com/artist/12',
+            )
+        ],
+        tracks=[
+            Track(
+                id_='1',
+                name='Peligro',
+                href='',
+                public_url='http://spotify.com/track/1',
+                disc_number=1,
+                track_number=1,
+                duration=1000,
+            )
+        ],
+    )
+
+
+def stub_backends(album: Album) -> tuple:
+    async def get_current_track():
+        await asyncio.sleep(LATENCY_SECS)
+        return album
+
+    async def search_song(song):
+        await asyncio.sleep(LATENCY_SECS)
+        return song
+
+    async def fetch_lyric(song):
+        await asyncio.sleep(LATENCY_SECS)
+        song.lyric = Lyric('123', '456', '789', ['lyric1', 'lyric2'])
+        return song
+
+    spotify = AsyncMock()
+    spotify.get_current_track.side_effect = get_current_track
+    spotify.get_current_album.side_effect = get_current_track
+    musixmatch = AsyncMock()
+    musixmatch.search_song.side_effect = search_song
+    musixmatch.fetch_lyric.side_effect = fetch_lyric
+
+    return spotify, musixmatch
+
+
+class TestAsyncGorrion:
+    def test_playing(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        tweet = asyncio.run(gorrion.playing())
+
+        assert tweet.tweet == (
+            'Now listening 🔊🎶:\n\n'
+            'Track: 1. Peligro\n'
+            'Album: Pa morirse de amor\n'
+            'Artist: Ely Guerra\n\n'
+            '#gorrion #NowPlaying #ElyGuerra\n\n'
+            'http://spotify.com/track/1'
+        )
+        assert tweet.entity == album
+
+    def test_playing_with_lyrics(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        tweets = asyncio.run(gorrion.playing_with_lyrics())
+
+        assert tweets[1:] == [
+            PublishedTweet(id_='fake-status-id', tweet='lyric1', entity=None),
+            PublishedTweet(id_='fake-status-id', tweet='lyric2', entity=None),
+        ]
+
+    def test_playing_with_lyrics_overlaps_lyric_search_and_song_tweet(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+
+        async def run():
+            # each side only returns once the other one started, they time
+            # out when run one after the other
+            posting = asyncio.Event()
+            searching = asyncio.Event()
+
+            async def post(tweet):
+                posting.set()
+                await asyncio.wait_for(searching.wait(), timeout=5)
+                return PublishedTweet('1', tweet, None)
+
+            async def search_song(song):
+                searching.set()
+                await asyncio.wait_for(posting.wait(), timeout=5)
+                return song
+
+            twitter.post = post
+            musixmatch.search_song.side_effect = search_song
+
+            return await AsyncGorrion(spotify, twitter, musixmatch).playing_with_lyrics()
+
+        tweets = asyncio.run(run())
+
+        assert [tweet.tweet for tweet in tweets[1:]] == ['lyric1', 'lyric2']
+
+    def test_playing_with_lyrics_without_pipeline(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch, pipeline=False)
+
+        tweets = asyncio.run(gorrion.playing_with_lyrics())
+
+        assert [tweet.tweet for tweet in tweets[1:]] == ['lyric1', 'lyric2']
+
+    def test_publish_track_with_lyrics(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        tweets = asyncio.run(gorrion.publish_track_with_lyrics(album))
+
+        assert tweets[0].entity == album
+        assert [tweet.tweet for tweet in tweets[1:]] == ['lyric1', 'lyric2']
+        spotify.get_current_track.assert_not_called()
+
+    def test_publish_track_with_lyrics_cancels_lyric_search_when_post_fails(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        twitter.post = AsyncMock(side_effect=RuntimeError('post failed'))
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(gorrion.publish_track_with_lyrics(album))
+
+        musixmatch.fetch_lyric.assert_not_called()
+
+    def test_playback(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        spotify.get_playback.return_value = Playback(album, True, 0, 1000)
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        playback = asyncio.run(gorrion.playback())
+
+        assert playback.album == album
+
+    def test_upcoming(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        spotify.get_queue.return_value = [album, album, album]
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        assert asyncio.run(gorrion.upcoming(2)) == [album, album]
+
+    def test_get_album(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        spotify.get_album.return_value = album
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        assert asyncio.run(gorrion.get_album(album)) == album
+        spotify.get_album.assert_awaited_once_with('11')
+
+    def test_constructor_does_not_start_threads(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        assert not hasattr(gorrion, '_executor')
+
+    def test_playing_album_with_tracks(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        tweets = asyncio.run(gorrion.playing_album_with_tracks())
+
+        assert tweets[1] == PublishedTweet(id_='fake-status-id', tweet='1.1) Peligro ⏳0:01', entity=None)
+
+    def test_get_lyric_when_song_not_found(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        musixmatch.search_song.side_effect = SongNotFound('Peligro')
+        gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+        song = asyncio.run(gorrion.get_lyric(album))
+
+        assert song == Song('Peligro', 'Ely Guerra', 'Pa morirse de amor')
+
+    def test_concurrent_updates_overlap(self, twitter, album):
+        spotify, musixmatch = stub_backends(album)
+        updates = 50
+
+        async def run():
+            # every update waits in spotify until all of them got there, a
+            # serialized loop would time out on the first one
+            arrived = []
+            all_arrived = asyncio.Event()
+
+            async def get_current_track():
+                arrived.append(True)
+                if len(arrived) == updates:
+                    all_arrived.set()
+                await asyncio.wait_for(all_arrived.wait(), timeout=5)
+                return album
+
+            spotify.get_current_track.side_effect = get_current_track
+            gorrion = AsyncGorrion(spotify, twitter, musixmatch)
+
+            return await asyncio.gather(*[gorrion.playing_with_lyrics()
+                                          for _ in range(updates)])
+
+        results = asyncio.run(run())
+
+        assert len(results) == updates
+        assert all(len(tweets) == 3 for tweets in results)
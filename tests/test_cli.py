@@ -1,7 +1,7 @@
 from unittest.mock import patch
 
 from src.cli import CLI
-from src.clients.twitter import PublishedTweet
+from src.clients.twitter import PublishedTweet, RateLimitExceeded
 from src.clients.spotify import SpotifyApiError
 
 
@@ -27,6 +27,17 @@ class TestCLI:
 
         print_mock.assert_called()
 
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_playing_when_rate_limit_exceeded(self, print_mock, gorrion_mock):
+        error = RateLimitExceeded(3600)
+        gorrion_mock.return_value.playing.side_effect = error
+
+        cli = CLI()
+
+        assert not cli.playing(True)
+        print_mock.assert_any_call(error)
+
     @patch('src.cli.Gorrion')
     @patch('builtins.print')
     def test_playing_with_lyrics(self, print_mock, gorrion_mock):
@@ -100,3 +111,112 @@ class TestCLI:
         cli.playing_album_with_tracks(True)
 
         print_mock.assert_called()
+
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_resume_replies(self, print_mock, gorrion_mock):
+        gorrion_mock.return_value.resume_replies.return_value = [
+            PublishedTweet('456', 'song-lyric1', None),
+            PublishedTweet('789', 'song-lyric2', None),
+        ]
+
+        cli = CLI()
+        cli.resume_replies(True, False)
+
+        print_mock.assert_any_call('[---------------------- Resume ---------------------]')
+        print_mock.assert_any_call('song-lyric1\n\nsong-lyric2')
+
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_resume_replies_when_rate_limit_exceeded(self, print_mock, gorrion_mock):
+        error = RateLimitExceeded(3600)
+        gorrion_mock.return_value.resume_replies.side_effect = error
+
+        cli = CLI()
+
+        assert not cli.resume_replies(True, False)
+        print_mock.assert_any_call(error)
+
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_batch(self, print_mock, gorrion_mock, tmp_path):
+        gorrion_mock.return_value.playing.return_value = PublishedTweet('123', 'song', None)
+        gorrion_mock.return_value.playing_album.return_value = PublishedTweet('456', 'album', None)
+        jobs = tmp_path / 'jobs.txt'
+        jobs.write_text('# morning jobs\nplaying -l\n\nalbum --local\nplaying -l\n')
+
+        cli = CLI()
+        results = cli.batch(str(jobs))
+
+        assert [result.job.command for result in results] == ['playing', 'album', 'playing']
+        assert all(result.ok and result.job.local for result in results)
+        assert gorrion_mock.call_count == 1
+        print_mock.assert_any_call('[---------------------- Batch ----------------------]')
+
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_batch_with_jsonl_jobs(self, print_mock, gorrion_mock, tmp_path):
+        gorrion_mock.return_value.playing_with_lyrics.return_value = [PublishedTweet('123', 'song', None)]
+        jobs = tmp_path / 'jobs.jsonl'
+        jobs.write_text('{"command": "lyric", "local": true, "delay": true}\n{"command": "playing"}\n')
+
+        cli = CLI()
+        results = cli.batch(str(jobs))
+
+        assert [(result.job.command, result.job.local, result.job.delay) for result in results] == [
+            ('lyric', True, True),
+            ('playing', False, False),
+        ]
+        assert gorrion_mock.call_count == 2
+
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_batch_when_jobs_fail(self, print_mock, gorrion_mock, tmp_path):
+        gorrion_mock.return_value.playing.side_effect = SpotifyApiError('spotify error')
+        gorrion_mock.return_value.playing_album.side_effect = Exception('boom')
+        jobs = tmp_path / 'jobs.txt'
+        jobs.write_text('playing -l\nalbum -l\nunknown\nresume -l\n')
+
+        cli = CLI()
+        results = cli.batch(str(jobs))
+
+        assert [result.ok for result in results] == [False, False, False, True]
+        print_mock.assert_any_call('Job failed: boom')
+        assert print_mock.call_args.args[0].startswith('4 jobs in ')
+        assert print_mock.call_args.args[0].endswith('ms, 3 failed')
+
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_batch_with_malformed_jobs(self, print_mock, gorrion_mock, tmp_path):
+        gorrion_mock.return_value.playing.return_value = PublishedTweet('123', 'song', None)
+        jobs = tmp_path / 'jobs.txt'
+        jobs.write_text('playing -l\n{"local": true}\nalbum "-l\n\n{"command": \nplaying -l\n')
+
+        cli = CLI()
+        results = cli.batch(str(jobs))
+
+        assert [(result.job.command, result.ok) for result in results] == [
+            ('playing', True),
+            ('{"local": true}', False),
+            ('album "-l', False),
+            ('{"command":', False),
+            ('playing', True),
+        ]
+        print_mock.assert_any_call('Invalid job on line 2: missing command')
+        print_mock.assert_any_call('Invalid job on line 3: No closing quotation')
+        assert print_mock.call_args.args[0].endswith('ms, 3 failed')
+
+    @patch('src.watcher.Watcher')
+    @patch('src.cli.Gorrion')
+    @patch('builtins.print')
+    def test_watch(self, print_mock, gorrion_mock, watcher_mock):
+        watcher_mock.return_value.run.side_effect = KeyboardInterrupt()
+        watcher_mock.return_value.polls = 3
+        watcher_mock.return_value.posts = 1
+
+        cli = CLI()
+        cli.watch(True, False)
+
+        watcher_mock.return_value.stop.assert_called_once()
+        print_mock.assert_any_call('[---------------------- Watch ----------------------]')
+        print_mock.assert_any_call('Watcher stopped after 3 polls and 1 posts')
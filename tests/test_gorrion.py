@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock
 
 import pytest
@@ -5,9 +6,12 @@ import pytest
 from src.gorrion import Gorrion
 from src.config import Config
 from src.clients.spotify import Track, Album, Artist
-from src.clients.musixmatch import Song, Lyric
-from src.clients.twitter import TwitterLocal, PublishedTweet
-from src.templates import TweetSongConfig, TweetAlbumConfig
+from src.clients.musixmatch import Song, Lyric, LyricCache, SongHasNoLyrics, ServiceError
+from src.clients.twitter import TwitterLocal, PublishedTweet, RateLimitGovernor
+from tweet_counter import count_tweet
+
+from src.tracing import tracer, MemoryRecorder
+from src.templates import TweetTemplate, TweetSongConfig, TweetAlbumConfig
 
 
 @pytest.fixture()
@@ -64,6 +68,14 @@ class TestGorrion:
         assert gorrion._twitter is not None
         assert gorrion._musixmatch is not None
 
+    def test_constructor_with_invalid_lyric_objective(self, twitter):
+        spotify_mock = MagicMock()
+
+        with pytest.raises(ValueError, match='Invalid lyric objective: fewset'):
+            Gorrion(spotify_mock, twitter, MagicMock(), lyric_objective='fewset')
+
+        spotify_mock.get_current_track.assert_not_called()
+
     def test_playing(self, twitter, album, song, lyric):
         spotify_mock = MagicMock()
         spotify_mock.get_current_track.return_value = album
@@ -168,6 +180,76 @@ class TestGorrion:
             PublishedTweet(id_='fake-status-id', tweet='lyric2', entity=None),
         ]
 
+    def test_playing_with_lyric_overlaps_lyric_search_and_song_tweet(self, twitter, album, song, lyric):
+        # each side only returns once the other one started, they deadlock
+        # into the timeout when run one after the other
+        posting = threading.Event()
+        searching = threading.Event()
+
+        def post(tweet):
+            posting.set()
+            assert searching.wait(timeout=5)
+            return PublishedTweet('1', tweet, None)
+
+        def search_song(song):
+            searching.set()
+            assert posting.wait(timeout=5)
+            return song
+
+        song.lyric = lyric
+        spotify_mock = MagicMock()
+        spotify_mock.get_current_track.return_value = album
+        musixmatch_mock = MagicMock()
+        musixmatch_mock.search_song.side_effect = search_song
+        musixmatch_mock.fetch_lyric.return_value = song
+        twitter.post = MagicMock(side_effect=post)
+
+        gorrion = Gorrion(spotify_mock, twitter, musixmatch_mock)
+
+        tweets = gorrion.playing_with_lyrics()
+
+        assert [tweet.tweet for tweet in tweets[1:]] == ['lyric1', 'lyric2']
+
+    def test_playing_with_lyric_without_pipeline(self, twitter, album, song, lyric):
+        calls = []
+        spotify_mock = MagicMock()
+        spotify_mock.get_current_track.return_value = album
+        musixmatch_mock = MagicMock()
+        musixmatch_mock.search_song.side_effect = lambda song: calls.append('search') or song
+        song.lyric = lyric
+        musixmatch_mock.fetch_lyric.return_value = song
+        post = twitter.post
+        twitter.post = MagicMock(side_effect=lambda tweet: calls.append('post') or post(tweet))
+
+        gorrion = Gorrion(spotify_mock, twitter, musixmatch_mock, pipeline=False)
+        tweets = gorrion.playing_with_lyrics()
+
+        assert calls == ['post', 'search']
+        assert len(tweets) == 3
+
+    def test_playing_with_lyric_records_spans(self, twitter, album, song, lyric):
+        spotify_mock = MagicMock()
+        spotify_mock.get_current_track.return_value = album
+        musixmatch_mock = MagicMock()
+        musixmatch_mock.search_song.return_value = song
+        song.lyric = lyric
+        musixmatch_mock.fetch_lyric.return_value = song
+        recorder = MemoryRecorder()
+        tracer.add_exporter(recorder)
+
+        try:
+            Gorrion(spotify_mock, twitter, musixmatch_mock).playing_with_lyrics()
+        finally:
+            tracer.remove_exporter(recorder)
+
+        root, = recorder.find('gorrion.playing_with_lyrics')
+        assert root.parent_id is None
+        for name in ('gorrion.get_lyric', 'gorrion.publish_track_with_lyrics'):
+            span, = recorder.find(name)
+            assert span.trace_id == root.trace_id
+            assert span.parent_id is not None
+        assert all(span.status == 'ok' for span in recorder.spans)
+
     def test_playing_album(self, twitter, album, song, lyric):
         spotify_mock = MagicMock()
         spotify_mock.get_current_track.return_value = album
@@ -274,6 +356,23 @@ class TestGorrion:
             ),
         ]
 
+    def test_upcoming(self, twitter, album):
+        spotify_mock = MagicMock()
+        spotify_mock.get_queue.return_value = [album, album, album]
+
+        gorrion = Gorrion(spotify_mock, twitter, MagicMock())
+
+        assert gorrion.upcoming(2) == [album, album]
+
+    def test_get_album(self, twitter, album):
+        spotify_mock = MagicMock()
+        spotify_mock.get_album.return_value = album
+
+        gorrion = Gorrion(spotify_mock, twitter, MagicMock())
+
+        assert gorrion.get_album(album) == album
+        spotify_mock.get_album.assert_called_once_with('11')
+
     def test_get_lyric(self, twitter, album, song, lyric):
         musixmatch_mock = MagicMock()
         musixmatch_mock.search_song.return_value = song
@@ -298,6 +397,55 @@ class TestGorrion:
             )
         )
 
+    def test_get_lyric_when_cached(self, twitter, album, lyric):
+        lyric_cache = LyricCache()
+        lyric_cache.put('1', 'Peligro', 'Ely Guerra', lyric)
+        musixmatch_mock = MagicMock()
+
+        gorrion = Gorrion(MagicMock(), twitter, musixmatch_mock, lyric_cache=lyric_cache)
+        song = gorrion.get_lyric(album)
+
+        assert song.lyric == lyric
+        musixmatch_mock.search_song.assert_not_called()
+
+    def test_get_lyric_caches_lyric(self, twitter, album, song, lyric):
+        lyric_cache = LyricCache()
+        song.lyric = lyric
+        musixmatch_mock = MagicMock()
+        musixmatch_mock.search_song.return_value = song
+        musixmatch_mock.fetch_lyric.return_value = song
+
+        gorrion = Gorrion(MagicMock(), twitter, musixmatch_mock, lyric_cache=lyric_cache)
+        gorrion.get_lyric(album)
+        gorrion.get_lyric(album)
+
+        musixmatch_mock.search_song.assert_called_once()
+        assert lyric_cache.stats()['hits'] == 1
+
+    def test_get_lyric_caches_song_without_lyrics(self, twitter, album):
+        lyric_cache = LyricCache()
+        musixmatch_mock = MagicMock()
+        musixmatch_mock.search_song.side_effect = SongHasNoLyrics('Peligro')
+
+        gorrion = Gorrion(MagicMock(), twitter, musixmatch_mock, lyric_cache=lyric_cache)
+        gorrion.get_lyric(album)
+        song = gorrion.get_lyric(album)
+
+        assert song.lyric is None
+        musixmatch_mock.search_song.assert_called_once()
+        assert lyric_cache.stats()['negative_hits'] == 1
+
+    def test_get_lyric_does_not_cache_service_errors(self, twitter, album):
+        lyric_cache = LyricCache()
+        musixmatch_mock = MagicMock()
+        musixmatch_mock.search_song.side_effect = ServiceError(500)
+
+        gorrion = Gorrion(MagicMock(), twitter, musixmatch_mock, lyric_cache=lyric_cache)
+        gorrion.get_lyric(album)
+        gorrion.get_lyric(album)
+
+        assert musixmatch_mock.search_song.call_count == 2
+
     def test_publish_track(self, twitter, album):
         gorrion = Gorrion(MagicMock(), twitter, MagicMock())
 
@@ -354,6 +502,28 @@ class TestGorrion:
             PublishedTweet(id_='fake-status-id', tweet='lyric2', entity=None),
         ]
 
+    def test_publish_lyrics_with_async_replies(self, twitter, song, lyric):
+        twitter._async_replies = True
+        # the pacing holds every reply until the test releases it, the
+        # lyrics must be scheduled without waiting for it
+        released = threading.Event()
+        twitter._governor = RateLimitGovernor(pacing=True)
+        twitter._governor.acquire = MagicMock(side_effect=lambda: released.wait(timeout=5) and 0)
+        gorrion = Gorrion(MagicMock(), twitter, MagicMock())
+
+        published_album = PublishedTweet('1', 'album', None)
+        song.lyric = lyric
+        scheduled_lyrics = gorrion.publish_lyrics(published_album, song)
+
+        assert not any(scheduled.future.done() for scheduled in scheduled_lyrics)
+        released.set()
+        assert [scheduled.tweet for scheduled in scheduled_lyrics] == ['lyric1', 'lyric2']
+        assert gorrion.wait_replies(1)
+        assert [scheduled.future.result() for scheduled in scheduled_lyrics] == [
+            PublishedTweet(id_='fake-status-id', tweet='lyric1', entity=None),
+            PublishedTweet(id_='fake-status-id', tweet='lyric2', entity=None),
+        ]
+
     def test_publish_lyrics_when_lyric_not_found(self, twitter, song):
         gorrion = Gorrion(MagicMock(), twitter, MagicMock())
 
@@ -431,6 +601,25 @@ class TestGorrion:
             ),
         ]
 
+    def test_publish_tracks_when_tracks_are_streamed(self, twitter, album):
+        gorrion = Gorrion(MagicMock(), twitter, MagicMock())
+
+        album.tracks = (Track(
+            id_=str(number),
+            name=f'Track {number}',
+            href='',
+            public_url=f'http://spotify.com/track/{number}',
+            disc_number=1,
+            track_number=number,
+            duration=2000,
+        ) for number in range(1, 31))
+
+        published_tracks = gorrion.publish_tracks(PublishedTweet('1', 'album', album))
+
+        assert len(published_tracks) == 3
+        assert published_tracks[0].tweet.startswith('1.1) Track 1 ⏳0:02\n')
+        assert published_tracks[-1].tweet.endswith('1.30) Track 30 ⏳0:02')
+
     def test_full_song_status(self, twitter, album):
         gorrion = Gorrion(MagicMock(), twitter, MagicMock())
 
@@ -476,9 +665,20 @@ class TestGorrion:
                           'Artist: Ely Guerra\n'
                           'Tracks: 19\n'
                           'Release: 2006\n\n'
-                          '#gorrion #NowPlaying #PaMorirseDeAmor\n\n'
+                          '#gorrion #NowPlaying\n\n'
                           'http://spotify.com/album/11?si=g')
 
+    def test_album_status_keeps_main_artists_hashtags(self, twitter, album):
+        album.artists = [Artist(str(number), f'Artist Number {number}', '', '') for number in range(1, 6)]
+        gorrion = Gorrion(MagicMock(), twitter, MagicMock())
+        full_status = TweetTemplate(album, TweetAlbumConfig()).to_tweet()
+        twitter.MAX_TWEET_LENGTH = count_tweet(full_status) - len(' #ArtistNumber5')
+
+        status = gorrion.build_status(album, TweetAlbumConfig())
+
+        assert count_tweet(status) == twitter.MAX_TWEET_LENGTH
+        assert '#PaMorirseDeAmor #ArtistNumber1 #ArtistNumber2 #ArtistNumber3 #ArtistNumber4\n\n' in status
+
     def test_is_valid_tweet_status_when_valid_status(self, twitter):
         gorrion = Gorrion(MagicMock(), twitter, MagicMock())
 
@@ -495,3 +695,11 @@ class TestGorrion:
         tweets = gorrion.lyrics_to_tweets(lyrics)
 
         assert tweets == ['lyric1', 'lyric2', 'lyric3']
+
+    def test_lyrics_to_tweets_long_lines(self, twitter):
+        lyrics = ['\n'.join(['corazón de fuego ' * 10] * 4)]
+        gorrion = Gorrion(MagicMock(), twitter, MagicMock())
+        tweets = gorrion.lyrics_to_tweets(lyrics)
+
+        assert len(tweets) == 4
+        assert all(gorrion.is_valid_tweet_status(tweet) for tweet in tweets)
@@ -0,0 +1,94 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASYNC_STACK = ('httpx', 'aiohttp', 'tweepy.asynchronous')
+COMMAND_STACK = ('tweepy', 'telegram', 'asyncio', 'sqlite3', 'src.clients.twitter', 'src.clients.musixmatch',
+                 'src.watcher', 'src.prefetch')
+
+
+def import_profile(module: str, env: dict = None) -> dict:
+    # -X importtime reports 'import time: self | cumulative | package' for
+    # every module loaded by a fresh interpreter
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT,
+        env=env if env is not None else os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        profile[name.strip()] = int(cumulative)
+
+    return profile
+
+
+def loaded_modules(code: str) -> set:
+    result = subprocess.run(
+        [sys.executable, '-c', f'{code}\nimport json, sys\nprint(json.dumps(list(sys.modules)))'],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+class TestImportTime:
+    def test_cli_does_not_load_async_or_telegram_stack(self):
+        profile = import_profile('src.cli')
+
+        assert 'src.cli' in profile
+        assert not [module for module in (*ASYNC_STACK, *COMMAND_STACK) if module in profile]
+
+    def test_cli_playing_does_not_load_musixmatch(self):
+        modules = loaded_modules('from src.cli import CLI\nCLI()._build_gorrion(True, False)')
+
+        assert 'src.clients.twitter' in modules
+        assert not [module for module in (*ASYNC_STACK, 'src.clients.musixmatch', 'asyncio', 'src.watcher')
+                    if module in modules]
+
+    def test_cli_lyric_loads_musixmatch(self):
+        modules = loaded_modules('from src.cli import CLI\nCLI()._build_gorrion(True, False, lyrics=True)')
+
+        assert 'src.clients.musixmatch' in modules
+
+    def test_gorrion_does_not_load_async_stack(self):
+        profile = import_profile('src.gorrion')
+
+        assert not [module for module in ASYNC_STACK if module in profile]
+
+    def test_telegram_bot_does_not_load_async_clients(self):
+        profile = import_profile('src.telegram_bot')
+
+        # telegram brings httpx on its own, the twitter async stack stays out
+        assert 'telegram' in profile
+        assert not [module for module in ('aiohttp', 'tweepy', 'src.clients.twitter', 'src.clients.musixmatch')
+                    if module in profile]
+
+    def test_telegram_bot_v2_imports_without_token(self):
+        env = {key: value for key, value in os.environ.items() if key != 'TELEGRAM_TOKEN'}
+
+        profile = import_profile('src.telegram_bot_v2', env)
+
+        assert 'src.telegram_bot_v2' in profile
+
+    @pytest.mark.parametrize('package, async_module', [
+        ('src.clients.spotify', 'src.clients.spotify.async_client'),
+        ('src.clients.musixmatch', 'src.clients.musixmatch.async_client'),
+        ('src.clients.twitter', 'src.clients.twitter.async_client'),
+    ])
+    def test_async_clients_load_on_first_use(self, package, async_module):
+        assert async_module not in import_profile(package)
@@ -0,0 +1,54 @@
+from unittest.mock import MagicMock, patch
+
+from src.lifecycle import Lifecycle
+
+
+class TestLifecycle:
+    def test_resource_is_built_once(self):
+        lifecycle = Lifecycle('test')
+        factory = MagicMock()
+
+        first = lifecycle.resource('gorrion', factory)
+        second = lifecycle.resource('gorrion', factory)
+
+        assert first is second
+        factory.assert_called_once()
+
+    def test_clear(self):
+        lifecycle = Lifecycle('test')
+        factory = MagicMock(side_effect=[object(), object()])
+
+        first = lifecycle.resource('gorrion', factory)
+        lifecycle.clear()
+
+        assert lifecycle.resource('gorrion', factory) is not first
+
+    @patch('builtins.print')
+    def test_invocation_timings(self, print_mock):
+        lifecycle = Lifecycle('test')
+
+        with lifecycle.invocation() as cold:
+            lifecycle.resource('gorrion', object)
+        assert cold
+
+        with lifecycle.invocation() as cold:
+            lifecycle.resource('gorrion', object)
+        assert not cold
+
+        assert lifecycle.invocations == 2
+        assert [timing[0] for timing in lifecycle.timings] == [True, False]
+        assert lifecycle.timings[1][1] == 0
+        assert print_mock.call_args_list[0].args[0].startswith('test cold invocation #1: init=')
+        assert print_mock.call_args_list[1].args[0].startswith('test warm invocation #2: init=0.0ms')
+
+    @patch('builtins.print')
+    def test_invocation_when_error(self, print_mock):
+        lifecycle = Lifecycle('test')
+
+        try:
+            with lifecycle.invocation():
+                raise ValueError('boom')
+        except ValueError:
+            pass
+
+        assert lifecycle.invocations == 1
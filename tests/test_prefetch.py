@@ -0,0 +1,199 @@
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.clients.spotify import Album, Track
+from src.prefetch import AsyncPrefetcher, Prefetcher, PrefetchConfig
+
+
+def new_album(track_id: str, album_id: str = '11') -> Album:
+    track = Track(track_id, f'song-{track_id}', '', '', 1, 1, 1000)
+    return Album(album_id, 'album', '', '', '2006-01-01', 1, [], [track])
+
+
+@pytest.fixture()
+def gorrion() -> MagicMock:
+    gorrion = MagicMock()
+    gorrion.upcoming.return_value = [new_album('1', '11'), new_album('2', '22'), new_album('3', '33')]
+    return gorrion
+
+
+class TestPrefetcher:
+    def test_prefetch(self, gorrion):
+        gorrion.upcoming.return_value = [new_album('1', '11'), new_album('2', '22')]
+        prefetcher = Prefetcher(gorrion, PrefetchConfig(depth=2))
+
+        futures = prefetcher.prefetch()
+
+        assert prefetcher.wait(1)
+        assert len(futures) == 4
+        gorrion.upcoming.assert_called_once_with(2)
+        assert sorted(call.args[0].tracks[0].id_ for call in gorrion.get_lyric.call_args_list) == ['1', '2']
+        assert sorted(call.args[0].id_ for call in gorrion.get_album.call_args_list) == ['11', '22']
+
+    def test_prefetch_without_lyrics(self, gorrion):
+        gorrion.upcoming.return_value = [new_album('1')]
+        prefetcher = Prefetcher(gorrion, PrefetchConfig(lyrics=False))
+
+        prefetcher.prefetch()
+        prefetcher.wait(1)
+
+        gorrion.get_lyric.assert_not_called()
+        gorrion.get_album.assert_called_once()
+
+    def test_prefetch_when_disabled(self, gorrion):
+        prefetcher = Prefetcher(gorrion, PrefetchConfig(depth=0))
+
+        assert prefetcher.prefetch() == []
+        gorrion.upcoming.assert_not_called()
+
+    def test_prefetch_fetches_each_item_once(self, gorrion):
+        gorrion.upcoming.return_value = [new_album('1')]
+        prefetcher = Prefetcher(gorrion)
+
+        prefetcher.prefetch()
+        assert prefetcher.prefetch() == []
+        prefetcher.wait(1)
+
+        gorrion.get_lyric.assert_called_once()
+        gorrion.get_album.assert_called_once()
+
+    @patch('builtins.print')
+    def test_prefetch_retries_failed_lookups(self, print_mock, gorrion):
+        gorrion.upcoming.return_value = [new_album('1')]
+        gorrion.get_lyric.side_effect = [Exception('musixmatch down'), None]
+        prefetcher = Prefetcher(gorrion)
+
+        prefetcher.prefetch()
+        prefetcher.wait(1)
+        prefetcher.prefetch()
+        prefetcher.wait(1)
+
+        assert gorrion.get_lyric.call_count == 2
+        gorrion.get_album.assert_called_once()
+
+    def test_prefetch_respects_lookup_quota(self, gorrion):
+        prefetcher = Prefetcher(gorrion, PrefetchConfig(depth=3, max_lookups=3))
+
+        futures = prefetcher.prefetch()
+        prefetcher.wait(1)
+
+        assert len(futures) == 3
+        assert prefetcher.skipped == 3
+
+    def test_prefetch_caps_concurrency(self, gorrion):
+        running = []
+        peak = []
+        lock = threading.Lock()
+        release = threading.Event()
+
+        def fetch(album):
+            with lock:
+                running.append(album)
+                peak.append(len(running))
+            release.wait(1)
+            with lock:
+                running.remove(album)
+
+        gorrion.get_lyric.side_effect = fetch
+        gorrion.get_album.side_effect = fetch
+        prefetcher = Prefetcher(gorrion, PrefetchConfig(depth=3, max_workers=2))
+
+        prefetcher.prefetch()
+        release.set()
+
+        assert prefetcher.wait(2)
+        assert max(peak) <= 2
+
+    @patch('builtins.print')
+    def test_prefetch_when_queue_fails(self, print_mock, gorrion):
+        gorrion.upcoming.side_effect = Exception('spotify down')
+        prefetcher = Prefetcher(gorrion)
+
+        assert prefetcher.prefetch() == []
+        print_mock.assert_called_once_with('Prefetch failed to read the queue: spotify down')
+
+
+@pytest.fixture()
+def async_gorrion() -> AsyncMock:
+    gorrion = AsyncMock()
+    gorrion.upcoming.return_value = [new_album('1', '11'), new_album('2', '22'), new_album('3', '33')]
+    return gorrion
+
+
+class TestAsyncPrefetcher:
+    def test_prefetch(self, async_gorrion):
+        prefetcher = AsyncPrefetcher(async_gorrion, PrefetchConfig(depth=2))
+
+        async def prefetch():
+            tasks = await prefetcher.prefetch()
+            return tasks, await prefetcher.wait(1)
+
+        tasks, done = asyncio.run(prefetch())
+
+        assert done
+        assert len(tasks) == 6
+        async_gorrion.upcoming.assert_awaited_once_with(2)
+        assert async_gorrion.get_lyric.await_count == 3
+        assert async_gorrion.get_album.await_count == 3
+
+    def test_prefetch_fetches_each_item_once(self, async_gorrion):
+        async_gorrion.upcoming.return_value = [new_album('1')]
+        prefetcher = AsyncPrefetcher(async_gorrion)
+
+        async def prefetch():
+            await prefetcher.prefetch()
+            assert await prefetcher.prefetch() == []
+            await prefetcher.wait(1)
+
+        asyncio.run(prefetch())
+
+        async_gorrion.get_lyric.assert_awaited_once()
+        async_gorrion.get_album.assert_awaited_once()
+
+    @patch('builtins.print')
+    def test_prefetch_retries_failed_lookups(self, print_mock, async_gorrion):
+        async_gorrion.upcoming.return_value = [new_album('1')]
+        async_gorrion.get_lyric.side_effect = [Exception('musixmatch down'), None]
+        prefetcher = AsyncPrefetcher(async_gorrion)
+
+        async def prefetch():
+            for _ in range(2):
+                await prefetcher.prefetch()
+                await prefetcher.wait(1)
+
+        asyncio.run(prefetch())
+
+        assert async_gorrion.get_lyric.await_count == 2
+        print_mock.assert_called_once_with('Prefetch of lyric:1 failed: musixmatch down')
+
+    def test_prefetch_caps_concurrency(self, async_gorrion):
+        running = []
+        peak = []
+
+        async def fetch(album):
+            running.append(album)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(album)
+
+        async_gorrion.get_lyric.side_effect = fetch
+        async_gorrion.get_album.side_effect = fetch
+        prefetcher = AsyncPrefetcher(async_gorrion, PrefetchConfig(depth=3, max_workers=2))
+
+        async def prefetch():
+            await prefetcher.prefetch()
+            return await prefetcher.wait(1)
+
+        assert asyncio.run(prefetch())
+        assert max(peak) <= 2
+
+    @patch('builtins.print')
+    def test_prefetch_when_queue_fails(self, print_mock, async_gorrion):
+        async_gorrion.upcoming.side_effect = Exception('spotify down')
+        prefetcher = AsyncPrefetcher(async_gorrion)
+
+        assert asyncio.run(prefetcher.prefetch()) == []
+        print_mock.assert_called_once_with('Prefetch failed to read the queue: spotify down')
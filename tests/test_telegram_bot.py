@@ -3,9 +3,10 @@ from unittest.mock import patch, MagicMock
 import pytest
 
 from src.clients.spotify import SpotifyApiError
-from src.clients.twitter import PublishedTweet
+from src.clients.twitter import PublishedTweet, RateLimitExceeded
 from src.config import Config
-from src.telegram_bot import TelegramBot
+from src.lifecycle import Lifecycle
+from src.telegram_bot import TelegramBot, do_work
 
 
 @pytest.fixture()
@@ -159,6 +160,26 @@ class TestTelegramBot:
             text='error'
         )
 
+    @patch('src.telegram_bot.Update')
+    @patch('src.telegram_bot.Bot')
+    @patch('src.telegram_bot.Gorrion')
+    def test_process_playing_with_lyrics_command_when_rate_limit_exceeded(self, gorrion_mock, bot_mock, update_mock,
+                                                                          event):
+        update = MagicMock()
+        update.message.text = '/lyric'
+        update.message.chat.id = '123'
+        update_mock.de_json.return_value = update
+        error = RateLimitExceeded(3600)
+        gorrion_mock.return_value.playing_with_lyrics.side_effect = error
+
+        telegram_bot = TelegramBot()
+        telegram_bot.process_event(event)
+
+        bot_mock.return_value.send_message.assert_any_call(
+            chat_id='123',
+            text=str(error)
+        )
+
     @patch('src.telegram_bot.Update')
     @patch('src.telegram_bot.Bot')
     @patch('src.telegram_bot.Gorrion')
@@ -296,3 +317,63 @@ class TestTelegramBot:
             chat_id='123',
             text='Made with ❤️ by @juanitodread'
         )
+
+
+class TestDoWork:
+    @patch('builtins.print')
+    @patch('src.telegram_bot.TelegramBot')
+    def test_do_work_reuses_bot_across_invocations(self, telegram_bot_mock, print_mock):
+        with patch('src.telegram_bot.lifecycle', Lifecycle('telegram_bot')) as lifecycle:
+            first = do_work({'message': {}}, None)
+            second = do_work({'message': {}}, None)
+
+        assert first == second == {'status_code': 200, 'body': {}}
+        telegram_bot_mock.assert_called_once()
+        telegram_bot_mock.return_value.warm_up.assert_called_once()
+        assert telegram_bot_mock.return_value.process_event.call_count == 2
+        assert [timing[0] for timing in lifecycle.timings] == [True, False]
+
+    @patch('src.telegram_bot.Update')
+    @patch('src.telegram_bot.Bot')
+    @patch('src.telegram_bot.Gorrion')
+    def test_process_event_reuses_gorrion(self, gorrion_mock, bot_mock, update_mock, event):
+        update_mock.de_json.return_value.message.chat.id = 'chat-id'
+        update_mock.de_json.return_value.message.text = '/playing'
+        gorrion_mock.return_value.playing.return_value = PublishedTweet('123', 'song', None)
+
+        telegram_bot = TelegramBot()
+        telegram_bot.process_event(event)
+        telegram_bot.process_event(event)
+
+        gorrion_mock.assert_called_once()
+        assert gorrion_mock.return_value.playing.call_count == 2
+
+    @patch('src.telegram_bot.Config.PREFETCH_DEPTH', 1)
+    @patch('src.telegram_bot.Update')
+    @patch('src.telegram_bot.Bot')
+    @patch('src.telegram_bot.Gorrion')
+    def test_process_event_prefetches_queued_songs(self, gorrion_mock, bot_mock, update_mock, event):
+        update_mock.de_json.return_value.message.chat.id = 'chat-id'
+        update_mock.de_json.return_value.message.text = '/playing'
+        gorrion_mock.return_value.playing.return_value = PublishedTweet('123', 'song', None)
+        gorrion_mock.return_value.upcoming.return_value = []
+
+        telegram_bot = TelegramBot()
+        telegram_bot.process_event(event)
+
+        gorrion_mock.return_value.upcoming.assert_called_once_with(1)
+
+    @patch('src.telegram_bot.Config.PREFETCH_DEPTH', 1)
+    @patch('src.telegram_bot.Update')
+    @patch('src.telegram_bot.Bot')
+    @patch('src.telegram_bot.Gorrion')
+    def test_process_event_does_not_prefetch_after_failed_command(self, gorrion_mock, bot_mock, update_mock, event):
+        update_mock.de_json.return_value.message.chat.id = 'chat-id'
+        update_mock.de_json.return_value.message.text = '/playing'
+        gorrion_mock.return_value.playing.side_effect = SpotifyApiError('error')
+
+        telegram_bot = TelegramBot()
+        telegram_bot.process_event(event)
+
+        gorrion_mock.return_value.upcoming.assert_not_called()
+        gorrion_mock.return_value.wait_replies.assert_called_once()
@@ -0,0 +1,255 @@
+import asyncio
+import json
+import socket
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src import tracing
+from src.tracing import (
+    Tracer,
+    LogExporter,
+    MemoryRecorder,
+    PrometheusExporter,
+    annotate,
+    annotate_response,
+    current_span,
+    propagate,
+)
+
+
+@pytest.fixture()
+def recorder() -> MemoryRecorder:
+    return MemoryRecorder()
+
+
+@pytest.fixture()
+def tracer(recorder) -> Tracer:
+    tracer = Tracer()
+    tracer.add_exporter(recorder)
+
+    return tracer
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, content: bytes) -> None:
+        self.status_code = status_code
+        self.content = content
+
+
+class TestTracer:
+    def test_span_records_duration_and_attributes(self, tracer, recorder):
+        with tracer.span('gorrion.playing', command='playing') as span:
+            assert current_span() is span
+            annotate(retries=2)
+
+        assert current_span() is None
+        assert recorder.names() == ['gorrion.playing']
+        assert span.status == 'ok'
+        assert span.duration_secs >= 0
+        assert span.attributes == {'command': 'playing', 'retries': 2}
+
+    def test_nested_spans_share_the_trace(self, tracer, recorder):
+        with tracer.span('gorrion.playing') as root:
+            with tracer.span('spotify.currently_playing') as child:
+                pass
+
+        assert recorder.names() == ['spotify.currently_playing', 'gorrion.playing']
+        assert root.parent_id is None
+        assert child.parent_id == root.span_id
+        assert child.trace_id == root.trace_id == root.span_id
+
+    def test_span_records_errors(self, tracer, recorder):
+        with pytest.raises(ValueError):
+            with tracer.span('gorrion.playing'):
+                raise ValueError('boom')
+
+        span, = recorder.spans
+        assert span.status == 'error'
+        assert span.error == 'ValueError: boom'
+
+    def test_annotate_without_span(self):
+        annotate(retries=1)
+        annotate_response(FakeResponse(200, b'{}'))
+
+        assert current_span() is None
+
+    def test_annotate_response(self, tracer):
+        with tracer.span('spotify.album') as span:
+            annotate_response(FakeResponse(200, b'{"id": "1"}'))
+
+        assert span.attributes == {'status_code': 200, 'bytes': 11}
+
+    def test_traced_function(self, tracer, recorder):
+        @tracer.traced('gorrion.render')
+        def render(name: str) -> str:
+            return f'Now playing {name}'
+
+        assert render('Peligro') == 'Now playing Peligro'
+        assert render.__name__ == 'render'
+        assert recorder.names() == ['gorrion.render']
+
+    def test_traced_coroutine(self, tracer, recorder):
+        @tracer.traced('gorrion.playing')
+        async def playing() -> str:
+            with tracer.span('spotify.currently_playing'):
+                await asyncio.sleep(0)
+            return 'Peligro'
+
+        assert asyncio.run(playing()) == 'Peligro'
+        child, root = recorder.spans
+        assert root.name == 'gorrion.playing'
+        assert child.parent_id == root.span_id
+
+    def test_propagate_keeps_the_trace_in_worker_threads(self, tracer, recorder):
+        def get_lyric() -> None:
+            with tracer.span('gorrion.get_lyric'):
+                pass
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with tracer.span('gorrion.playing_with_lyrics') as root:
+                executor.submit(propagate(get_lyric)).result()
+            executor.submit(get_lyric).result()
+
+        propagated, _, detached = recorder.spans
+        assert propagated.parent_id == root.span_id
+        assert detached.parent_id is None
+
+    def test_remove_exporter(self, tracer, recorder):
+        tracer.remove_exporter(recorder)
+
+        with tracer.span('gorrion.playing'):
+            pass
+
+        assert not recorder.spans
+
+
+class TestMemoryRecorder:
+    def test_keeps_the_last_spans(self):
+        recorder = MemoryRecorder(max_spans=2)
+        tracer = Tracer()
+        tracer.add_exporter(recorder)
+
+        for name in ('a', 'b', 'c'):
+            with tracer.span(name):
+                pass
+
+        assert recorder.names() == ['b', 'c']
+        assert [span.name for span in recorder.find('c')] == ['c']
+
+        recorder.clear()
+        assert not recorder.spans
+
+
+class TestLogExporter:
+    def test_prints_json_lines(self, capsys):
+        tracer = Tracer()
+        tracer.add_exporter(LogExporter())
+
+        with tracer.span('musixmatch.lyric', bytes=120):
+            pass
+
+        line = json.loads(capsys.readouterr().out)
+        assert line['span'] == 'musixmatch.lyric'
+        assert line['status'] == 'ok'
+        assert line['bytes'] == 120
+        assert line['parent_id'] is None
+
+
+class TestPrometheusExporter:
+    def test_render(self):
+        exporter = PrometheusExporter()
+        tracer = Tracer()
+        tracer.add_exporter(exporter)
+
+        with tracer.span('spotify.album', retries=1, bytes=100):
+            pass
+        with tracer.span('spotify.album', bytes=50):
+            pass
+        with pytest.raises(ValueError):
+            with tracer.span('spotify.album'):
+                raise ValueError('boom')
+
+        metrics = exporter.render()
+
+        assert 'gorrion_span_duration_seconds_bucket{span="spotify.album",status="ok",le="0.01"} 2' in metrics
+        assert 'gorrion_span_duration_seconds_count{span="spotify.album",status="ok"} 2' in metrics
+        assert 'gorrion_span_duration_seconds_count{span="spotify.album",status="error"} 1' in metrics
+        assert 'gorrion_span_retries_total{span="spotify.album"} 1' in metrics
+        assert 'gorrion_span_payload_bytes_total{span="spotify.album"} 150' in metrics
+
+    def test_serve(self):
+        exporter = PrometheusExporter(prefix='test')
+        tracer = Tracer()
+        tracer.add_exporter(exporter)
+        with tracer.span('twitter.create_tweet'):
+            pass
+
+        server = exporter.serve(0, host='127.0.0.1')
+        try:
+            url = f'http://127.0.0.1:{server.server_address[1]}'
+            with urllib.request.urlopen(f'{url}/metrics') as response:
+                body = response.read().decode('utf-8')
+            with pytest.raises(urllib.error.HTTPError):
+                urllib.request.urlopen(f'{url}/other')
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'test_span_duration_seconds_count{span="twitter.create_tweet",status="ok"} 1' in body
+
+
+class TestConfigure:
+    def test_replaces_the_configured_exporters(self):
+        try:
+            tracing.configure(log=True)
+            tracing.configure(log=True)
+
+            assert len([exporter for exporter in tracing.tracer._exporters if isinstance(exporter, LogExporter)]) == 1
+        finally:
+            tracing.configure()
+
+        assert not [exporter for exporter in tracing.tracer._exporters if isinstance(exporter, LogExporter)]
+
+    def test_reuses_the_metrics_server(self):
+        first_port, second_port = free_port(), free_port()
+        try:
+            metrics = tracing.configure(metrics_port=first_port)
+            assert tracing.configure(metrics_port=first_port) is metrics
+
+            other = tracing.configure(metrics_port=second_port)
+            with urllib.request.urlopen(f'http://127.0.0.1:{second_port}/metrics') as response:
+                assert response.status == 200
+        finally:
+            tracing.configure()
+
+        assert other is not metrics
+        with pytest.raises(urllib.error.URLError):
+            urllib.request.urlopen(f'http://127.0.0.1:{first_port}/metrics')
+        with pytest.raises(urllib.error.URLError):
+            urllib.request.urlopen(f'http://127.0.0.1:{second_port}/metrics')
+        assert not tracing._metrics
+
+    def test_exporters_added_while_exporting_wait_for_the_next_span(self, tracer):
+        late = MemoryRecorder()
+
+        class AddingExporter:
+            def export(self, span) -> None:
+                tracer.add_exporter(late)
+                tracer.remove_exporter(self)
+
+        tracer.add_exporter(AddingExporter())
+        with tracer.span('gorrion.playing'):
+            pass
+        with tracer.span('gorrion.lyric'):
+            pass
+
+        assert late.names() == ['gorrion.lyric']
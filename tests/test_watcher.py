@@ -0,0 +1,142 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.clients.spotify import Album, Track, Playback, ServiceUnavailable
+from src.clients.twitter import PublishedTweet
+from src.watcher import Watcher, WatcherConfig
+
+
+def new_playback(track_id: str, progress: int = 0, duration: int = 200000, is_playing: bool = True) -> Playback:
+    track = Track(track_id, f'song-{track_id}', '', '', 1, 1, duration)
+    album = Album('11', 'album', '', '', '2006-01-01', 1, [], [track])
+
+    return Playback(album, is_playing, progress, duration)
+
+
+@pytest.fixture()
+def gorrion() -> MagicMock:
+    gorrion = MagicMock()
+    gorrion.publish_track.side_effect = lambda album: PublishedTweet('1', album.tracks[0].name, album)
+    return gorrion
+
+
+@pytest.fixture()
+def watcher(gorrion) -> Watcher:
+    return Watcher(gorrion, WatcherConfig(min_interval_secs=2, max_interval_secs=30))
+
+
+class TestWatcher:
+    @patch('builtins.print')
+    def test_poll_publishes_on_track_change(self, print_mock, gorrion, watcher):
+        gorrion.playback.side_effect = [new_playback('1'), new_playback('1'), new_playback('2')]
+
+        watcher.poll()
+        watcher.poll()
+        watcher.poll()
+
+        assert [call.args[0].tracks[0].id_ for call in gorrion.publish_track.call_args_list] == ['1', '2']
+        assert watcher.posts == 2
+
+    @patch('builtins.print')
+    def test_poll_with_lyrics(self, print_mock, gorrion):
+        gorrion.playback.return_value = new_playback('1')
+        watcher = Watcher(gorrion, WatcherConfig(lyrics=True))
+
+        watcher.poll()
+
+        gorrion.publish_track_with_lyrics.assert_called_once()
+        gorrion.publish_track.assert_not_called()
+
+    @patch('builtins.print')
+    def test_poll_when_publish_fails(self, print_mock, gorrion, watcher):
+        gorrion.playback.return_value = new_playback('1')
+        gorrion.publish_track.side_effect = Exception('twitter down')
+
+        watcher.poll()
+
+        assert watcher.posts == 0
+        print_mock.assert_called_once_with('Watcher failed to publish song-1: twitter down')
+
+    @patch('builtins.print')
+    def test_poll_when_spotify_fails(self, print_mock, gorrion, watcher):
+        gorrion.playback.side_effect = ServiceUnavailable('circuit open')
+
+        assert watcher.poll() == 60
+        gorrion.publish_track.assert_not_called()
+
+    @patch('builtins.print')
+    def test_poll_when_connection_fails(self, print_mock, gorrion, watcher):
+        gorrion.playback.side_effect = requests.ConnectionError('connection reset')
+
+        assert watcher.poll() == 60
+        gorrion.publish_track.assert_not_called()
+
+    @patch('builtins.print')
+    def test_run_keeps_polling_after_errors(self, print_mock, gorrion, watcher):
+        gorrion.playback.side_effect = [new_playback('1'), requests.Timeout('timeout'), ValueError('invalid body'),
+                                        new_playback('2')]
+        watcher._stopped = MagicMock()
+        watcher._stopped.is_set.return_value = False
+
+        watcher.run(max_polls=4)
+
+        assert watcher.polls == 4
+        assert [call.args[0].tracks[0].id_ for call in gorrion.publish_track.call_args_list] == ['2']
+
+    @patch('builtins.print')
+    def test_poll_prefetches_on_track_change(self, print_mock, gorrion):
+        gorrion.playback.side_effect = [new_playback('1'), new_playback('1'), new_playback('2')]
+        prefetcher = MagicMock()
+        watcher = Watcher(gorrion, WatcherConfig(), prefetcher)
+
+        watcher.poll(publish=False)
+        watcher.poll()
+        watcher.poll()
+
+        assert prefetcher.prefetch.call_count == 2
+
+    def test_next_interval_near_the_end_of_the_track(self, watcher):
+        assert watcher.next_interval(new_playback('1', progress=195000)) == 6
+
+    def test_next_interval_at_the_start_of_the_track(self, watcher):
+        assert watcher.next_interval(new_playback('1', progress=0)) == 30
+
+    def test_next_interval_when_track_ended(self, watcher):
+        assert watcher.next_interval(new_playback('1', progress=200000)) == 2
+
+    def test_next_interval_when_paused(self, watcher):
+        assert watcher.next_interval(new_playback('1', is_playing=False)) == 60
+
+    def test_next_interval_when_not_playing(self, watcher):
+        assert watcher.next_interval(None) == 120
+
+    @patch('builtins.print')
+    def test_run_does_not_post_current_track(self, print_mock, gorrion, watcher):
+        gorrion.playback.side_effect = [new_playback('1', progress=199000), new_playback('1'), new_playback('2')]
+        watcher._stopped = MagicMock()
+        watcher._stopped.is_set.return_value = False
+
+        watcher.run(max_polls=3)
+
+        assert [call.args[0].tracks[0].id_ for call in gorrion.publish_track.call_args_list] == ['2']
+        assert watcher._stopped.wait.call_args_list[0].args == (2,)
+
+    @patch('builtins.print')
+    def test_run_posts_current_track(self, print_mock, gorrion, watcher):
+        gorrion.playback.return_value = new_playback('1')
+        watcher._stopped = MagicMock()
+        watcher._stopped.is_set.return_value = False
+
+        watcher.run(post_current=True, max_polls=2)
+
+        assert gorrion.publish_track.call_count == 1
+        assert watcher.polls == 2
+
+    def test_stop(self, gorrion, watcher):
+        gorrion.playback.return_value = None
+        watcher.stop()
+        watcher.run()
+
+        assert watcher.polls == 1